@@ -0,0 +1,90 @@
+# source/api/fill_stream.py
+import asyncio
+import logging
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Deque, List, Set, Tuple
+
+from source.models.enums import OrderSide
+from source.models.order import Fill
+from source.api.grpc.order_exchange_interface_pb2 import FillEvent, OrderRequest
+
+logger = logging.getLogger('fill_stream')
+
+
+class FillStream:
+    """
+    Broadcasts individual executions to StreamFills subscribers.
+
+    Every fill is encoded once into a FillEvent and kept, with its sequence
+    number, in a bounded history shared by all subscribers. A subscriber is
+    just a cursor into that history, so there are no per-subscriber queues
+    and a reconnecting client can resume from the last sequence it saw. A
+    subscriber that falls further behind than the history skips ahead; the
+    jump in sequence numbers tells it fills were missed.
+
+    Sequence numbers restart with the exchange, so every event carries the
+    exchange's stream id. A client resuming with another stream id's
+    sequence is replayed every fill still retained instead.
+    """
+
+    def __init__(self, exchange_manager, history: int = 4096):
+        self.exchange_manager = exchange_manager
+        self.events: Deque[Tuple[int, bytes]] = deque(maxlen=history)
+        self._wakeups: Set[asyncio.Event] = set()
+        exchange_manager.fill_listeners.append(self.publish)
+
+    def publish(self, fills: List[Fill]):
+        order_ids = self.exchange_manager.order_ids
+        for fill in fills:
+            event = FillEvent(
+                sequence=fill.sequence,
+                order_id=order_ids.external(fill.order_id),
+                symbol=fill.symbol,
+                side=OrderRequest.BUY if fill.side == OrderSide.BUY else OrderRequest.SELL,
+                quantity=fill.quantity,
+                price=fill.price,
+                remaining_quantity=fill.remaining_quantity,
+                timestamp=int(fill.timestamp * 1000),
+                stream_id=self.exchange_manager.fill_stream_id
+            )
+            self.events.append((fill.sequence, event.SerializeToString()))
+
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    async def subscribe(self, from_sequence: int = 0, stream_id: str = '') -> AsyncIterator[bytes]:
+        """Yield encoded FillEvents after from_sequence of stream_id, or only new ones if it is 0"""
+        if from_sequence <= 0:
+            cursor = self.exchange_manager.fill_sequence
+        elif stream_id != self.exchange_manager.fill_stream_id:
+            logger.info(f"Fill subscriber resuming stream {stream_id!r}, now "
+                        f"{self.exchange_manager.fill_stream_id}; replaying retained fills")
+            cursor = 0
+        else:
+            cursor = from_sequence
+        wakeup = asyncio.Event()
+        self._wakeups.add(wakeup)
+        try:
+            while True:
+                wakeup.clear()
+                events = self._since(cursor)
+                if not events:
+                    await wakeup.wait()
+                    continue
+                for sequence, payload in events:
+                    cursor = sequence
+                    yield payload
+        finally:
+            self._wakeups.discard(wakeup)
+
+    def _since(self, cursor: int) -> List[Tuple[int, bytes]]:
+        # Copied out so fills published while a subscriber is sending are not mutating what it iterates
+        events = self.events
+        if not events or cursor >= events[-1][0]:
+            return []
+        first = events[0][0]
+        if cursor < first - 1:
+            logger.warning(f"Fill subscriber at sequence {cursor} is behind the retained history "
+                           f"(oldest {first}); skipping ahead")
+        return list(islice(events, max(cursor - first + 1, 0), None))
@@ -20,6 +20,16 @@ class MarketDataServiceStub(object):
                 request_serializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionRequest.SerializeToString,
                 response_deserializer=main_dot_services_dot_market__exchange__interface__pb2.MarketDataUpdate.FromString,
                 )
+        self.BackfillMarketData = channel.unary_unary(
+                '/market_data.MarketDataService/BackfillMarketData',
+                request_serializer=main_dot_services_dot_market__exchange__interface__pb2.BackfillRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_market__exchange__interface__pb2.BackfillResponse.FromString,
+                )
+        self.UpdateSubscription = channel.unary_unary(
+                '/market_data.MarketDataService/UpdateSubscription',
+                request_serializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdate.SerializeToString,
+                response_deserializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdateResponse.FromString,
+                )
 
 
 class MarketDataServiceServicer(object):
@@ -33,6 +43,20 @@ class MarketDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BackfillMarketData(self, request, context):
+        """Re-send retained updates a subscriber missed
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateSubscription(self, request, context):
+        """Add or remove symbols on a subscriber's open stream
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MarketDataServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -41,6 +65,16 @@ def add_MarketDataServiceServicer_to_server(servicer, server):
                     request_deserializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionRequest.FromString,
                     response_serializer=main_dot_services_dot_market__exchange__interface__pb2.MarketDataUpdate.SerializeToString,
             ),
+            'BackfillMarketData': grpc.unary_unary_rpc_method_handler(
+                    servicer.BackfillMarketData,
+                    request_deserializer=main_dot_services_dot_market__exchange__interface__pb2.BackfillRequest.FromString,
+                    response_serializer=main_dot_services_dot_market__exchange__interface__pb2.BackfillResponse.SerializeToString,
+            ),
+            'UpdateSubscription': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateSubscription,
+                    request_deserializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdate.FromString,
+                    response_serializer=main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdateResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'market_data.MarketDataService', rpc_method_handlers)
@@ -68,3 +102,37 @@ class MarketDataService(object):
             main_dot_services_dot_market__exchange__interface__pb2.MarketDataUpdate.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BackfillMarketData(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/market_data.MarketDataService/BackfillMarketData',
+            main_dot_services_dot_market__exchange__interface__pb2.BackfillRequest.SerializeToString,
+            main_dot_services_dot_market__exchange__interface__pb2.BackfillResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UpdateSubscription(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/market_data.MarketDataService/UpdateSubscription',
+            main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdate.SerializeToString,
+            main_dot_services_dot_market__exchange__interface__pb2.SubscriptionUpdateResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -10,16 +10,23 @@ from aiohttp import web
 logger = logging.getLogger('health_service')
 
 class HealthService:
-    def __init__(self, exchange_manager=None, http_port=50056):
+    def __init__(self, exchange_manager=None, http_port=50056, tenant_registry=None, startup=None):
         """
         Initialize health check service
         
         Args:
             exchange_manager: Reference to exchange manager for status checks
             http_port: HTTP port for health server (separate from gRPC port)
+            tenant_registry: Other hosted exchanges, in multi-tenant mode
+            startup: StartupProfile of this process, reported by the readiness probe
         """
         self.exchange_manager = exchange_manager
+        self.tenant_registry = tenant_registry
+        self.startup = startup
         self.http_port = http_port
+        # Set once the gRPC server is up with the exchange state restored,
+        # i.e. once a stream subscriber would get a real snapshot
+        self.ready = False
         self.app = None
         self.runner = None
         self.site = None
@@ -32,6 +39,8 @@ class HealthService:
         self.app.router.add_get('/health', self.health_check)
         self.app.router.add_get('/readiness', self.readiness_check)
         self.app.router.add_get('/metrics', self.metrics_endpoint)
+        self.app.router.add_get('/portfolio', self.portfolio_endpoint)
+        self.app.router.add_get('/backtest', self.backtest_endpoint)
         
         # Create and start the app
         self.runner = web.AppRunner(self.app)
@@ -69,15 +78,19 @@ class HealthService:
         Checks if the exchange simulator is fully initialized and ready
         """
         # This is a more comprehensive check than the liveness probe
-        is_ready = True
-        status_code = 200
+        is_ready = self.ready
+        status_code = 200 if is_ready else 503
         status_details = {}
+        if self.startup:
+            status_details['startup'] = self.startup.to_dict()
         
         # Check exchange manager status if available
-        if self.exchange_manager:
+        if is_ready and self.exchange_manager:
             try:
                 # You could add more detailed checks here
                 status_details['exchange_manager'] = 'READY'
+                if self.tenant_registry:
+                    status_details['tenants'] = len(self.tenant_registry.managers)
             except Exception as e:
                 is_ready = False
                 status_code = 503  # Service Unavailable
@@ -108,4 +121,37 @@ class HealthService:
             return web.Response(
                 status=500,
                 text=f"Error generating metrics: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    async def portfolio_endpoint(self, request):
+        """
+        Portfolio risk summary
+        Computed from the columnar position store; user_id and desk_id
+        query parameters select a tenant in multi-tenant mode
+        """
+        if not self.exchange_manager:
+            return web.json_response({'error': 'Exchange not initialized'}, status=503)
+
+        exchange_manager = self.exchange_manager
+        user_id = request.query.get('user_id')
+        if user_id and self.tenant_registry:
+            exchange_manager = self.tenant_registry.get(
+                user_id, request.query.get('desk_id', exchange_manager.desk_id))
+            if exchange_manager is None:
+                return web.json_response({'error': f'No exchange for user {user_id}'}, status=404)
+
+        positions = exchange_manager.positions
+        summary = positions.summary(exchange_manager.cash_balance)
+        summary['weights'] = positions.weights()
+        summary['timestamp'] = asyncio.get_event_loop().time()
+        return web.json_response(summary)
+
+    async def backtest_endpoint(self, request):
+        """
+        Backtest report
+        Returns 404 until a backtest has finished
+        """
+        report = self.exchange_manager.backtest_report if self.exchange_manager else None
+        if report is None:
+            return web.json_response({'status': 'NO REPORT'}, status=404)
+        return web.json_response(report)
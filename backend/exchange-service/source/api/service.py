@@ -4,46 +4,122 @@ import time
 import grpc
 import uuid
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Optional, Tuple
 
 from source.config import config
+from source.models.enums import OrderStatus
 from source.core.exchange_manager import ExchangeManager
+from source.core.order_batch import OrderBatch
+from source.core.tenant_registry import TenantRegistry
 
 # Import generated protobuf classes
 from source.api.grpc.session_exchange_interface_pb2 import (
     StreamRequest,
     HeartbeatRequest,
     HeartbeatResponse,
-    ExchangeDataUpdate,
-    MarketData,
-    OrderData,
-    Position,
-    PortfolioStatus
+    UpdateSymbolsRequest,
+    UpdateSymbolsResponse,
+    GetPortfolioRequest,
+    GetPortfolioResponse,
+    GetOrdersRequest,
+    GetOrdersResponse,
+    GetQuotesRequest,
+    GetQuotesResponse,
+    ExchangeDataUpdate
 )
 from source.api.grpc.session_exchange_interface_pb2_grpc import SessionExchangeSimulatorServicer
 from source.api.grpc.order_exchange_interface_pb2 import (
     OrderResponse,
+    BatchOrderRequest,
     BatchOrderResponse,
     CancelResult,
-    BatchCancelResponse
+    BatchCancelRequest,
+    BatchCancelResponse,
+    AmendResult,
+    BatchAmendRequest,
+    BatchAmendResponse,
+    FillStreamRequest
 )
 from source.api.grpc.order_exchange_interface_pb2_grpc import OrderExchangeSimulatorServicer
 from source.api.rest.health import HealthService
+from source.api.fill_stream import FillStream
+from source.api.snapshot_cache import serialize_update
+from source.api.stream_builder import add_orders_page, add_portfolio, add_quotes
+from source.api.stream_hub import ExchangeDataHub
+from source.utils.metrics import track_stage_latency, track_tick_to_stream
 
 logger = logging.getLogger('exchange_simulator')
 
+# gRPC metadata keys that pick the tenant in multi-tenant mode
+USER_ID_METADATA = 'x-user-id'
+DESK_ID_METADATA = 'x-desk-id'
+
+# GetOrders page size when the request does not set one, and the most it may ask for
+DEFAULT_ORDERS_PAGE_SIZE = 100
+MAX_ORDERS_PAGE_SIZE = 1000
+
 
 class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSimulatorServicer):
-    def __init__(self, exchange_manager: ExchangeManager):
+    def __init__(
+            self,
+            exchange_manager: ExchangeManager,
+            tenant_registry: Optional[TenantRegistry] = None,
+            health_service: Optional[HealthService] = None
+    ):
+        # Default tenant; serves every call that does not name a user
         self.exchange_manager = exchange_manager
+        self.tenant_registry = tenant_registry
         self.last_heartbeat = time.time()
         self.heartbeat_counter = 0
-        self.health_service = HealthService(exchange_manager, http_port=50056)
+        # The health server may already be up, started before the exchange to answer probes during startup
+        self.health_service = health_service or HealthService(http_port=config.server.http_port)
+        self.health_service.exchange_manager = exchange_manager
+        self.health_service.tenant_registry = tenant_registry
+        self.stream_hubs: Dict[Tuple[str, str], ExchangeDataHub] = {}
+        self.stream_hub = self._get_stream_hub(exchange_manager)
+        self.fill_streams: Dict[Tuple[str, str], FillStream] = {}
+        self.fill_stream = self._get_fill_stream(exchange_manager)
+        if tenant_registry is not None:
+            tenant_registry.removal_listeners.append(self._forget_tenant)
+
+    async def _resolve_exchange(self, context) -> ExchangeManager:
+        """Pick the caller's exchange from the x-user-id / x-desk-id call metadata"""
+        if self.tenant_registry is None or context is None:
+            return self.exchange_manager
+
+        metadata = dict(context.invocation_metadata() or ())
+        user_id = metadata.get(USER_ID_METADATA)
+        if not user_id:
+            return self.exchange_manager
+        desk_id = metadata.get(DESK_ID_METADATA) or config.simulator.desk_id
+        return await self.tenant_registry.get_or_create(user_id, desk_id)
+
+    def _get_stream_hub(self, exchange_manager: ExchangeManager) -> ExchangeDataHub:
+        """Each tenant streams from its own hub, created on first subscriber"""
+        key = (exchange_manager.user_id, exchange_manager.desk_id)
+        hub = self.stream_hubs.get(key)
+        if hub is None or hub.exchange_manager is not exchange_manager:
+            hub = self.stream_hubs[key] = ExchangeDataHub(exchange_manager)
+        return hub
+
+    def _get_fill_stream(self, exchange_manager: ExchangeManager) -> FillStream:
+        """Each tenant's fills are retained from its first fill subscriber on"""
+        key = (exchange_manager.user_id, exchange_manager.desk_id)
+        fill_stream = self.fill_streams.get(key)
+        if fill_stream is None or fill_stream.exchange_manager is not exchange_manager:
+            fill_stream = self.fill_streams[key] = FillStream(exchange_manager)
+        return fill_stream
+
+    def _forget_tenant(self, key: Tuple[str, str]):
+        """Drop a removed tenant's hub and fill history"""
+        self.stream_hubs.pop(key, None)
+        self.fill_streams.pop(key, None)
 
     # Add this method to the class
     async def start_health_service(self):
         """Start the health check HTTP server"""
-        await self.health_service.setup()
+        if self.health_service.runner is None:
+            await self.health_service.setup()
 
     # Add this method as well
     async def stop_health_service(self):
@@ -70,6 +146,97 @@ class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSi
             context.set_details(str(e))
             return HeartbeatResponse(success=False)
 
+    async def UpdateSymbols(self, request: UpdateSymbolsRequest, context) -> UpdateSymbolsResponse:
+        """Start or stop trading symbols without restarting the simulator"""
+        try:
+            exchange_manager = await self._resolve_exchange(context)
+            logger.info(f"Received symbol update +{list(request.add_symbols)} -{list(request.remove_symbols)} "
+                        f"for user {exchange_manager.user_id}")
+
+            recorder = exchange_manager.recorder
+            if recorder:
+                recorder.record_update_symbols(request)
+
+            result = await exchange_manager.update_symbols(
+                list(request.add_symbols), list(request.remove_symbols))
+
+            return UpdateSymbolsResponse(
+                success=result['success'],
+                error_message=result.get('error_message', ''),
+                symbols=result['symbols']
+            )
+        except Exception as e:
+            logger.error(f"Error updating symbols: {e}")
+            return UpdateSymbolsResponse(success=False, error_message=f"Server error: {str(e)}")
+
+    async def GetPortfolio(self, request: GetPortfolioRequest, context) -> GetPortfolioResponse:
+        """Cash, total value and positions, read from memory at the current version"""
+        try:
+            exchange_manager = await self._resolve_exchange(context)
+            response = GetPortfolioResponse(
+                success=True,
+                version=exchange_manager.changes.version,
+                timestamp=int(exchange_manager.clock.now() * 1000)
+            )
+            add_portfolio(response, exchange_manager)
+            return response
+        except Exception as e:
+            logger.error(f"Error reading portfolio: {e}")
+            return GetPortfolioResponse(success=False, error_message=f"Server error: {str(e)}")
+
+    async def GetOrders(self, request: GetOrdersRequest, context) -> GetOrdersResponse:
+        """
+        One page of orders, filtered by status and symbol
+
+        Pages run oldest order first over the open orders and the closed ones
+        still buffered. Each page is read at its own version; orders closed
+        and evicted between pages drop out, and later ones are never skipped.
+        """
+        try:
+            statuses = set(request.statuses)
+            unknown = statuses - {status.value for status in OrderStatus}
+            if unknown:
+                return GetOrdersResponse(success=False, error_message=f"Unknown order status: {', '.join(sorted(unknown))}")
+
+            try:
+                after = int(request.page_token) if request.page_token else 0
+            except ValueError:
+                return GetOrdersResponse(success=False, error_message="Invalid page token")
+
+            page_size = min(request.page_size or DEFAULT_ORDERS_PAGE_SIZE, MAX_ORDERS_PAGE_SIZE)
+            if page_size < 0:
+                return GetOrdersResponse(success=False, error_message="Page size must be positive")
+
+            exchange_manager = await self._resolve_exchange(context)
+            response = GetOrdersResponse(
+                success=True,
+                version=exchange_manager.changes.version,
+                timestamp=int(exchange_manager.clock.now() * 1000)
+            )
+            resume_after = add_orders_page(
+                response, exchange_manager, statuses, set(request.symbols), after, page_size)
+            if resume_after is not None:
+                response.next_page_token = str(resume_after)
+            return response
+        except Exception as e:
+            logger.error(f"Error reading orders: {e}")
+            return GetOrdersResponse(success=False, error_message=f"Server error: {str(e)}")
+
+    async def GetQuotes(self, request: GetQuotesRequest, context) -> GetQuotesResponse:
+        """Latest bar per symbol, read from memory at the current version"""
+        try:
+            exchange_manager = await self._resolve_exchange(context)
+            response = GetQuotesResponse(
+                success=True,
+                version=exchange_manager.changes.version,
+                timestamp=int(exchange_manager.clock.now() * 1000)
+            )
+            add_quotes(response, exchange_manager, request.symbols)
+            return response
+        except Exception as e:
+            logger.error(f"Error reading quotes: {e}")
+            return GetQuotesResponse(success=False, error_message=f"Server error: {str(e)}")
+
     async def receive_market_data(self, market_data_list):
         """
         Process received market data from distributor
@@ -91,277 +258,50 @@ class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSi
             request: StreamRequest,
             context
     ) -> AsyncGenerator[ExchangeDataUpdate, None]:
-        """Stream market data, orders, and portfolio updates"""
+        """
+        Stream market data, orders, and portfolio updates
+
+        The first update is always a full snapshot. Clients that set
+        request.delta then receive only the entities changed since the
+        version they were last sent; everyone else keeps getting snapshots.
+        """
+        client_id = request.client_id
+        exchange_manager = await self._resolve_exchange(context)
+        stream_hub = self._get_stream_hub(exchange_manager)
+        subscription = stream_hub.subscribe(client_id, delta=request.delta)
+        exchange_manager.open_streams += 1
         try:
-            client_id = request.client_id
-            logger.info(f"Client {client_id} subscribed to exchange data stream")
+            logger.info(f"Client {client_id} subscribed to exchange data stream (delta={request.delta})")
 
             update_count = 0
 
-            # Send initial update immediately if we have data
-            symbols = list(self.exchange_manager.current_market_data.keys())
-            if symbols:
-                # Get the market data
-                market_data = []
-                for symbol in symbols:
-                    market_data.append(self.exchange_manager.current_market_data[symbol])
-
-                # Generate portfolio and orders data
-                portfolio_data = {
-                    'cash_balance': self.exchange_manager.cash_balance,
-                    'total_value': self.exchange_manager._calculate_total_portfolio_value(market_data),
-                    'positions': [
-                        {
-                            'symbol': symbol,
-                            'quantity': position['quantity'],
-                            'average_cost': position['average_cost'],
-                            'market_value': position['quantity'] * self.exchange_manager._get_current_price(symbol,
-                                                                                                            market_data)
-                        }
-                        for symbol, position in self.exchange_manager.positions.items()
-                    ]
-                }
-
-                # Get order updates
-                orders_data = [
-                    {
-                        'order_id': order_id,
-                        'symbol': order['symbol'],
-                        'status': order['status'],
-                        'filled_quantity': order.get('filled_quantity', 0),
-                        'average_price': order.get('average_price', 0)
-                    }
-                    for order_id, order in self.exchange_manager.orders.items()
-                ]
-
-                # Create and send initial update
-                update = ExchangeDataUpdate(
-                    timestamp=int(time.time() * 1000)
-                )
-
-                # Add market data
-                for md in market_data:
-                    update.market_data.append(MarketData(
-                        symbol=md['symbol'],
-                        open=md['open'],
-                        high=md['high'],
-                        low=md['low'],
-                        close=md['close'],
-                        volume=md['volume'],
-                        trade_count=md.get('trade_count', 0),
-                        vwap=md.get('vwap', 0.0)
-                    ))
-
-                # Add order data
-                for order in orders_data:
-                    update.orders_data.append(OrderData(
-                        order_id=order['order_id'],
-                        symbol=order['symbol'],
-                        status=order['status'],
-                        filled_quantity=int(order['filled_quantity']),
-                        average_price=order['average_price']
-                    ))
-
-                # Add portfolio data
-                update.portfolio.CopyFrom(PortfolioStatus(
-                    cash_balance=portfolio_data['cash_balance'],
-                    total_value=portfolio_data['total_value'],
-                    positions=[
-                        Position(
-                            symbol=pos['symbol'],
-                            quantity=int(pos['quantity']),
-                            average_cost=pos['average_cost'],
-                            market_value=pos['market_value']
-                        ) for pos in portfolio_data['positions']
-                    ]
-                ))
-
-                update_count += 1
-                logger.info(f"Sending initial update #{update_count} to client {client_id} for {len(symbols)} symbols")
-                yield update
-
-            # Set up a task to listen for updates with a timeout
             while True:
-                try:
-                    # Wait for notification of new market data (with timeout)
-                    # The timeout ensures we still send periodic updates even if no market data arrives
-                    await asyncio.wait_for(
-                        self.exchange_manager.market_data_updates.get(),
-                        timeout=60  # Still maintain a 60-second maximum interval
-                    )
+                # The timeout ensures we still send periodic updates even if no market data arrives
+                update = await subscription.next_update(timeout=60)  # Still maintain a 60-second maximum interval
 
-                    # Get symbols from the current market data
-                    symbols = list(self.exchange_manager.current_market_data.keys())
-
-                    if not symbols:
-                        continue
-
-                    # Get the market data
-                    market_data = []
-                    for symbol in symbols:
-                        market_data.append(self.exchange_manager.current_market_data[symbol])
-
-                    # Generate portfolio and orders data
-                    portfolio_data = {
-                        'cash_balance': self.exchange_manager.cash_balance,
-                        'total_value': self.exchange_manager._calculate_total_portfolio_value(market_data),
-                        'positions': [
-                            {
-                                'symbol': symbol,
-                                'quantity': position['quantity'],
-                                'average_cost': position['average_cost'],
-                                'market_value': position['quantity'] * self.exchange_manager._get_current_price(symbol,
-                                                                                                                market_data)
-                            }
-                            for symbol, position in self.exchange_manager.positions.items()
-                        ]
-                    }
-
-                    # Get order updates
-                    orders_data = [
-                        {
-                            'order_id': order_id,
-                            'symbol': order['symbol'],
-                            'status': order['status'],
-                            'filled_quantity': order.get('filled_quantity', 0),
-                            'average_price': order.get('average_price', 0)
-                        }
-                        for order_id, order in self.exchange_manager.orders.items()
-                    ]
-
-                    # Create and send update
-                    update = ExchangeDataUpdate(
-                        timestamp=int(time.time() * 1000)
-                    )
+                if update is None:
+                    logger.debug("No market data updates received for 60 seconds, publishing periodic update")
+                    stream_hub.publish()
+                    continue
 
-                    # Add market data
-                    for md in market_data:
-                        update.market_data.append(MarketData(
-                            symbol=md['symbol'],
-                            open=md['open'],
-                            high=md['high'],
-                            low=md['low'],
-                            close=md['close'],
-                            volume=md['volume'],
-                            trade_count=md.get('trade_count', 0),
-                            vwap=md.get('vwap', 0.0)
-                        ))
-
-                    # Add order data
-                    for order in orders_data:
-                        update.orders_data.append(OrderData(
-                            order_id=order['order_id'],
-                            symbol=order['symbol'],
-                            status=order['status'],
-                            filled_quantity=int(order['filled_quantity']),
-                            average_price=order['average_price']
-                        ))
-
-                    # Add portfolio data
-                    update.portfolio.CopyFrom(PortfolioStatus(
-                        cash_balance=portfolio_data['cash_balance'],
-                        total_value=portfolio_data['total_value'],
-                        positions=[
-                            Position(
-                                symbol=pos['symbol'],
-                                quantity=int(pos['quantity']),
-                                average_cost=pos['average_cost'],
-                                market_value=pos['market_value']
-                            ) for pos in portfolio_data['positions']
-                        ]
-                    ))
-
-                    update_count += 1
-                    logger.info(f"Sending update #{update_count} to client {client_id} for {len(symbols)} symbols")
-                    yield update
-
-                except asyncio.TimeoutError:
-                    # Timeout occurred, send an update anyway
-                    logger.debug("No market data updates received for 60 seconds, sending periodic update")
-
-                    symbols = list(self.exchange_manager.current_market_data.keys())
-                    if not symbols:
-                        continue
-
-                    # Get the market data
-                    market_data = []
-                    for symbol in symbols:
-                        market_data.append(self.exchange_manager.current_market_data[symbol])
-
-                    # Generate portfolio and orders data (same as above)
-                    portfolio_data = {
-                        'cash_balance': self.exchange_manager.cash_balance,
-                        'total_value': self.exchange_manager._calculate_total_portfolio_value(market_data),
-                        'positions': [
-                            {
-                                'symbol': symbol,
-                                'quantity': position['quantity'],
-                                'average_cost': position['average_cost'],
-                                'market_value': position['quantity'] * self.exchange_manager._get_current_price(symbol,
-                                                                                                                market_data)
-                            }
-                            for symbol, position in self.exchange_manager.positions.items()
-                        ]
-                    }
-
-                    # Get order updates
-                    orders_data = [
-                        {
-                            'order_id': order_id,
-                            'symbol': order['symbol'],
-                            'status': order['status'],
-                            'filled_quantity': order.get('filled_quantity', 0),
-                            'average_price': order.get('average_price', 0)
-                        }
-                        for order_id, order in self.exchange_manager.orders.items()
-                    ]
-
-                    # Create and send update
-                    update = ExchangeDataUpdate(
-                        timestamp=int(time.time() * 1000)
-                    )
+                if not exchange_manager.current_market_data:
+                    # Nothing worth sending yet; start from a snapshot once data arrives
+                    subscription.defer_snapshot()
+                    continue
 
-                    # Add market data
-                    for md in market_data:
-                        update.market_data.append(MarketData(
-                            symbol=md['symbol'],
-                            open=md['open'],
-                            high=md['high'],
-                            low=md['low'],
-                            close=md['close'],
-                            volume=md['volume'],
-                            trade_count=md.get('trade_count', 0),
-                            vwap=md.get('vwap', 0.0)
-                        ))
-
-                    # Add order data
-                    for order in orders_data:
-                        update.orders_data.append(OrderData(
-                            order_id=order['order_id'],
-                            symbol=order['symbol'],
-                            status=order['status'],
-                            filled_quantity=int(order['filled_quantity']),
-                            average_price=order['average_price']
-                        ))
-
-                    # Add portfolio data
-                    update.portfolio.CopyFrom(PortfolioStatus(
-                        cash_balance=portfolio_data['cash_balance'],
-                        total_value=portfolio_data['total_value'],
-                        positions=[
-                            Position(
-                                symbol=pos['symbol'],
-                                quantity=int(pos['quantity']),
-                                average_cost=pos['average_cost'],
-                                market_value=pos['market_value']
-                            ) for pos in portfolio_data['positions']
-                        ]
-                    ))
-
-                    update_count += 1
-                    logger.info(
-                        f"Sending periodic update #{update_count} to client {client_id} for {len(symbols)} symbols")
-                    yield update
+                update_count += 1
+                message = update.message
+                logger.info(f"Sending update #{update_count} (v{message.version}, "
+                            f"{'snapshot' if message.is_snapshot else 'delta'}) to client {client_id} "
+                            f"for {len(message.market_data)} symbols")
+                # Pre-serialized bytes shared by every subscriber; see add_session_servicer_to_server
+                payload = update.payload
+                start = time.perf_counter()
+                yield payload
+                # Resumes once gRPC has taken the message, so this includes flow control waits
+                track_stage_latency('stream_write', time.perf_counter() - start)
+                if message.origin_timestamp:
+                    track_tick_to_stream(max(time.time() - message.origin_timestamp / 1000, 0.0))
 
         except asyncio.CancelledError:
             logger.info(f"Stream data generation cancelled for client {client_id}")
@@ -369,46 +309,49 @@ class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSi
             logger.error(f"Stream data error: {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
+        finally:
+            stream_hub.unsubscribe(subscription)
+            exchange_manager.open_streams -= 1
 
     async def SubmitOrders(self, request, context):
         """
         Handle batch order submissions
+
+        The batch is decoded into arrays and validated, risk-checked and
+        booked as a whole by the order manager.
         """
         try:
-            # Create response object
-            response = BatchOrderResponse(
-                success=True,
-                results=[]
-            )
+            exchange_manager = await self._resolve_exchange(context)
 
-            # Log the batch request
-            logger.info(f"Received batch order submission with {len(request.orders)} orders")
-
-            # Process each order in the batch
-            for order_request in request.orders:
-                # Extract order parameters
-                symbol = order_request.symbol
-                side = "BUY" if order_request.side == 0 else "SELL"
-                quantity = order_request.quantity
-                price = order_request.price if order_request.type == 1 else None  # Only for LIMIT
-                order_type = "MARKET" if order_request.type == 0 else "LIMIT"
-                request_id = order_request.request_id
-
-                # Generate a unique order ID
-                order_id = str(uuid.uuid4())
-
-                # Create a successful result for this order (just logging, not actually processing)
-                result = OrderResponse(
-                    success=True,
-                    order_id=order_id
-                )
+            # Assign ids up front so a recorded session replays with the same order ids.
+            # One random prefix per batch keeps this cheap for large baskets.
+            batch_prefix = None
+            for index, order_request in enumerate(request.orders):
+                if not order_request.request_id:
+                    batch_prefix = batch_prefix or uuid.uuid4().hex
+                    order_request.request_id = f"{batch_prefix}-{index}"
 
-                logger.info(f"Processed order: {symbol} {side} {quantity} {order_type} -> {order_id}")
+            recorder = exchange_manager.recorder
+            if recorder:
+                recorder.record_submit_orders(request)
 
-                # Add the result to our batch response
-                response.results.append(result)
+            order_ids = exchange_manager.order_ids
+            orders = await exchange_manager.submit_orders(OrderBatch.from_request(request, order_ids))
 
-            return response
+            logger.info(f"Processed batch of {len(orders)} orders for user {exchange_manager.user_id}")
+
+            return BatchOrderResponse(
+                success=True,
+                results=[
+                    OrderResponse(
+                        success=order.status != OrderStatus.REJECTED,
+                        # Orders closed on arrival may already be released from the id map
+                        order_id=order_request.request_id,
+                        error_message=order.error_message or ''
+                    )
+                    for order_request, order in zip(request.orders, orders)
+                ]
+            )
 
         except Exception as e:
             logger.error(f"Error processing batch order submission: {e}")
@@ -431,18 +374,31 @@ class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSi
                 results=[]
             )
 
+            exchange_manager = await self._resolve_exchange(context)
+
             # Log the batch cancellation request
-            logger.info(f"Received batch order cancellation for {len(request.order_ids)} orders")
+            logger.info(f"Received batch order cancellation for {len(request.order_ids)} orders "
+                        f"for user {exchange_manager.user_id}")
+
+            recorder = exchange_manager.recorder
+            if recorder:
+                recorder.record_cancel_orders(request)
 
             # Process each order ID in the batch
             for order_id in request.order_ids:
-                # Just log the cancellation, not actually processing
                 logger.info(f"Cancelling order: {order_id}")
 
+                internal_id = exchange_manager.order_ids.internal(order_id)
+                if internal_id is None:
+                    cancel_result = {'success': False, 'error_message': 'Order not found'}
+                else:
+                    cancel_result = await exchange_manager.cancel_order(internal_id)
+
                 # Create result for this cancellation
                 result = CancelResult(
                     order_id=order_id,
-                    success=True
+                    success=cancel_result['success'],
+                    error_message=cancel_result.get('error_message', '')
                 )
 
                 response.results.append(result)
@@ -458,3 +414,152 @@ class ExchangeSimulatorService(SessionExchangeSimulatorServicer, OrderExchangeSi
                 error_message=f"Server error: {str(e)}",
                 results=[]
             )
+
+    async def AmendOrders(self, request, context):
+        """
+        Handle batch order amendments
+
+        Each amend changes an open order in place, so a re-price is one call
+        and the order keeps its id; see OrderManager.amend_order.
+        """
+        try:
+            response = BatchAmendResponse(success=True)
+
+            exchange_manager = await self._resolve_exchange(context)
+            logger.info(f"Received batch order amendment for {len(request.amends)} orders "
+                        f"for user {exchange_manager.user_id}")
+
+            recorder = exchange_manager.recorder
+            if recorder:
+                recorder.record_amend_orders(request)
+
+            for amend in request.amends:
+                internal_id = exchange_manager.order_ids.internal(amend.order_id)
+                if internal_id is None:
+                    amend_result = {'success': False, 'error_message': 'Order not found'}
+                else:
+                    amend_result = await exchange_manager.amend_order(
+                        internal_id, amend.quantity, amend.price, amend.stop_price)
+
+                response.results.append(AmendResult(
+                    order_id=amend.order_id,
+                    success=amend_result['success'],
+                    error_message=amend_result.get('error_message', '')
+                ))
+
+            return response
+
+        except Exception as e:
+            logger.error(f"Error processing batch order amendment: {e}")
+            return BatchAmendResponse(
+                success=False,
+                error_message=f"Server error: {str(e)}",
+                results=[]
+            )
+
+    async def StreamFills(self, request: FillStreamRequest, context):
+        """
+        Stream individual executions
+
+        A small, high-frequency alternative to StreamExchangeData for
+        consumers that only care about fills. Each FillEvent carries a
+        sequence number and stream id; pass the last ones seen as
+        from_sequence and stream_id to resume after a reconnect.
+        """
+        client_id = request.client_id
+        exchange_manager = await self._resolve_exchange(context)
+        fill_stream = self._get_fill_stream(exchange_manager)
+        logger.info(f"Client {client_id} subscribed to fills for user {exchange_manager.user_id} "
+                    f"from sequence {request.from_sequence}")
+        exchange_manager.open_streams += 1
+        try:
+            async for payload in fill_stream.subscribe(request.from_sequence, request.stream_id):
+                yield payload
+        except asyncio.CancelledError:
+            logger.info(f"Fill stream cancelled for client {client_id}")
+        except Exception as e:
+            logger.error(f"Fill stream error: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+        finally:
+            exchange_manager.open_streams -= 1
+
+
+def add_order_servicer_to_server(servicer: OrderExchangeSimulatorServicer, server):
+    """
+    Register the order exchange service.
+
+    Same as the generated add_OrderExchangeSimulatorServicer_to_server,
+    except StreamFills responses are FillEvents encoded once by the fill
+    stream and passed through without re-encoding.
+    """
+    rpc_method_handlers = {
+        'SubmitOrders': grpc.unary_unary_rpc_method_handler(
+            servicer.SubmitOrders,
+            request_deserializer=BatchOrderRequest.FromString,
+            response_serializer=BatchOrderResponse.SerializeToString,
+        ),
+        'CancelOrders': grpc.unary_unary_rpc_method_handler(
+            servicer.CancelOrders,
+            request_deserializer=BatchCancelRequest.FromString,
+            response_serializer=BatchCancelResponse.SerializeToString,
+        ),
+        'AmendOrders': grpc.unary_unary_rpc_method_handler(
+            servicer.AmendOrders,
+            request_deserializer=BatchAmendRequest.FromString,
+            response_serializer=BatchAmendResponse.SerializeToString,
+        ),
+        'StreamFills': grpc.unary_stream_rpc_method_handler(
+            servicer.StreamFills,
+            request_deserializer=FillStreamRequest.FromString,
+            response_serializer=serialize_update,
+        ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+        'order_exchange.OrderExchangeSimulator', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+def add_session_servicer_to_server(servicer: SessionExchangeSimulatorServicer, server):
+    """
+    Register the session exchange service.
+
+    Same as the generated add_SessionExchangeSimulatorServicer_to_server,
+    except StreamExchangeData responses may be pre-serialized bytes from the
+    snapshot cache and are passed through without re-encoding.
+    """
+    rpc_method_handlers = {
+        'StreamExchangeData': grpc.unary_stream_rpc_method_handler(
+            servicer.StreamExchangeData,
+            request_deserializer=StreamRequest.FromString,
+            response_serializer=serialize_update,
+        ),
+        'Heartbeat': grpc.unary_unary_rpc_method_handler(
+            servicer.Heartbeat,
+            request_deserializer=HeartbeatRequest.FromString,
+            response_serializer=HeartbeatResponse.SerializeToString,
+        ),
+        'UpdateSymbols': grpc.unary_unary_rpc_method_handler(
+            servicer.UpdateSymbols,
+            request_deserializer=UpdateSymbolsRequest.FromString,
+            response_serializer=UpdateSymbolsResponse.SerializeToString,
+        ),
+        'GetPortfolio': grpc.unary_unary_rpc_method_handler(
+            servicer.GetPortfolio,
+            request_deserializer=GetPortfolioRequest.FromString,
+            response_serializer=GetPortfolioResponse.SerializeToString,
+        ),
+        'GetOrders': grpc.unary_unary_rpc_method_handler(
+            servicer.GetOrders,
+            request_deserializer=GetOrdersRequest.FromString,
+            response_serializer=GetOrdersResponse.SerializeToString,
+        ),
+        'GetQuotes': grpc.unary_unary_rpc_method_handler(
+            servicer.GetQuotes,
+            request_deserializer=GetQuotesRequest.FromString,
+            response_serializer=GetQuotesResponse.SerializeToString,
+        ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+        'session_exchange.SessionExchangeSimulator', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
@@ -0,0 +1,69 @@
+# source/api/snapshot_cache.py
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple, Union
+
+from source.api.grpc.session_exchange_interface_pb2 import ExchangeDataUpdate
+from source.utils.metrics import track_snapshot_cache, track_stage_latency
+
+logger = logging.getLogger('snapshot_cache')
+
+# ('snapshot', version) or ('delta', base_version, version)
+CacheKey = Tuple
+
+
+class CachedUpdate:
+    """A built update plus its wire encoding, serialized at most once"""
+    __slots__ = ('message', '_payload')
+
+    def __init__(self, message: ExchangeDataUpdate):
+        self.message = message
+        self._payload = None
+
+    @property
+    def payload(self) -> bytes:
+        if self._payload is None:
+            start = time.perf_counter()
+            self._payload = self.message.SerializeToString()
+            track_stage_latency('serialize', time.perf_counter() - start)
+        return self._payload
+
+
+class SnapshotCache:
+    """
+    Versioned cache of built ExchangeDataUpdate messages.
+
+    State versions are immutable once published, so an update built for a
+    version can be handed to every stream as-is. Only the most recent few
+    entries are kept since subscribers only ever ask for the latest ones.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.capacity = capacity
+        self.entries: 'OrderedDict[CacheKey, CachedUpdate]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: CacheKey, builder: Callable[[], ExchangeDataUpdate]) -> CachedUpdate:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            track_snapshot_cache(key[0], hit=True)
+            return entry
+
+        self.misses += 1
+        track_snapshot_cache(key[0], hit=False)
+        start = time.perf_counter()
+        entry = self.entries[key] = CachedUpdate(builder())
+        track_stage_latency(f'build_{key[0]}', time.perf_counter() - start)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return entry
+
+
+def serialize_update(update: Union[bytes, ExchangeDataUpdate]) -> bytes:
+    """Response serializer that passes pre-encoded updates straight through"""
+    if isinstance(update, bytes):
+        return update
+    return update.SerializeToString()
@@ -0,0 +1,146 @@
+# source/api/stream_builder.py
+import heapq
+from itertools import chain
+from operator import attrgetter
+from typing import Collection, Dict, Iterable, Optional
+
+from source.core.change_tracker import ChangeSet
+from source.core.order_ids import OrderIdMap
+from source.models.order import Order
+from source.api.grpc.session_exchange_interface_pb2 import (
+    ExchangeDataUpdate,
+    MarketData,
+    OrderData,
+    Position,
+)
+
+
+def build_snapshot(exchange_manager, version: int) -> ExchangeDataUpdate:
+    """Build an update carrying the full exchange state"""
+    update = ExchangeDataUpdate(
+        timestamp=int(exchange_manager.clock.now() * 1000),
+        version=version,
+        is_snapshot=True,
+        origin_timestamp=exchange_manager.market_data_origin
+    )
+
+    _add_market_data(update, exchange_manager.current_market_data.values())
+    # Open orders plus the recently closed ones still buffered; older closings are already out of the book
+    order_manager = exchange_manager.order_manager
+    _add_orders(update, chain(order_manager.orders.values(), order_manager.closed), exchange_manager.order_ids)
+    _add_portfolio(update, exchange_manager, exchange_manager.positions.held_symbols())
+
+    return update
+
+
+def build_delta(exchange_manager, changes: ChangeSet, base_version: int, version: int) -> ExchangeDataUpdate:
+    """Build an update carrying only the entities changed since base_version"""
+    update = ExchangeDataUpdate(
+        timestamp=int(exchange_manager.clock.now() * 1000),
+        version=version,
+        base_version=base_version,
+        origin_timestamp=exchange_manager.market_data_origin
+    )
+
+    current_market_data = exchange_manager.current_market_data
+    _add_market_data(update, (current_market_data[s] for s in changes.market_data if s in current_market_data))
+    update.removed_symbols.extend(s for s in changes.market_data if s not in current_market_data)
+    orders = (exchange_manager.order_manager.get_order(order_id) for order_id in changes.orders)
+    _add_orders(update, (order for order in orders if order is not None), exchange_manager.order_ids)
+
+    positions = exchange_manager.positions
+    _add_portfolio(update, exchange_manager, (s for s in changes.positions if s in positions))
+    update.removed_positions.extend(s for s in changes.positions if s not in positions)
+
+    return update
+
+
+# The query responses reuse the stream's field names (market_data, orders_data,
+# portfolio), so the helpers below fill them the same way they fill updates
+
+def add_quotes(response, exchange_manager, symbols: Collection[str] = ()):
+    """Add the latest bar of each symbol, or of every symbol when none are named"""
+    current_market_data = exchange_manager.current_market_data
+    _add_market_data(response, (current_market_data[s] for s in (symbols or current_market_data)
+                                if s in current_market_data))
+
+
+def add_portfolio(response, exchange_manager):
+    """Add cash, total value and every held position"""
+    _add_portfolio(response, exchange_manager, exchange_manager.positions.held_symbols())
+
+
+def add_orders_page(
+        response,
+        exchange_manager,
+        statuses: Collection[str],
+        symbols: Collection[str],
+        after: int,
+        page_size: int
+) -> Optional[int]:
+    """
+    Add up to page_size orders with internal ids above `after`, oldest first
+
+    Covers the open orders and the recently closed ones still buffered.
+    Returns the internal id to resume after, or None if this is the last page.
+    """
+    order_manager = exchange_manager.order_manager
+    # Open orders are indexed in id order (ids only grow and amends keep their
+    # slot); the closed buffer is in closing order, but small
+    closed = sorted(order_manager.closed, key=attrgetter('order_id'))
+    page = []
+    resume_after = None
+    for order in heapq.merge(order_manager.orders.values(), closed, key=attrgetter('order_id')):
+        if order.order_id <= after:
+            continue
+        if statuses and order.status.value not in statuses or symbols and order.symbol not in symbols:
+            continue
+        if len(page) == page_size:
+            resume_after = page[-1].order_id
+            break
+        page.append(order)
+
+    _add_orders(response, page, exchange_manager.order_ids)
+    return resume_after
+
+
+def _add_market_data(update: ExchangeDataUpdate, market_data: Iterable[Dict]):
+    for md in market_data:
+        update.market_data.append(MarketData(
+            symbol=md['symbol'],
+            open=md['open'],
+            high=md['high'],
+            low=md['low'],
+            close=md['close'],
+            volume=md['volume'],
+            trade_count=md.get('trade_count', 0),
+            vwap=md.get('vwap', 0.0)
+        ))
+
+
+def _add_orders(update: ExchangeDataUpdate, orders: Iterable[Order], id_map: OrderIdMap):
+    # Internal ids never leave the exchange; clients see their own order ids
+    for order in orders:
+        update.orders_data.append(OrderData(
+            order_id=id_map.external(order.order_id),
+            symbol=order.symbol,
+            status=order.status.value,
+            filled_quantity=int(order.filled_quantity),
+            average_price=order.average_price
+        ))
+
+
+def _add_portfolio(update: ExchangeDataUpdate, exchange_manager, symbols: Iterable[str]):
+    # Cash and total value are cheap scalars, so they ride along on every update
+    portfolio = update.portfolio
+    portfolio.cash_balance = exchange_manager.cash_balance
+    portfolio.total_value = exchange_manager._calculate_total_portfolio_value()
+
+    for symbol in symbols:
+        position = exchange_manager.positions.get(symbol)
+        portfolio.positions.append(Position(
+            symbol=symbol,
+            quantity=int(position['quantity']),
+            average_cost=position['average_cost'],
+            market_value=position['market_value']
+        ))
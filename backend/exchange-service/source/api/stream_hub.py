@@ -0,0 +1,149 @@
+# source/api/stream_hub.py
+import asyncio
+import logging
+import time
+from typing import Optional, Set
+
+from source.api.snapshot_cache import CachedUpdate, SnapshotCache
+from source.api.stream_builder import build_snapshot, build_delta
+from source.utils.metrics import (
+    track_stream_subscribers, track_stream_coalesced, track_stream_resync, track_stage_latency
+)
+
+logger = logging.getLogger('stream_hub')
+
+
+class StreamSubscription:
+    """
+    One stream consumer's view of the hub.
+
+    Subscriptions do not queue updates. Each publish only raises a pending
+    flag; when the consumer next asks, it gets a single delta from the
+    version it last received to the latest one, with the changes of every
+    publish in between merged per symbol and order. A slow consumer
+    therefore never works through stale updates, and bursts cost at most
+    one build per wake-up (shared with every consumer at the same
+    version). Consumers whose version has aged out of the change history,
+    and snapshot consumers, get the latest snapshot instead.
+    """
+
+    def __init__(self, hub: 'ExchangeDataHub', client_id: str, delta: bool):
+        self.hub = hub
+        self.client_id = client_id
+        self.delta = delta
+        self.needs_snapshot = True
+        self.pending = False
+        self.version: Optional[int] = None  # version of the last update handed out
+        self.published = 0  # publishes since the last update handed out
+        self.coalesced = 0
+        self._wakeup = asyncio.Event()
+
+    async def next_update(self, timeout: Optional[float] = None) -> Optional[CachedUpdate]:
+        """Wait for the next update, returning None if the timeout expires first"""
+        while True:
+            if self.pending or self.needs_snapshot:
+                return self._take()
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def resync(self):
+        """Restart from the next snapshot"""
+        self.needs_snapshot = True
+
+    def defer_snapshot(self):
+        """Hold off on the snapshot until the next publish"""
+        self.needs_snapshot = False
+        self.pending = False
+        self.version = None
+
+    def _notify(self):
+        self.pending = True
+        self.published += 1
+        self._wakeup.set()
+
+    def _take(self) -> CachedUpdate:
+        if self.published:
+            # Latest publish to the consumer picking it up
+            track_stage_latency('stream_wait', time.perf_counter() - self.hub.published_at)
+        if self.published > 1:
+            self.coalesced += self.published - 1
+            track_stream_coalesced(self.published - 1)
+        self.published = 0
+        self.pending = False
+
+        update = None
+        if self.delta and not self.needs_snapshot and self.version is not None:
+            update = self.hub.delta(self.version)
+            if update is None:
+                track_stream_resync()
+                logger.info(f"Stream subscriber {self.client_id} at v{self.version} is past the change "
+                            f"history, resyncing from snapshot")
+
+        if update is None:
+            self.needs_snapshot = False
+            update = self.hub.snapshot()
+
+        self.version = update.message.version
+        return update
+
+
+class ExchangeDataHub:
+    """
+    Broadcasts exchange state changes to every StreamExchangeData subscriber.
+
+    Publishing commits the pending changes and wakes the subscribers; no
+    update is built until a subscriber asks for one. Deltas are keyed by
+    (base version, latest version) and snapshots by version in the snapshot
+    cache, so subscribers asking at the same point share one build and the
+    same pre-serialized bytes.
+    """
+
+    def __init__(self, exchange_manager):
+        self.exchange_manager = exchange_manager
+        self.subscribers: Set[StreamSubscription] = set()
+        self.published_version: Optional[int] = None
+        self.published_at = 0.0  # perf_counter() of the last publish
+        self.cache = SnapshotCache()
+
+        exchange_manager.update_listeners.append(self.publish)
+
+    def subscribe(self, client_id: str, delta: bool = False) -> StreamSubscription:
+        subscription = StreamSubscription(self, client_id, delta)
+        self.subscribers.add(subscription)
+        track_stream_subscribers(len(self.subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription: StreamSubscription):
+        self.subscribers.discard(subscription)
+        track_stream_subscribers(len(self.subscribers))
+
+    def publish(self):
+        """Commit pending changes and wake every subscriber"""
+        self.published_version = self.exchange_manager.changes.commit()
+        self.published_at = time.perf_counter()
+        for subscription in self.subscribers:
+            subscription._notify()
+
+    def delta(self, base_version: int) -> Optional[CachedUpdate]:
+        """Everything changed since base_version, or None if the change history no longer covers it"""
+        changes_tracker = self.exchange_manager.changes
+        version = changes_tracker.commit()
+        changes = changes_tracker.changes_since(base_version)
+        if changes is None:
+            return None
+        return self.cache.get_or_build(
+            ('delta', base_version, version),
+            lambda: build_delta(self.exchange_manager, changes, base_version, version)
+        )
+
+    def snapshot(self) -> CachedUpdate:
+        """Full-state update for the latest version"""
+        version = self.published_version = self.exchange_manager.changes.commit()
+        return self.cache.get_or_build(
+            ('snapshot', version),
+            lambda: build_snapshot(self.exchange_manager, version)
+        )
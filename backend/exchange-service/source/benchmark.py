@@ -0,0 +1,363 @@
+# source/benchmark.py
+"""
+In-process benchmarks for the exchange simulator.
+
+Serves ExchangeSimulatorService on a local grpc.aio server and drives it
+through real gRPC stubs, so serialization, the servicer and the exchange
+are all measured together. Nothing external is involved: the exchange is
+never initialized, so it opens no database connection and checkpoints
+nothing, and market data is synthetic bars fed straight into
+ExchangeManager.update_market_data, as the market data client would.
+
+Scenarios:
+- submit_orders: SubmitOrders round trips per batch size
+- stream_fanout: one bar through the tick path to N StreamExchangeData subscribers
+- snapshot: build_snapshot time and size as positions and open orders grow
+
+Usage: python -m source.benchmark [--output results.json] [--quick]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Sequence, Tuple
+
+import grpc
+import numpy as np
+
+from source.config import config
+from source.core.exchange_manager import ExchangeManager
+from source.api.service import ExchangeSimulatorService, add_order_servicer_to_server, add_session_servicer_to_server
+from source.api.stream_builder import build_snapshot
+from source.api.grpc.order_exchange_interface_pb2 import BatchOrderRequest, OrderRequest
+from source.api.grpc.order_exchange_interface_pb2_grpc import OrderExchangeSimulatorStub
+from source.api.grpc.session_exchange_interface_pb2 import StreamRequest
+from source.api.grpc.session_exchange_interface_pb2_grpc import SessionExchangeSimulatorStub
+
+logger = logging.getLogger('benchmark')
+
+SYMBOLS = ['AAPL', 'GOOGL', 'MSFT', 'AMZN']
+BENCHMARK_CASH = 1e12  # enough that buying power never rejects an order
+BENCHMARK_POSITION = 1e9  # shares held per symbol, enough that no sell is rejected
+
+
+def _bar(symbol: str, close: float, volume: int = 1_000_000) -> Dict[str, Any]:
+    return {
+        'symbol': symbol, 'open': close, 'high': close, 'low': close, 'close': close,
+        'volume': volume, 'trade_count': 1, 'vwap': close
+    }
+
+
+def _latency_stats(seconds: Sequence[float]) -> Dict[str, float]:
+    """Mean and percentiles, in milliseconds"""
+    values = np.asarray(seconds) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'max_ms': float(values.max())
+    }
+
+
+def _new_exchange(symbols: List[str]) -> ExchangeManager:
+    exchange_manager = ExchangeManager(
+        user_id=config.simulator.user_id,
+        desk_id=config.simulator.desk_id,
+        initial_cash=BENCHMARK_CASH,
+        symbols=symbols
+    )
+    exchange_manager.seed_market_data([_bar(symbol, 100.0) for symbol in symbols])
+    for symbol in symbols:
+        exchange_manager.mark_to_market.update_position(symbol, BENCHMARK_POSITION, 100.0)
+    return exchange_manager
+
+
+@asynccontextmanager
+async def _serve(exchange_manager: ExchangeManager):
+    """Serve one exchange on a free local port and yield a client channel to it"""
+    server = grpc.aio.server(options=[
+        ('grpc.max_send_message_length', 100 * 1024 * 1024),
+        ('grpc.max_receive_message_length', 100 * 1024 * 1024),
+    ])
+    service = ExchangeSimulatorService(exchange_manager)
+    add_session_servicer_to_server(service, server)
+    add_order_servicer_to_server(service, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+
+    channel = grpc.aio.insecure_channel(f'127.0.0.1:{port}', options=[
+        ('grpc.max_receive_message_length', 100 * 1024 * 1024),
+    ])
+    try:
+        await channel.channel_ready()
+        yield channel
+    finally:
+        await channel.close()
+        await server.stop(0)
+
+
+def _order_batch(batch_size: int, offset: int) -> BatchOrderRequest:
+    """Resting limit orders, alternating sides and symbols, away from the market so none fill"""
+    orders = []
+    for i in range(batch_size):
+        n = offset + i
+        buy = n % 2 == 0
+        orders.append(OrderRequest(
+            symbol=SYMBOLS[n % len(SYMBOLS)],
+            side=OrderRequest.BUY if buy else OrderRequest.SELL,
+            quantity=1 + n % 10,
+            price=90.0 - n % 5 if buy else 110.0 + n % 5,
+            type=OrderRequest.LIMIT,
+            request_id=f'bench-{n}'
+        ))
+    return BatchOrderRequest(orders=orders)
+
+
+async def bench_submit_orders(batch_sizes: Sequence[int], orders_per_size: int) -> List[Dict[str, Any]]:
+    """SubmitOrders latency and throughput per batch size, each on a fresh exchange"""
+    results = []
+    for batch_size in batch_sizes:
+        exchange_manager = _new_exchange(SYMBOLS)
+        async with _serve(exchange_manager) as channel:
+            stub = OrderExchangeSimulatorStub(channel)
+
+            # Warm up the channel and the servicer
+            await stub.SubmitOrders(_order_batch(batch_size, -batch_size))
+
+            rounds = max(orders_per_size // batch_size, 20)
+            requests = [_order_batch(batch_size, r * batch_size) for r in range(rounds)]
+            latencies = []
+            rejected = 0
+            start = time.perf_counter()
+            for request in requests:
+                call_start = time.perf_counter()
+                response = await stub.SubmitOrders(request)
+                latencies.append(time.perf_counter() - call_start)
+                rejected += sum(1 for result in response.results if not result.success)
+            elapsed = time.perf_counter() - start
+
+        orders = rounds * batch_size
+        results.append({
+            'batch_size': batch_size,
+            'calls': rounds,
+            'orders': orders,
+            'rejected': rejected,
+            'elapsed_seconds': elapsed,
+            'orders_per_second': orders / elapsed,
+            'calls_per_second': rounds / elapsed,
+            'latency_per_call': _latency_stats(latencies),
+            'us_per_order': elapsed / orders * 1e6
+        })
+        logger.info(f"submit_orders batch {batch_size}: {orders / elapsed:,.0f} orders/s, "
+                    f"p50 {results[-1]['latency_per_call']['p50_ms']:.3f}ms")
+    return results
+
+
+class _Fanout:
+    """When each subscriber received each version"""
+
+    def __init__(self, subscribers: int):
+        self.subscribers = subscribers
+        self.arrivals: Dict[int, List[float]] = {}
+        self.sizes: List[int] = []
+        self._complete: Dict[int, asyncio.Event] = {}
+
+    def received(self, version: int, size: int):
+        arrivals = self.arrivals.setdefault(version, [])
+        arrivals.append(time.perf_counter())
+        self.sizes.append(size)
+        if len(arrivals) == self.subscribers:
+            self.complete(version).set()
+
+    def complete(self, version: int) -> asyncio.Event:
+        event = self._complete.get(version)
+        if event is None:
+            event = self._complete[version] = asyncio.Event()
+        return event
+
+
+async def _consume(stub: SessionExchangeSimulatorStub, client_id: str, fanout: _Fanout):
+    async for update in stub.StreamExchangeData(StreamRequest(client_id=client_id, delta=True)):
+        fanout.received(update.version, update.ByteSize())
+
+
+async def bench_stream_fanout(subscriber_counts: Sequence[int], ticks: int,
+                              resting_orders: int) -> List[Dict[str, Any]]:
+    """
+    Time from a bar entering update_market_data to every subscriber holding the update
+
+    Each tick moves prices enough to fill a few of the resting orders, so
+    deltas carry market data, orders and positions like a live session.
+    """
+    results = []
+    for subscribers in subscriber_counts:
+        exchange_manager = _new_exchange(SYMBOLS)
+        async with _serve(exchange_manager) as channel:
+            order_stub = OrderExchangeSimulatorStub(channel)
+            for offset in range(0, resting_orders, 1000):
+                await order_stub.SubmitOrders(_order_batch(min(1000, resting_orders - offset), offset))
+
+            stub = SessionExchangeSimulatorStub(channel)
+            fanout = _Fanout(subscribers)
+            readers = [asyncio.create_task(_consume(stub, f'bench-{i}', fanout)) for i in range(subscribers)]
+            # Every subscriber gets a snapshot of the same version before the ticks start
+            await asyncio.wait_for(fanout.complete(exchange_manager.changes.version).wait(), timeout=60)
+            fanout.sizes.clear()
+
+            tick_latencies = []
+            exchange_times = []
+            incomplete = 0
+            start = time.perf_counter()
+            for tick in range(ticks):
+                close = 100.0 + (-1) ** tick * (8.0 + tick % 3)
+                tick_start = time.perf_counter()
+                await exchange_manager.update_market_data([_bar(symbol, close) for symbol in SYMBOLS])
+                exchange_times.append(time.perf_counter() - tick_start)
+                version = exchange_manager.changes.version
+
+                # Wait for the last subscriber, capped in case an update was coalesced away
+                try:
+                    await asyncio.wait_for(fanout.complete(version).wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    incomplete += 1
+                    continue
+                tick_latencies.append(max(fanout.arrivals[version]) - tick_start)
+            elapsed = time.perf_counter() - start
+
+            for reader in readers:
+                reader.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+
+        results.append({
+            'subscribers': subscribers,
+            'ticks': ticks,
+            'resting_orders': resting_orders,
+            'incomplete_ticks': incomplete,
+            'ticks_per_second': ticks / elapsed,
+            'updates_delivered': len(fanout.sizes),
+            'mean_update_bytes': float(np.mean(fanout.sizes)) if fanout.sizes else 0.0,
+            'exchange_update': _latency_stats(exchange_times),
+            'last_subscriber': _latency_stats(tick_latencies) if tick_latencies else None
+        })
+        logger.info(f"stream_fanout {subscribers} subscribers: {ticks / elapsed:,.0f} ticks/s, "
+                    f"p50 to last subscriber "
+                    f"{results[-1]['last_subscriber']['p50_ms'] if tick_latencies else float('nan'):.3f}ms")
+    return results
+
+
+async def bench_snapshot(sizes: Sequence[Tuple[int, int]], repeats: int) -> List[Dict[str, Any]]:
+    """build_snapshot time and serialized size for (positions, open orders) pairs"""
+    results = []
+    for positions, open_orders in sizes:
+        symbols = [f'SYM{i:05d}' for i in range(max(positions, len(SYMBOLS)))]
+        exchange_manager = _new_exchange(symbols)
+        for i, symbol in enumerate(symbols[:positions]):
+            exchange_manager.positions.set_position(symbol, 10 + i % 90, 95.0)
+        exchange_manager.mark_to_market.rebuild()
+
+        # Called in-process: only the snapshot itself is being measured
+        service = ExchangeSimulatorService(exchange_manager)
+        for offset in range(0, open_orders, 1000):
+            request = _order_batch(min(1000, open_orders - offset), offset)
+            for n, order in enumerate(request.orders):
+                order.symbol = symbols[(offset + n) % len(symbols)]
+            await service.SubmitOrders(request, None)
+
+        version = exchange_manager.changes.version
+        build_times = []
+        serialize_times = []
+        payload = b''
+        for _ in range(repeats):
+            start = time.perf_counter()
+            update = build_snapshot(exchange_manager, version)
+            built = time.perf_counter()
+            payload = update.SerializeToString()
+            build_times.append(built - start)
+            serialize_times.append(time.perf_counter() - built)
+
+        results.append({
+            'positions': len(exchange_manager.positions),
+            'open_orders': len(exchange_manager.order_manager.orders),
+            'symbols': len(symbols),
+            'repeats': repeats,
+            'build': _latency_stats(build_times),
+            'serialize': _latency_stats(serialize_times),
+            'snapshot_bytes': len(payload)
+        })
+        logger.info(f"snapshot {positions} positions / {open_orders} orders: "
+                    f"build p50 {results[-1]['build']['p50_ms']:.3f}ms, {len(payload):,} bytes")
+    return results
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'grpc': grpc.__version__,
+        'numpy': np.__version__
+    }
+
+
+async def run_benchmarks(quick: bool = False) -> Dict[str, Any]:
+    """
+    Run every scenario and return the results
+
+    Args:
+        quick: Smaller sizes and fewer repetitions, for a smoke run
+
+    Returns:
+        Report with the environment and one list of results per scenario
+    """
+    # Measure the exchange, not the database or the checkpoint writer
+    config.checkpoint.enabled = False
+
+    if quick:
+        batch_sizes, orders_per_size = (1, 100), 2_000
+        subscriber_counts, ticks, resting_orders = (1, 10), 50, 1_000
+        snapshot_sizes, repeats = ((10, 100), (100, 1_000)), 10
+    else:
+        batch_sizes, orders_per_size = (1, 10, 100, 1000), 20_000
+        subscriber_counts, ticks, resting_orders = (1, 10, 100), 200, 10_000
+        snapshot_sizes, repeats = ((10, 100), (100, 1_000), (1_000, 10_000), (1_000, 100_000)), 20
+
+    report = {'environment': _environment(), 'quick': quick}
+    report['submit_orders'] = await bench_submit_orders(batch_sizes, orders_per_size)
+    report['stream_fanout'] = await bench_stream_fanout(subscriber_counts, ticks, resting_orders)
+    report['snapshot'] = await bench_snapshot(snapshot_sizes, repeats)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the exchange simulator in-process")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    parser.add_argument('--quick', action='store_true', help="Smaller sizes, for a smoke run")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.INFO)
+    # Streams still open when a scenario stops its server are aborted; expected here
+    logging.getLogger('grpc._cython.cygrpc').setLevel(logging.ERROR)
+    report = asyncio.run(run_benchmarks(args.quick))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,10 @@ class SimulatorConfig(BaseModel):
     user_id: str = Field(default=os.getenv('USER_ID', 'test'))
     desk_id: str = Field(default=os.getenv('DESK_ID', 'test'))
     default_symbols: list = Field(default=['AAPL', 'GOOGL', 'MSFT', 'AMZN'])
+    # Host an exchange per user/desk (picked from gRPC metadata) in one process
+    multi_tenant: bool = Field(default=os.getenv('MULTI_TENANT', 'false').lower() == 'true')
+    # Drop a tenant after this long with no calls, open streams or open orders; 0 keeps every tenant
+    tenant_idle_seconds: float = Field(default=float(os.getenv('TENANT_IDLE_SECONDS', '1800')))
 
 
 class ServerConfig(BaseModel):
@@ -16,12 +20,12 @@ class ServerConfig(BaseModel):
 
 
 class MetricsConfig(BaseModel):
-    enabled: bool = Field(default=True)
+    enabled: bool = Field(default=os.getenv('METRICS_ENABLED', 'true').lower() == 'true')
     port: int = Field(default=9090)
 
 
 class TracingConfig(BaseModel):
-    enabled: bool = Field(default=True)
+    enabled: bool = Field(default=os.getenv('TRACING_ENABLED', 'true').lower() == 'true')
     service_name: str = Field(default="exchange-simulator")
     jaeger_endpoint: str = Field(default="http://jaeger-collector:14268/api/traces")
 
@@ -40,6 +44,60 @@ class MarketDataConfig(BaseModel):
     service_url: str = Field(default=os.getenv('MARKET_DATA_SERVICE_URL', 'market-data-service:50060'))
 
 
+class CheckpointConfig(BaseModel):
+    enabled: bool = Field(default=os.getenv('CHECKPOINT_ENABLED', 'true').lower() == 'true')
+    interval_seconds: float = Field(default=float(os.getenv('CHECKPOINT_INTERVAL', '5.0')))
+
+
+class OrderHistoryConfig(BaseModel):
+    # Closed orders kept in memory (for late cancels, amends and stream snapshots) before eviction
+    buffer_size: int = Field(default=int(os.getenv('CLOSED_ORDER_BUFFER', '1000')))
+    # Save closed orders to simulator.closed_orders in batches with each checkpoint round
+    persist: bool = Field(default=os.getenv('CLOSED_ORDER_PERSIST', 'true').lower() == 'true')
+
+
+class MatchingConfig(BaseModel):
+    # Share of each bar's volume that can fill orders on each side; 0 is unlimited
+    participation_rate: float = Field(default=float(os.getenv('FILL_PARTICIPATION_RATE', '1.0')))
+    # DAY orders expire at this UTC time of day (HH:MM); 21:00 is the US close in winter
+    day_order_expiry_utc: str = Field(default=os.getenv('DAY_ORDER_EXPIRY_UTC', '21:00'))
+    # Granularity of order expiry, in seconds
+    expiry_resolution: float = Field(default=float(os.getenv('ORDER_EXPIRY_RESOLUTION', '1.0')))
+
+
+class RiskConfig(BaseModel):
+    # Per-order limits applied to every submitted batch; 0 disables a limit
+    max_order_quantity: float = Field(default=float(os.getenv('MAX_ORDER_QUANTITY', '0')))
+    max_order_notional: float = Field(default=float(os.getenv('MAX_ORDER_NOTIONAL', '0')))
+    # Book exposure limits, used when trading.books does not set them; 0 disables a limit
+    max_position_size: float = Field(default=float(os.getenv('MAX_POSITION_SIZE', '0')))
+    max_total_risk: float = Field(default=float(os.getenv('MAX_TOTAL_RISK', '0')))
+    # Reject buys that cost more than the cash not already reserved by open buys
+    check_buying_power: bool = Field(default=os.getenv('CHECK_BUYING_POWER', 'true').lower() == 'true')
+
+
+class RecorderConfig(BaseModel):
+    # Record the session to this file when set
+    path: str = Field(default=os.getenv('SESSION_RECORDING_PATH', ''))
+
+
+class BacktestConfig(BaseModel):
+    # Backtest mode is on when a time range is given (epoch milliseconds)
+    start_time: int = Field(default=int(os.getenv('BACKTEST_START', '0')))
+    end_time: int = Field(default=int(os.getenv('BACKTEST_END', '0')))
+    symbols: list = Field(default=[s for s in os.getenv('BACKTEST_SYMBOLS', '').split(',') if s])
+    fetch_batch_size: int = Field(default=int(os.getenv('BACKTEST_FETCH_BATCH_SIZE', '5000')))
+
+    @property
+    def enabled(self) -> bool:
+        return self.end_time > self.start_time
+
+
+class StartupConfig(BaseModel):
+    # Warn when the time from process start to ready exceeds this many seconds
+    budget_seconds: float = Field(default=float(os.getenv('STARTUP_BUDGET_SECONDS', '2.0')))
+
+
 class OrderExchangeConfig(BaseModel):
     service_url: str = Field(default=os.getenv('ORDER_EXCHANGE_SERVICE_URL', 'order-exchange-service:50057'))
 
@@ -51,7 +109,14 @@ class Config(BaseModel):
     tracing: TracingConfig = Field(default_factory=TracingConfig)
     db: DatabaseConfig = Field(default_factory=DatabaseConfig)
     market_data: MarketDataConfig = Field(default_factory=MarketDataConfig)
+    checkpoint: CheckpointConfig = Field(default_factory=CheckpointConfig)
+    order_history: OrderHistoryConfig = Field(default_factory=OrderHistoryConfig)
+    matching: MatchingConfig = Field(default_factory=MatchingConfig)
+    risk: RiskConfig = Field(default_factory=RiskConfig)
+    recorder: RecorderConfig = Field(default_factory=RecorderConfig)
+    backtest: BacktestConfig = Field(default_factory=BacktestConfig)
     order_exchange: OrderExchangeConfig = Field(default_factory=OrderExchangeConfig)
+    startup: StartupConfig = Field(default_factory=StartupConfig)
     log_level: str = Field(default="INFO")
     environment: str = Field(default="development")
 
@@ -0,0 +1,77 @@
+# source/core/change_tracker.py
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Optional, Set, Tuple
+
+logger = logging.getLogger('change_tracker')
+
+
+@dataclass
+class ChangeSet:
+    """Keys of the entities touched between two state versions"""
+    market_data: Set[str] = field(default_factory=set)  # symbols
+    orders: Set[int] = field(default_factory=set)  # internal order ids
+    positions: Set[str] = field(default_factory=set)  # symbols
+
+    def __bool__(self) -> bool:
+        return bool(self.market_data or self.orders or self.positions)
+
+    def merge(self, other: 'ChangeSet'):
+        self.market_data |= other.market_data
+        self.orders |= other.orders
+        self.positions |= other.positions
+
+
+class ChangeTracker:
+    """
+    Versioned record of which symbols, orders and positions changed.
+
+    Mutations mark keys into a pending change set; commit() closes it under
+    a new version. Stream consumers ask for everything changed since the
+    version they last saw and get None once that version has aged out of the
+    bounded history, or predates a change whose entity has since been
+    forgotten, in which case they need a full snapshot.
+    """
+
+    def __init__(self, history: int = 1024):
+        self.version = 0
+        self._log: Deque[Tuple[int, ChangeSet]] = deque(maxlen=history)
+        self._pending = ChangeSet()
+        # Consumers before this version missed a change that can no longer be built
+        self.floor = 0
+
+    def mark_market_data(self, symbol: str):
+        self._pending.market_data.add(symbol)
+
+    def mark_order(self, order_id: int):
+        self._pending.orders.add(order_id)
+
+    def mark_position(self, symbol: str):
+        self._pending.positions.add(symbol)
+
+    def forget(self, version: int):
+        """The entities changed at version are gone; consumers that have not seen it must resync"""
+        self.floor = max(self.floor, version)
+
+    def commit(self) -> int:
+        """Close the pending change set, returning the current version"""
+        if self._pending:
+            self.version += 1
+            self._log.append((self.version, self._pending))
+            self._pending = ChangeSet()
+        return self.version
+
+    def changes_since(self, version: int) -> Optional[ChangeSet]:
+        """Union of the changes after a version, or None if history no longer covers it"""
+        if version > self.version or version < self.floor:
+            return None
+        if version < self.version and (not self._log or self._log[0][0] > version + 1):
+            return None
+
+        changes = ChangeSet()
+        for logged_version, change_set in reversed(self._log):
+            if logged_version <= version:
+                break
+            changes.merge(change_set)
+        return changes
@@ -0,0 +1,114 @@
+# source/core/checkpoint.py
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('checkpoint')
+
+# (user_id, desk_id)
+CheckpointKey = Tuple[str, str]
+
+
+class CheckpointWriter:
+    """
+    Periodically persists exchange state in the background.
+
+    A source is anything with checkpoint_version() (a monotonic state
+    version) and checkpoint_state() (a compact, JSON-serializable copy of
+    its state). Sources are polled every interval; only those whose version
+    moved since the last successful write are captured, and all captures
+    from one round go to the database in a single batch. Capturing is a
+    cheap in-memory copy, so the tick path never waits on the database.
+
+    Sources may also queue closed orders (checkpoint_closed_orders()); the
+    rows from every source are appended in one more batch per round and
+    handed back with return_closed_orders() if the write fails.
+    """
+
+    def __init__(self, database_manager, interval: float = 5.0):
+        self.database_manager = database_manager
+        self.interval = interval
+        self.sources: Dict[CheckpointKey, object] = {}
+        self.saved_versions: Dict[CheckpointKey, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, key: CheckpointKey, source, saved_version: int = -1):
+        self.sources[key] = source
+        self.saved_versions[key] = saved_version
+
+    def unregister(self, key: CheckpointKey):
+        self.sources.pop(key, None)
+        self.saved_versions.pop(key, None)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Checkpoint writer started (interval {self.interval}s)")
+
+    async def stop(self):
+        """Stop the background loop and write a final checkpoint"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write every source that changed since its last checkpoint, returning how many were written"""
+        await self._flush_closed_orders()
+
+        batch = []
+        for key, source in list(self.sources.items()):
+            version = source.checkpoint_version()
+            if version == self.saved_versions.get(key):
+                continue
+            state = source.checkpoint_state()
+            state['user_id'], state['desk_id'] = key
+            state['version'] = version
+            batch.append(state)
+
+        if not batch:
+            return 0
+
+        start_time = time.time()
+        if not await self.database_manager.save_exchange_states(batch):
+            # Leave saved_versions alone so the next round retries
+            return 0
+
+        for state in batch:
+            key = (state['user_id'], state['desk_id'])
+            if key in self.saved_versions:
+                self.saved_versions[key] = state['version']
+
+        logger.debug(f"Checkpointed {len(batch)} exchange states in {(time.time() - start_time) * 1000:.1f}ms")
+        return len(batch)
+
+    async def _flush_closed_orders(self):
+        closed = {}
+        for key, source in list(self.sources.items()):
+            take = getattr(source, 'checkpoint_closed_orders', None)
+            rows = take() if take else None
+            if rows:
+                closed[key] = (source, rows)
+
+        if not closed:
+            return
+
+        rows = [(*key, *row) for key, (_, source_rows) in closed.items() for row in source_rows]
+        if not await self.database_manager.save_closed_orders(rows):
+            for source, source_rows in closed.values():
+                source.return_closed_orders(source_rows)
+            return
+        logger.debug(f"Saved {len(rows)} closed orders")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Checkpoint flush failed: {e}")
@@ -1,83 +1,198 @@
 # source/core/exchange_manager.py
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
-
-from source.models.enums import OrderSide
+import time
+import uuid
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+
+from source.config import config
+from source.models.enums import OrderSide, OrderType, OrderStatus, TimeInForce
+from source.models.order import Order, Fill
+from source.core.change_tracker import ChangeTracker
+from source.core.checkpoint import CheckpointWriter
+from source.core.mark_to_market import MarkToMarket
+from source.core.order_batch import OrderBatch
+from source.core.order_ids import OrderIdMap
+from source.core.position_store import PositionStore
+from source.core.risk_engine import RiskEngine
 from source.core.market_data_manager import MarketDataClient
 from source.core.order_manager import OrderManager
 from source.db.database import DatabaseManager
+from source.utils.clock import Clock
+from source.utils.metrics import track_stage_latency
 
 logger = logging.getLogger('exchange_manager')
 
 
 class ExchangeManager:
-    def __init__(self, user_id: str, desk_id: str, initial_cash: float = 100_000.0):
+    def __init__(
+            self,
+            user_id: str,
+            desk_id: str,
+            initial_cash: float = 100_000.0,
+            clock: Optional[Clock] = None,
+            database_manager: Optional[DatabaseManager] = None,
+            checkpoint_writer: Optional[CheckpointWriter] = None,
+            market_data_client: Optional[MarketDataClient] = None,
+            symbols: Optional[List[str]] = None
+    ):
         self.user_id = user_id
         self.desk_id = desk_id
         self.initial_cash = initial_cash
 
-        # Configuration
-        self.default_symbols = ['AAPL', 'GOOGL', 'MSFT', 'AMZN']
+        # Wall clock when live, virtual clock when backtesting
+        self.clock = clock or Clock()
 
-        # Core components
-        self.market_data_client = MarketDataClient(self, self.default_symbols)
+        # Symbols this exchange trades; bars for any other symbol are ignored
+        self.symbols: Set[str] = set(symbols or config.simulator.default_symbols)
+
+        # Core components. When hosted by a TenantRegistry the database,
+        # checkpoint writer and market data client are shared and owned by it.
+        self.owns_services = database_manager is None
+        self.market_data_client = market_data_client or MarketDataClient(self, sorted(self.symbols))
+        # Symbols this exchange holds in the market data client; a tenant's
+        # initial symbols are held by the registry
+        self._subscribed: Set[str] = set(self.symbols) if self.owns_services else set()
         self.order_manager = OrderManager(self)
-        self.database_manager = DatabaseManager()
+        self.database_manager = database_manager or DatabaseManager()
+        self.checkpoint_writer = checkpoint_writer or CheckpointWriter(
+            self.database_manager, config.checkpoint.interval_seconds)
 
         # Market data storage
         self.current_market_data = {}  # symbol -> market data
+        # When the market data service published the latest update (epoch ms), carried to stream clients
+        self.market_data_origin = 0
 
         # Exchange state
         self.cash_balance = initial_cash
-        self.positions: Dict[str, Dict] = {}
-        self.orders: Dict[str, Dict] = {}
+        self.positions = PositionStore()
+
+        # Client order ids <-> internal integer order ids
+        self.order_ids = OrderIdMap(reusable=self._order_id_reusable)
+
+        # Price index and running portfolio valuation
+        self.mark_to_market = MarkToMarket(self.positions)
+
+        # Pre-trade exposure and buying power checks
+        self.risk = RiskEngine(self)
+
+        # Optional session recorder (see source/replay.py)
+        self.recorder = None
+
+        # Result of the last backtest run, if in backtest mode
+        self.backtest_report: Optional[Dict[str, Any]] = None
+
+        # Versioned change log used for delta streaming
+        self.changes = ChangeTracker()
+
+        # Orders closed since the last commit, retired from the open-order index on commit
+        self._closed_orders: List[Order] = []
 
-        # Add a queue for market data update notifications
-        self.market_data_updates = asyncio.Queue()
+        # Callbacks run after each market data update (e.g. the stream hub)
+        self.update_listeners: List[Callable[[], None]] = []
 
-    async def initialize(self):
+        # Callbacks run with every batch of executions
+        self.fill_listeners: List[Callable[[List[Fill]], None]] = []
+
+        # Client streams open on this exchange; a tenant with any is never idle
+        self.open_streams = 0
+
+        # Sequence number of the last fill; restarts with the process, under a new stream id
+        self.fill_sequence = 0
+        self.fill_stream_id = uuid.uuid4().hex[:12]
+
+        # Expires DAY and GTD orders between market data updates when live
+        self._expiry_task: Optional[asyncio.Task] = None
+
+        # Market data received while initialize is still restoring state; None once restored
+        self._early_market_data: Optional[List[Tuple[List[Dict], int]]] = None
+
+    async def initialize(self, live_market_data: bool = True, persist: bool = True):
         """
         Initialize the exchange state
+        - Connect to market data service (unless backtesting)
         - Load historical positions
         - Restore previous state if applicable
-        - Connect to market data service
-        """
-        try:
-            try:
-                # Attempt to connect to the database
-                await self.database_manager.connect()
 
-                # Verify connection
-                connection_healthy = await self.database_manager.check_connection()
-                if not connection_healthy:
-                    logger.warning("Database connection established but not responding to queries")
+        With persist off (backtests) the saved state is neither restored nor
+        overwritten: nothing is checkpointed and closed orders are not saved.
 
-            except Exception as e:
-                logger.error(f"Failed to initialize database connection: {e}")
-                # Decide how to handle: retry, exit, or continue with limited functionality
-                raise
-
-            # Load historical data for user
-            historical_data = await self.database_manager.load_user_exchange_state(
-                user_id=self.user_id,
-                desk_id=self.desk_id
+        The market data subscription is opened first so its handshake overlaps
+        the database work; updates that arrive before the state is restored
+        are held and applied, in order, right after it.
+        """
+        try:
+            # Start the market data client
+            if live_market_data and self.owns_services:
+                self._early_market_data = []
+                await self.market_data_client.start()
+
+            if self.owns_services:
+                try:
+                    # Attempt to connect to the database
+                    await self.database_manager.connect()
+                except Exception as e:
+                    logger.error(f"Failed to initialize database connection: {e}")
+                    # Decide how to handle: retry, exit, or continue with limited functionality
+                    raise
+
+            # Load the saved state and the book's exposure limits together;
+            # without persistence the exchange starts clean
+            checks = [self.database_manager.check_connection()] if self.owns_services else []
+            saved_state = (self.database_manager.load_user_exchange_state(user_id=self.user_id, desk_id=self.desk_id)
+                           if persist else asyncio.sleep(0, {}))
+            historical_data, book_limits, *connection_healthy = await asyncio.gather(
+                saved_state,
+                self.database_manager.load_book_limits(self.user_id, self.desk_id),
+                *checks
             )
+            if connection_healthy and not connection_healthy[0]:
+                logger.warning("Database connection established but not responding to queries")
 
-            # Restore state if exists
-            if historical_data:
-                self.cash_balance = historical_data.get('cash_balance', self.initial_cash)
-                self.positions = historical_data.get('positions', {})
+            if book_limits:
+                self.risk.set_limits(**book_limits)
 
             # Initialize order manager after database connection
             await self.order_manager.initialize()
+            if not persist:
+                self.order_manager.closed.persist = False
 
-            # Start the market data client
-            await self.market_data_client.start()
+            # Restore state if exists
+            saved_version = -1
+            if historical_data:
+                self._restore_state(historical_data)
+                saved_version = self.changes.version
+
+                # Keep trading symbols added before the restart that still hold orders or positions
+                restored_symbols = {order.symbol for order in self.order_manager.get_open_orders()}
+                restored_symbols.update(self.positions.held_symbols())
+                if restored_symbols - self.symbols:
+                    await self.update_symbols(add_symbols=sorted(restored_symbols - self.symbols))
+
+            # A recording starts from the restored state, so its replay can too
+            if self.recorder:
+                self.recorder.record_initial_state(self.initial_state())
+
+            # Apply the market data held back while restoring
+            early_market_data, self._early_market_data = self._early_market_data, None
+            for market_data_list, origin_timestamp in early_market_data or ():
+                await self.update_market_data(market_data_list, origin_timestamp)
+
+            # Checkpoint in the background from here on
+            if persist and config.checkpoint.enabled:
+                self.checkpoint_writer.register((self.user_id, self.desk_id), self, saved_version)
+                if self.owns_services:
+                    await self.checkpoint_writer.start()
+
+            # Backtests expire orders as the virtual clock moves with each bar
+            if live_market_data:
+                self._expiry_task = asyncio.create_task(self._expire_periodically())
 
             logger.info(f"Exchange initialized for User {self.user_id}")
         except Exception as e:
             logger.error(f"Exchange initialization failed: {e}")
+            if self.owns_services:
+                await self.market_data_client.stop()
             raise
 
     async def cleanup(self):
@@ -88,35 +203,86 @@ class ExchangeManager:
         - Stop market data client
         """
         try:
+            if self._expiry_task:
+                self._expiry_task.cancel()
+                self._expiry_task = None
+
+            if self.owns_services:
+                # Write a final checkpoint while the database is still open
+                await self.checkpoint_writer.stop()
+            else:
+                # The shared writer outlives this tenant; write it out now
+                await self.checkpoint_writer.flush()
+                self.checkpoint_writer.unregister((self.user_id, self.desk_id))
+                # Release the symbols this tenant added to the shared subscription
+                released, self._subscribed = sorted(self._subscribed), set()
+                await self.market_data_client.remove_symbols(released)
+
             # Clean up order manager
             await self.order_manager.cleanup()
 
-            # Stop the market data client
-            await self.market_data_client.stop()
+            if self.owns_services:
+                # Stop the market data client
+                await self.market_data_client.stop()
 
-            # Close database connection
-            await self.database_manager.close()
+                # Close database connection
+                await self.database_manager.close()
+
+            if self.recorder:
+                self.recorder.close()
 
             logger.info(f"Exchange cleaned up for User {self.user_id}")
         except Exception as e:
             logger.error(f"Exchange cleanup failed: {e}")
 
-    async def update_market_data(self, market_data_list):
+    async def update_market_data(self, market_data_list, origin_timestamp: int = 0):
         """
         Update market data with values from the market data service
         
         Args:
             market_data_list: List of market data updates
+            origin_timestamp: When the market data service published them (epoch ms), if known
         """
+        if self._early_market_data is not None:
+            self._early_market_data.append((market_data_list, origin_timestamp))
+            return True
+
+        start = time.perf_counter()
         try:
+            if origin_timestamp:
+                self.market_data_origin = origin_timestamp
+
+            # A shared subscription also carries other tenants' symbols
+            market_data_list = [md for md in market_data_list if md.get('symbol') in self.symbols]
+
+            # Orders due to expire by now do not get to trade on these bars
+            for order in self.order_manager.expire_orders(self.clock.now()):
+                self._record_order(order)
+
             # Update the internal market data cache
             for market_data in market_data_list:
                 symbol = market_data.get('symbol')
                 if symbol:
                     self.current_market_data[symbol] = market_data
+                    self.mark_to_market.update_price(symbol, market_data.get('close', 0))
+                    self.risk.update_price(symbol, market_data.get('close', 0))
+                    self.changes.mark_market_data(symbol)
+                    if symbol in self.positions:
+                        # Market value moves with the price
+                        self.changes.mark_position(symbol)
+
+            # Cross resting orders against the new bars
+            fills, expired = self.order_manager.process_market_data(market_data_list)
+            for order in expired:
+                self._record_order(order)
+            self._apply_fills(fills)
+            self._commit()
+
+            track_stage_latency('update_market_data', time.perf_counter() - start)
 
             # Notify listeners about the update
-            await self.market_data_updates.put(True)
+            for listener in self.update_listeners:
+                listener()
             logger.debug(f"Received market data for {len(market_data_list)} symbols")
 
             return True
@@ -124,6 +290,19 @@ class ExchangeManager:
             logger.error(f"Failed to update market data: {e}")
             return False
 
+    def seed_market_data(self, market_data_list: List[Dict[str, Any]]):
+        """Prime last prices from bars seen before this exchange existed, without crossing any orders"""
+        for market_data in market_data_list:
+            symbol = market_data.get('symbol')
+            if symbol in self.symbols:
+                self.current_market_data[symbol] = market_data
+                self.mark_to_market.update_price(symbol, market_data.get('close', 0))
+                self.risk.update_price(symbol, market_data.get('close', 0))
+                self.changes.mark_market_data(symbol)
+                if symbol in self.positions:
+                    self.changes.mark_position(symbol)
+        self._commit()
+
     def generate_periodic_data(
             self,
             symbols: Optional[List[str]] = None
@@ -137,7 +316,7 @@ class ExchangeManager:
         - Portfolio data
         - Order updates
         """
-        symbols = symbols or self.default_symbols
+        symbols = symbols or sorted(self.symbols)
 
         # Use the current market data
         market_data = []
@@ -156,28 +335,30 @@ class ExchangeManager:
         # Generate portfolio data
         portfolio_data = {
             'cash_balance': self.cash_balance,
-            'total_value': self._calculate_total_portfolio_value(market_data),
+            'total_value': self._calculate_total_portfolio_value(),
             'positions': [
                 {
                     'symbol': symbol,
                     'quantity': position['quantity'],
                     'average_cost': position['average_cost'],
-                    'market_value': position['quantity'] * self._get_current_price(symbol, market_data)
+                    'market_value': position['market_value']
                 }
-                for symbol, position in self.positions.items()
+                for symbol in self.positions.held_symbols()
+                for position in (self.positions.get(symbol),)
             ]
         }
 
-        # Generate order updates
+        # Generate order updates: open orders and the recently closed
         order_updates = [
             {
-                'order_id': order_id,
-                'symbol': order['symbol'],
-                'status': order['status'],
-                'filled_quantity': order.get('filled_quantity', 0),
-                'average_price': order.get('average_price', 0)
+                'order_id': self.order_ids.external(order.order_id),
+                'symbol': order.symbol,
+                'status': order.status.value,
+                'filled_quantity': order.filled_quantity,
+                'average_price': order.average_price
             }
-            for order_id, order in self.orders.items()
+            for orders in (self.order_manager.orders.values(), self.order_manager.closed)
+            for order in orders
         ]
 
         return market_data, portfolio_data, order_updates
@@ -189,165 +370,338 @@ class ExchangeManager:
             quantity: float,
             order_type: str,
             price: Optional[float] = None,
-            request_id: Optional[str] = None
+            request_id: Optional[str] = None,
+            stop_price: Optional[float] = None,
+            trail_amount: Optional[float] = None,
+            time_in_force: str = "GTC",
+            expire_time: int = 0
     ) -> Dict[str, Any]:
-        """Submit a trading order through the order manager"""
+        """Submit a trading order through the order manager; expire_time (epoch ms) is for GTD orders"""
         try:
             # Convert string enums to proper enum types
             side_enum = OrderSide.BUY if side == "BUY" else OrderSide.SELL
-            order_type_enum = OrderType.MARKET if order_type == "MARKET" else OrderType.LIMIT
-
-            # Submit through order manager
-            order = await self.order_manager.submit_order(
+            order_type_enum = OrderType(order_type) if order_type in OrderType.__members__ else OrderType.LIMIT
+            time_in_force_enum = TimeInForce(time_in_force) if time_in_force in TimeInForce.__members__ \
+                else TimeInForce.GTC
+
+            # The caller's request id is the client-facing order id, so that
+            # later cancels can reference the order
+            external_id = request_id or str(uuid.uuid4())
+            order, fills = self.order_manager.submit_order(
                 symbol=symbol,
                 side=side_enum,
                 quantity=quantity,
                 order_type=order_type_enum,
-                price=price
+                price=price,
+                order_id=self.order_ids.assign(external_id),
+                stop_price=stop_price,
+                trail_amount=trail_amount,
+                time_in_force=time_in_force_enum,
+                expire_at=expire_time / 1000
             )
+            self._record_order(order)
 
             if order.status == OrderStatus.REJECTED:
+                self._commit()
                 return {
                     'success': False,
+                    'order_id': external_id,
                     'error_message': order.error_message or 'Order rejected'
                 }
 
-            # Update our portfolio if the order was successful
-            if order.status in [OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED]:
-                self._update_portfolio_from_order(order)
+            # Update our portfolio for any immediate execution
+            self._apply_fills(fills)
+            self._commit()
 
             return {
                 'success': True,
-                'order_id': order.order_id
+                'order_id': external_id
             }
 
         except Exception as e:
             logger.error(f"Order submission error: {e}")
             return {'success': False, 'error_message': str(e)}
 
-    def _process_order(self, **kwargs):
-        """Internal method to process order details"""
-        # Implement order processing logic
-        order_id = kwargs.get('order_id')
-        symbol = kwargs.get('symbol')
-        side = kwargs.get('side')
-        quantity = kwargs.get('quantity')
-        price = kwargs.get('price')
-
-        # Store the order
-        self.orders[order_id] = {
-            'symbol': symbol,
-            'side': side,
-            'quantity': quantity,
-            'price': price,
-            'status': 'FILLED',  # Simplified - assuming immediate fill
-            'filled_quantity': quantity,
-            'average_price': price
-        }
+    async def submit_orders(self, batch: OrderBatch) -> List[Order]:
+        """Submit a decoded order batch, returning the orders (accepted or rejected) in request order"""
+        orders, fills = self.order_manager.submit_orders(batch)
+        for order in orders:
+            self._record_order(order)
 
-        # Update positions and cash
-        if side == OrderSide.BUY:
-            # Deduct cash
-            self.cash_balance -= quantity * price
+        # Update our portfolio for any immediate executions
+        self._apply_fills(fills)
+        self._commit()
+        return orders
 
-            # Update position
-            if symbol not in self.positions:
-                self.positions[symbol] = {
-                    'quantity': 0,
-                    'average_cost': 0
-                }
-
-            position = self.positions[symbol]
-            total_cost = position['average_cost'] * position['quantity']
-            new_quantity = position['quantity'] + quantity
-            new_total_cost = total_cost + (quantity * price)
-
-            position['quantity'] = new_quantity
-            position['average_cost'] = new_total_cost / new_quantity if new_quantity > 0 else 0
-
-        elif side == OrderSide.SELL:
-            # Add cash
-            self.cash_balance += quantity * price
-
-            # Update position
-            if symbol in self.positions:
-                position = self.positions[symbol]
-                position['quantity'] -= quantity
-
-                # Remove position if quantity is zero or negative
-                if position['quantity'] <= 0:
-                    del self.positions[symbol]
-
-    async def cancel_order(self, order_id: str) -> Dict[str, Any]:
-        """Cancel an existing order through the order manager"""
+    async def cancel_order(self, order_id: int) -> Dict[str, Any]:
+        """Cancel an existing order (by internal id) through the order manager"""
         try:
-            success = await self.order_manager.cancel_order(order_id)
+            success, error_message = self.order_manager.cancel_order(order_id)
 
             if success:
+                self._record_order(self.order_manager.orders[order_id])
+                self._commit()
                 return {'success': True}
             else:
-                return {'success': False, 'error_message': 'Order cancellation failed'}
+                return {'success': False, 'error_message': error_message or 'Order cancellation failed'}
 
         except Exception as e:
             logger.error(f"Order cancellation error: {e}")
             return {'success': False, 'error_message': str(e)}
 
-    def _update_portfolio_from_order(self, order):
-        """Update portfolio based on order execution"""
-        if order.side == OrderSide.BUY:
-            # Deduct cash
-            self.cash_balance -= order.filled_quantity * order.average_price
+    async def amend_order(
+            self,
+            order_id: int,
+            quantity: float = 0,
+            price: float = 0,
+            stop_price: float = 0
+    ) -> Dict[str, Any]:
+        """Amend an open order (by internal id) through the order manager; 0 leaves a field unchanged"""
+        try:
+            success, error_message, fills = self.order_manager.amend_order(order_id, quantity, price, stop_price)
+            if not success:
+                return {'success': False, 'error_message': error_message or 'Order amendment failed'}
 
-            # Update position
-            if order.symbol not in self.positions:
-                self.positions[order.symbol] = {
-                    'quantity': 0,
-                    'average_cost': 0
-                }
+            self._record_order(self.order_manager.orders[order_id])
+            # An amend through the last price can execute straight away
+            self._apply_fills(fills)
+            self._commit()
+            return {'success': True}
 
-            position = self.positions[order.symbol]
-            total_cost = position['average_cost'] * position['quantity']
-            new_quantity = position['quantity'] + order.filled_quantity
-            new_total_cost = total_cost + (order.filled_quantity * order.average_price)
+        except Exception as e:
+            logger.error(f"Order amendment error: {e}")
+            return {'success': False, 'error_message': str(e)}
 
-            position['quantity'] = new_quantity
-            position['average_cost'] = new_total_cost / new_quantity if new_quantity > 0 else 0
+    async def update_symbols(self, add_symbols: List[str] = (), remove_symbols: List[str] = ()) -> Dict[str, Any]:
+        """
+        Start or stop trading symbols while running
+
+        Added symbols are subscribed to on the shared market data stream and
+        primed with their latest bar; their books and position slots are
+        created on first use. A symbol can only be removed while it has no
+        open orders and no position. Removing one drops its books and market
+        data, tells stream clients to forget it, and releases its market data
+        subscription. Nothing changes if any removal is refused.
+        """
+        add_symbols = [s for s in dict.fromkeys(add_symbols) if s and s not in self.symbols]
+        remove_symbols = [s for s in dict.fromkeys(remove_symbols) if s in self.symbols]
 
-        elif order.side == OrderSide.SELL:
-            # Add cash
-            self.cash_balance += order.filled_quantity * order.average_price
+        open_symbols = {order.symbol for order in self.order_manager.get_open_orders()}
+        refused = [s for s in remove_symbols if s in open_symbols or s in self.positions]
+        if refused:
+            return {
+                'success': False,
+                'error_message': f"Symbols with open orders or positions cannot be removed: {', '.join(refused)}",
+                'symbols': sorted(self.symbols)
+            }
 
-            # Update position
-            if order.symbol in self.positions:
-                position = self.positions[order.symbol]
-                position['quantity'] -= order.filled_quantity
+        if add_symbols:
+            self.symbols.update(add_symbols)
+            self._subscribed.update(add_symbols)
+            self.seed_market_data(await self.market_data_client.add_symbols(add_symbols))
+
+        if remove_symbols:
+            self.symbols.difference_update(remove_symbols)
+            for symbol in remove_symbols:
+                self.order_manager.drop_symbol(symbol)
+                self.risk.open_buys.pop(symbol, None)
+                self.risk.open_sells.pop(symbol, None)
+                if self.current_market_data.pop(symbol, None) is not None:
+                    self.changes.mark_market_data(symbol)
+            released = [s for s in remove_symbols if s in self._subscribed]
+            self._subscribed.difference_update(released)
+            await self.market_data_client.remove_symbols(released)
+
+        self._commit()
+        for listener in self.update_listeners:
+            listener()
+        logger.info(f"Symbols updated: +{add_symbols} -{remove_symbols}; trading {len(self.symbols)} symbols")
+        return {'success': True, 'symbols': sorted(self.symbols)}
+
+    def expire_orders(self) -> int:
+        """Expire the orders due by now and push them to the stream as one update"""
+        now = self.clock.now()
+        expired = self.order_manager.expire_orders(now)
+        if expired:
+            if self.recorder:
+                # Sweeps run on a timer, not on an input; replay repeats them from the recording
+                self.recorder.record_expire_orders(now)
+            for order in expired:
+                self._record_order(order)
+            self._commit()
+            for listener in self.update_listeners:
+                listener()
+            logger.info(f"Expired {len(expired)} orders")
+        return len(expired)
+
+    async def _expire_periodically(self):
+        interval = config.matching.expiry_resolution
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.expire_orders()
+            except Exception as e:
+                logger.error(f"Order expiry failed: {e}")
+
+    def attach_recorder(self, recorder):
+        """Record inbound market data, orders and expiry sweeps, and digest every fill"""
+        self.recorder = recorder
+        recorder.clock = self.clock
+        self.fill_listeners.append(recorder.observe_fills)
+
+    def checkpoint_version(self) -> int:
+        """Current state version, used to skip unchanged checkpoints"""
+        return self._commit()
+
+    def checkpoint_closed_orders(self) -> List[Tuple]:
+        """Closed orders not yet saved, for the checkpoint writer to append in its next batch"""
+        return self.order_manager.closed.take_unsaved()
+
+    def return_closed_orders(self, rows: List[Tuple]):
+        """Requeue closed orders the checkpoint writer failed to save"""
+        self.order_manager.closed.return_unsaved(rows)
+
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """Compact copy of the state needed to resume after a restart"""
+        open_orders = self.order_manager.dump_open_orders()
+        # Internal ids are reissued on restore; persist the client's ids
+        for order in open_orders:
+            order['order_id'] = self.order_ids.external(order['order_id'])
+
+        return {
+            'cash_balance': self.cash_balance,
+            'positions': self.positions.to_dict(),
+            'open_orders': open_orders
+        }
 
-                # Remove position if quantity is zero or negative
-                if position['quantity'] <= 0:
-                    del self.positions[order.symbol]
+    def initial_state(self) -> Dict[str, Any]:
+        """The checkpointed state plus the symbols and risk limits in effect, for a recording to start from"""
+        state = self.checkpoint_state()
+        state['symbols'] = sorted(self.symbols)
+        state['risk_limits'] = {
+            'max_position_size': self.risk.max_position_size,
+            'max_total_risk': self.risk.max_total_risk,
+            'check_buying_power': self.risk.check_buying_power
+        }
+        return state
+
+    def start_from(self, state: Dict[str, Any]):
+        """Take on a recording's initial state; the exchange must be trading its symbols already"""
+        limits = state.get('risk_limits', {})
+        self.risk.check_buying_power = limits.get('check_buying_power', self.risk.check_buying_power)
+        self.risk.set_limits(limits.get('max_position_size'), limits.get('max_total_risk'))
+        self._restore_state(state)
+
+    def _restore_state(self, historical_data: Dict[str, Any]):
+        """Restore cash, positions and open orders from a checkpoint"""
+        self.cash_balance = historical_data.get('cash_balance', self.initial_cash)
+        self.positions.load(historical_data.get('positions', {}))
+        self.mark_to_market.rebuild()
+
+        open_orders = historical_data.get('open_orders', [])
+        for order in open_orders:
+            order['order_id'] = self.order_ids.assign(order['order_id'])
+        for order in self.order_manager.restore_orders(open_orders):
+            self._record_order(order)
+
+        # Carry on from the checkpointed version so versions stay monotonic
+        self.changes.version = max(self.changes.version, historical_data.get('version', 0))
+        self._commit()
+
+        logger.info(f"Restored exchange state v{self.changes.version}: "
+                    f"{len(self.positions)} positions, {len(self.order_manager.get_open_orders())} open orders")
+
+    def _order_id_reusable(self, order_id: int) -> bool:
+        """Whether an order is done with, so a new order may take over its client id"""
+        order = self.order_manager.orders.get(order_id)
+        if order is not None:
+            return not order.is_open
+        # Neither open nor closed: issued earlier in the batch being decoded
+        return order_id in self.order_manager.closed
+
+    def get_last_price(self, symbol: str) -> float:
+        """Last close seen for a symbol, or 0 if none has arrived yet"""
+        return self.mark_to_market.get_price(symbol)
+
+    def _record_order(self, order: Order):
+        """Mark an order as changed so the next stream update carries it"""
+        self.changes.mark_order(order.order_id)
+        if not order.is_open:
+            self._closed_orders.append(order)
+
+    def _commit(self) -> int:
+        """
+        Retire the orders closed since the last commit, then commit the pending changes
 
-    def _calculate_total_portfolio_value(self, market_data: List[Dict]) -> float:
-        """Calculate total portfolio value"""
-        portfolio_value = self.cash_balance
+        Closed orders leave the open-order index for the closed buffer,
+        tagged with the version they close at. Orders the buffer evicts are
+        released from the id map, and subscribers that never saw them close
+        are sent back to a snapshot.
+        """
+        if self._closed_orders:
+            version = self.changes.version + 1  # the version the pending changes commit as
+            for order in self._closed_orders:
+                external_id = self.order_ids.external(order.order_id)
+                for order_id, closed_version in self.order_manager.retire(order, external_id, version):
+                    self.order_ids.release(order_id)
+                    self.changes.forget(closed_version)
+            self._closed_orders.clear()
+        return self.changes.commit()
+
+    def _apply_fills(self, fills: List[Fill]):
+        """Apply executions to cash and positions"""
+        if fills:
+            for fill in fills:
+                self.fill_sequence += 1
+                fill.sequence = self.fill_sequence
+            for listener in self.fill_listeners:
+                listener(fills)
+            self.risk.on_fills(fills)
+        for fill in fills:
+            self._apply_fill(fill)
+            self._record_order(self.order_manager.orders[fill.order_id])
+            if fill.remaining_quantity <= 0:
+                # Filled; drop its expiry timer now rather than when it comes due
+                self.order_manager.expiries.cancel(fill.order_id)
+
+    def _apply_fill(self, fill: Fill):
+        """Update portfolio based on a single execution"""
+        notional = fill.quantity * fill.price
+        self.changes.mark_position(fill.symbol)
+
+        position = self.positions.get(fill.symbol)
+        quantity = position['quantity'] if position else 0
+        average_cost = position['average_cost'] if position else 0
+
+        if fill.side == OrderSide.BUY:
+            # Deduct cash
+            self.cash_balance -= notional
 
-        for symbol, position in self.positions.items():
-            current_price = self._get_current_price(symbol, market_data)
-            portfolio_value += position['quantity'] * current_price
+            # Update position
+            new_quantity = quantity + fill.quantity
+            new_total_cost = average_cost * quantity + notional
+            average_cost = new_total_cost / new_quantity if new_quantity > 0 else 0
+            self.mark_to_market.update_position(fill.symbol, new_quantity, average_cost)
+
+        elif fill.side == OrderSide.SELL:
+            # Sells are checked against the position before they are accepted (see
+            # RiskEngine); should one still oversell, only the shares held are paid for
+            sold = min(fill.quantity, quantity)
+            if sold < fill.quantity:
+                logger.error(f"Sell fill of {fill.quantity} {fill.symbol} for order {fill.order_id} "
+                             f"exceeds the position of {quantity}; crediting {sold}")
 
-        return portfolio_value
+            # Add cash
+            self.cash_balance += sold * fill.price
 
-    def _get_current_price(
-            self,
-            symbol: str,
-            market_data: Optional[List[Dict]] = None
-    ) -> float:
-        """Get current market price for a symbol"""
-        if market_data:
-            price = next((md['close'] for md in market_data if md['symbol'] == symbol), 0)
-            return price
+            # Update position, removing it once sold out
+            if position:
+                self.mark_to_market.update_position(fill.symbol, quantity - sold, average_cost)
 
-        # Use cached market data if available
-        if symbol in self.current_market_data:
-            return self.current_market_data[symbol].get('close', 0)
+    def _calculate_total_portfolio_value(self) -> float:
+        """Calculate total portfolio value"""
+        return self.cash_balance + self.mark_to_market.positions_value
 
-        return 0  # No price data available
+    def _get_current_price(self, symbol: str) -> float:
+        """Get current market price for a symbol"""
+        return self.mark_to_market.get_price(symbol)
@@ -0,0 +1,41 @@
+# source/core/mark_to_market.py
+import logging
+
+from source.core.position_store import PositionStore
+
+logger = logging.getLogger('mark_to_market')
+
+
+class MarkToMarket:
+    """
+    Incremental valuation of the exchange portfolio.
+
+    Prices and quantities live in the position store; this keeps a running
+    total of position market value on top of it. A price or quantity change
+    adjusts the total by that symbol's own delta, so valuing the portfolio
+    after a bar costs O(changed symbols) rather than a rescan of every
+    position against every price.
+    """
+
+    def __init__(self, store: PositionStore):
+        self.store = store
+        self.positions_value = 0.0
+
+    def update_price(self, symbol: str, price: float):
+        self.positions_value += self.store.set_price(symbol, price)
+
+    def update_position(self, symbol: str, quantity: float, average_cost: float):
+        self.positions_value += self.store.set_position(symbol, quantity, average_cost)
+
+    def get_price(self, symbol: str) -> float:
+        slot = self.store.slots.get(symbol)
+        return float(self.store.last_price[slot]) if slot is not None else 0.0
+
+    def market_value(self, symbol: str) -> float:
+        slot = self.store.slots.get(symbol)
+        return float(self.store.market_value[slot]) if slot is not None else 0.0
+
+    def rebuild(self):
+        """Recompute the running total from scratch, discarding accumulated rounding"""
+        self.store.revalue()
+        self.positions_value = self.store.positions_value()
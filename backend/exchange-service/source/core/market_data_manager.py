@@ -1,18 +1,49 @@
 # source/core/market_data_client.py
 import asyncio
 import logging
+import time
 import grpc
 from typing import Dict, List, Any, Optional, Callable
 
-from source.api.grpc.market_exchange_interface_pb2 import SubscriptionRequest
+from source.api.grpc.market_exchange_interface_pb2 import BackfillRequest, SubscriptionRequest, SubscriptionUpdate
 from source.api.grpc.market_exchange_interface_pb2_grpc import MarketDataServiceStub
 from source.config import config
+from source.utils.metrics import track_market_data_gap, track_stage_latency
 
 logger = logging.getLogger('market_data_client')
 
+
+def convert_market_data_update(update) -> List[Dict[str, Any]]:
+    """Convert a MarketDataUpdate message to the exchange's market data dicts"""
+    return [
+        {
+            'symbol': data.symbol,
+            'open': data.open,
+            'high': data.high,
+            'low': data.low,
+            'close': data.close,
+            'volume': data.volume,
+            'trade_count': data.trade_count,
+            'vwap': data.vwap
+        }
+        for data in update.data
+    ]
+
+
 class MarketDataClient:
     """
     Client for connecting to the market data service and receiving market data updates.
+
+    Updates carry a per-feed sequence number. The client remembers the last
+    one it applied, resubscribes from there after a reconnect, and if the
+    stream still skips ahead it backfills the missing range before applying
+    the newer update, so every bar reaches the exchange once and in order.
+    A new feed id (the service restarted) starts over from its snapshot.
+
+    Symbols are reference counted, since tenants share one client: adding
+    a symbol nobody holds, or removing the last hold on one, changes the
+    open stream's subscription in place with UpdateSubscription. A
+    reconnect subscribes to the current symbol list.
     """
     
     def __init__(self, exchange_manager, symbols=None):
@@ -24,7 +55,9 @@ class MarketDataClient:
             symbols: List of symbols to subscribe to (optional)
         """
         self.exchange_manager = exchange_manager
-        self.symbols = symbols or config.simulator.default_symbols
+        self.symbols = list(symbols or config.simulator.default_symbols)
+        # symbol -> holders; the initial symbols are held by whoever created the client
+        self.symbol_refs: Dict[str, int] = {symbol: 1 for symbol in self.symbols}
         self.market_data_service_url = config.market_data.service_url
         self.channel = None
         self.stub = None
@@ -32,6 +65,10 @@ class MarketDataClient:
         self.subscription_task = None
         self.running = False
         self.subscriber_id = f"exchange-simulator-{config.simulator.user_id}"
+
+        # Position in the market data feed
+        self.feed_id = ''
+        self.last_sequence = 0
         
         logger.info(f"Market data client initialized with service URL: {self.market_data_service_url}")
     
@@ -71,6 +108,63 @@ class MarketDataClient:
         
         logger.info("Market data client stopped")
     
+    async def add_symbols(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """
+        Hold symbols, subscribing to those nobody held yet
+
+        Returns:
+            The latest bar of each newly subscribed symbol the service knows
+        """
+        added = []
+        for symbol in symbols:
+            holders = self.symbol_refs.get(symbol, 0)
+            self.symbol_refs[symbol] = holders + 1
+            if holders == 0:
+                added.append(symbol)
+        if not added:
+            return []
+
+        self.symbols.extend(added)
+        response = await self._update_subscription(add_symbols=added)
+        return convert_market_data_update(response) if response else []
+
+    async def remove_symbols(self, symbols: List[str]):
+        """Release symbols, unsubscribing from those nobody holds any more"""
+        removed = []
+        for symbol in symbols:
+            holders = self.symbol_refs.get(symbol, 0)
+            if holders > 1:
+                self.symbol_refs[symbol] = holders - 1
+            elif holders == 1:
+                del self.symbol_refs[symbol]
+                removed.append(symbol)
+        if not removed:
+            return
+
+        self.symbols = [symbol for symbol in self.symbols if symbol in self.symbol_refs]
+        await self._update_subscription(remove_symbols=removed)
+
+    async def _update_subscription(self, add_symbols: List[str] = (), remove_symbols: List[str] = ()):
+        """Change the open stream's symbols; with no stream, the next subscription carries them"""
+        if self.stub is None:
+            return None
+        try:
+            response = await self.stub.UpdateSubscription(SubscriptionUpdate(
+                subscriber_id=self.subscriber_id,
+                add_symbols=add_symbols,
+                remove_symbols=remove_symbols
+            ), timeout=10)
+        except grpc.aio.AioRpcError as e:
+            logger.error(f"Failed to update market data subscription ({e.code()}): {e.details()}")
+            return None
+
+        if not response.success:
+            # Not subscribed right now; the resubscribe names the new symbols
+            logger.warning(f"Market data subscription not updated: {response.error_message}")
+            return None
+        logger.info(f"Market data subscription updated: +{list(add_symbols)} -{list(remove_symbols)}")
+        return response
+
     async def _subscribe_to_market_data(self):
         """Subscribe to market data updates from the service"""
         retry_count = 0
@@ -85,39 +179,28 @@ class MarketDataClient:
                 self.channel = grpc.aio.insecure_channel(self.market_data_service_url)
                 self.stub = MarketDataServiceStub(self.channel)
                 
-                # Create a subscription request
+                # Create a subscription request, resuming after the last update applied
                 request = SubscriptionRequest(
                     subscriber_id=self.subscriber_id,
-                    symbols=self.symbols
+                    symbols=self.symbols,
+                    from_sequence=self.last_sequence,
+                    feed_id=self.feed_id
                 )
                 
                 # Start the subscription
                 subscription_stream = self.stub.SubscribeMarketData(request)
                 
-                logger.info(f"Subscribed to market data for symbols: {self.symbols}")
+                if self.last_sequence:
+                    logger.info(f"Resubscribed to market data after sequence {self.last_sequence}")
+                else:
+                    logger.info(f"Subscribed to market data for symbols: {self.symbols}")
                 
                 # Process incoming market data updates
                 async for update in subscription_stream:
                     if not self.running:
                         break
-                    
-                    # Convert gRPC format to internal format
-                    market_data = []
-                    for data in update.data:
-                        market_data.append({
-                            'symbol': data.symbol,
-                            'open': data.open,
-                            'high': data.high,
-                            'low': data.low,
-                            'close': data.close,
-                            'volume': data.volume,
-                            'trade_count': data.trade_count,
-                            'vwap': data.vwap
-                        })
-                    
-                    # Forward the market data to the exchange manager
-                    await self.exchange_manager.update_market_data(market_data)
-                    logger.debug(f"Received market data for {len(market_data)} symbols")
+
+                    await self._handle_update(update)
                     
                     # Reset retry count on successful update
                     retry_count = 0
@@ -148,4 +231,57 @@ class MarketDataClient:
                     self.channel = None
                     self.stub = None
         
-        logger.info("Market data subscription task ended")
\ No newline at end of file
+        logger.info("Market data subscription task ended")
+
+    async def _handle_update(self, update):
+        """Apply a streamed update in feed order, backfilling any gap before it"""
+        if update.feed_id != self.feed_id:
+            if self.feed_id:
+                logger.warning(f"Market data feed changed from {self.feed_id} to {update.feed_id}; "
+                               f"starting over from its snapshot")
+            self.feed_id = update.feed_id
+        elif update.sequence and update.sequence <= self.last_sequence:
+            # Already applied, e.g. replayed after a reconnect
+            return
+        elif update.sequence > self.last_sequence + 1 and self.last_sequence:
+            await self._backfill(update.sequence - 1)
+
+        await self._apply_update(update)
+        if update.sequence:
+            self.last_sequence = update.sequence
+
+    async def _backfill(self, to_sequence: int):
+        """Fetch and apply the updates after last_sequence up to to_sequence"""
+        missing = to_sequence - self.last_sequence
+        logger.warning(f"Market data gap: missed sequences {self.last_sequence + 1} to {to_sequence}; backfilling")
+
+        response = await self.stub.BackfillMarketData(BackfillRequest(
+            subscriber_id=self.subscriber_id,
+            feed_id=self.feed_id,
+            from_sequence=self.last_sequence,
+            to_sequence=to_sequence
+        ))
+        for update in response.updates:
+            await self._apply_update(update)
+            self.last_sequence = update.sequence
+
+        recovered = len(response.updates)
+        track_market_data_gap(recovered, missing - recovered)
+        if recovered < missing:
+            logger.error(f"Could not backfill {missing - recovered} market data updates; "
+                         f"the service only retains from sequence {response.first_sequence}")
+
+    async def _apply_update(self, update):
+        # Publication to receipt; compares the two hosts' wall clocks
+        track_stage_latency('receive', max(time.time() - update.timestamp / 1000, 0.0))
+
+        recorder = self.exchange_manager.recorder
+        if recorder:
+            recorder.record_market_data(update)
+
+        # Convert gRPC format to internal format
+        market_data = convert_market_data_update(update)
+
+        # Forward the market data to the exchange manager
+        await self.exchange_manager.update_market_data(market_data, origin_timestamp=update.timestamp)
+        logger.debug(f"Received market data update {update.sequence} for {len(market_data)} symbols")
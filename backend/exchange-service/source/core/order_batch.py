@@ -0,0 +1,197 @@
+# source/core/order_batch.py
+from sys import intern
+from typing import List, Optional
+
+import numpy as np
+
+# Wire values of order_exchange.OrderRequest side, type and time in force
+BUY, SELL = 0, 1
+MARKET, LIMIT, STOP, STOP_LIMIT, TRAILING_STOP = 0, 1, 2, 3, 4
+GTC, DAY, IOC, FOK, GTD = 0, 1, 2, 3, 4
+
+# Rejection codes; 0 means the order passed every check
+ACCEPTED = 0
+MISSING_SYMBOL = 1
+BAD_QUANTITY = 2
+BAD_LIMIT_PRICE = 3
+QUANTITY_LIMIT = 4
+NOTIONAL_LIMIT = 5
+BUYING_POWER = 6
+POSITION_LIMIT = 7
+TOTAL_RISK_LIMIT = 8
+BAD_ORDER_TYPE = 9
+BAD_STOP_PRICE = 10
+BAD_TRAIL = 11
+BAD_TIME_IN_FORCE = 12
+BAD_EXPIRE_TIME = 13
+UNPRICED = 14
+DUPLICATE_ORDER_ID = 15
+BAD_SIDE = 16
+INSUFFICIENT_POSITION = 17
+
+REJECT_REASONS = {
+    MISSING_SYMBOL: "Symbol is required",
+    BAD_QUANTITY: "Quantity must be positive",
+    BAD_LIMIT_PRICE: "Limit orders require a positive price",
+    QUANTITY_LIMIT: "Quantity exceeds the maximum order size",
+    NOTIONAL_LIMIT: "Notional exceeds the maximum order value",
+    BUYING_POWER: "Insufficient buying power",
+    POSITION_LIMIT: "Order would exceed the book's maximum position size",
+    TOTAL_RISK_LIMIT: "Order would exceed the book's maximum total risk",
+    BAD_ORDER_TYPE: "Unsupported order type",
+    BAD_STOP_PRICE: "Stop orders require a positive stop price",
+    BAD_TRAIL: "Trailing stops require a positive trail amount",
+    BAD_TIME_IN_FORCE: "Unsupported time in force",
+    BAD_EXPIRE_TIME: "GTD orders require an expire time in the future",
+    UNPRICED: "No market price yet to value the order at",
+    DUPLICATE_ORDER_ID: "An open order already has this id",
+    BAD_SIDE: "Unsupported order side",
+    INSUFFICIENT_POSITION: "Sell exceeds the position not already committed to open sells",
+}
+
+
+def _enum_column(values: np.ndarray, low: int, high: int) -> np.ndarray:
+    """Enum values as int8, with anything outside [low, high] as -1 rather than wrapped into range"""
+    return np.where((values >= low) & (values <= high), values, -1).astype(np.int8)
+
+
+class OrderBatch:
+    """
+    A BatchOrderRequest decoded into column arrays.
+
+    The request is walked once; after that validation, risk limits and the
+    marketability test run as NumPy expressions over the whole batch, and
+    only the per-order objects themselves are built in Python. Symbols are
+    interned to integer codes so per-symbol lookups (last price, book) happen
+    once per distinct symbol rather than once per order.
+    """
+
+    def __init__(
+            self,
+            order_ids: np.ndarray,
+            symbols: List[str],
+            sides: np.ndarray,
+            types: np.ndarray,
+            quantities: np.ndarray,
+            prices: np.ndarray,
+            stop_prices: Optional[np.ndarray] = None,
+            trail_amounts: Optional[np.ndarray] = None,
+            time_in_force: Optional[np.ndarray] = None,
+            expire_times: Optional[np.ndarray] = None
+    ):
+        self.order_ids = order_ids
+        self.symbols = symbols
+        self.sides = sides
+        self.types = types
+        self.quantities = quantities
+        self.prices = prices
+        self.stop_prices = stop_prices if stop_prices is not None else np.zeros(len(symbols))
+        self.trail_amounts = trail_amounts if trail_amounts is not None else np.zeros(len(symbols))
+        self.time_in_force = time_in_force if time_in_force is not None else np.zeros(len(symbols), dtype=np.int8)
+        # GTD expiry, epoch ms
+        self.expire_times = expire_times if expire_times is not None else np.zeros(len(symbols))
+
+        # Distinct symbols and each order's index into them
+        codes = {}
+        self.symbol_codes = np.fromiter(
+            (codes.setdefault(symbol, len(codes)) for symbol in symbols), dtype=np.int32, count=len(symbols))
+        self.unique_symbols = list(codes)
+
+        self.reasons = np.zeros(len(symbols), dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_request(cls, request, id_map) -> 'OrderBatch':
+        """
+        Decode a BatchOrderRequest, issuing internal order ids from id_map
+
+        Request ids must already be assigned. Orders reusing the id of an
+        open order, or of an earlier order in the batch, are rejected.
+        """
+        orders = request.orders
+        order_ids = np.array(id_map.assign_many(order.request_id for order in orders), dtype=np.int64)
+        symbols = [intern(order.symbol) for order in orders]
+        rows = np.array(
+            [(order.side, order.type, order.quantity, order.price, order.stop_price, order.trail_amount,
+              order.time_in_force, order.expire_time)
+             for order in orders],
+            dtype=np.float64
+        ).reshape(len(orders), 8)
+
+        batch = cls(
+            order_ids=order_ids,
+            symbols=symbols,
+            sides=_enum_column(rows[:, 0], BUY, SELL),
+            types=_enum_column(rows[:, 1], MARKET, TRAILING_STOP),
+            quantities=rows[:, 2].copy(),
+            prices=rows[:, 3].copy(),
+            stop_prices=rows[:, 4].copy(),
+            trail_amounts=rows[:, 5].copy(),
+            time_in_force=_enum_column(rows[:, 6], GTC, GTD),
+            expire_times=rows[:, 7].copy()
+        )
+        bound = np.fromiter((id_map.is_bound(order_id) for order_id in order_ids.tolist()),
+                            dtype=bool, count=len(orders))
+        batch._reject(~bound, DUPLICATE_ORDER_ID)
+        return batch
+
+    @property
+    def accepted(self) -> np.ndarray:
+        return self.reasons == ACCEPTED
+
+    @property
+    def has_limit_price(self) -> np.ndarray:
+        return (self.types == LIMIT) | (self.types == STOP_LIMIT)
+
+    @property
+    def conditional(self) -> np.ndarray:
+        """Orders that wait for a trigger rather than trading now"""
+        return self.types >= STOP
+
+    def validate(self, now: float = 0):
+        """Reject malformed orders; now (epoch seconds) is the earliest a GTD order may expire"""
+        missing_symbol = np.fromiter((not symbol for symbol in self.symbols), dtype=bool, count=len(self))
+        self._reject(missing_symbol, MISSING_SYMBOL)
+        self._reject((self.sides != BUY) & (self.sides != SELL), BAD_SIDE)
+        self._reject((self.types < MARKET) | (self.types > TRAILING_STOP), BAD_ORDER_TYPE)
+        self._reject(~(self.quantities > 0) | ~np.isfinite(self.quantities), BAD_QUANTITY)
+        self._reject(self.has_limit_price & ~(self.prices > 0), BAD_LIMIT_PRICE)
+        self._reject(((self.types == STOP) | (self.types == STOP_LIMIT)) & ~(self.stop_prices > 0), BAD_STOP_PRICE)
+        self._reject((self.types == TRAILING_STOP) & ~(self.trail_amounts > 0), BAD_TRAIL)
+        self._reject((self.time_in_force < GTC) | (self.time_in_force > GTD), BAD_TIME_IN_FORCE)
+        self._reject((self.time_in_force == GTD) & ~(self.expire_times > now * 1000), BAD_EXPIRE_TIME)
+
+    def check_limits(self, last_prices: np.ndarray, max_quantity: float = 0, max_notional: float = 0):
+        """
+        Reject orders over the per-order size limits; a limit of 0 is off
+
+        Orders are valued at reference_prices.
+        """
+        if max_quantity > 0:
+            self._reject(self.quantities > max_quantity, QUANTITY_LIMIT)
+        if max_notional > 0:
+            self._reject(self.quantities * self.reference_prices(last_prices) > max_notional, NOTIONAL_LIMIT)
+
+    def reference_prices(self, last_prices: np.ndarray) -> np.ndarray:
+        """Price each order is valued at: its limit, else its stop, else the symbol's last price"""
+        reference = np.where(self.types == STOP, self.stop_prices, last_prices[self.symbol_codes])
+        return np.where(self.has_limit_price, self.prices, reference)
+
+    def marketable(self, last_prices: np.ndarray) -> np.ndarray:
+        """Accepted orders that execute immediately at the symbol's last price"""
+        last = last_prices[self.symbol_codes]
+        crosses = (
+            (self.types == MARKET)
+            | ((self.sides == BUY) & (self.prices >= last))
+            | ((self.sides == SELL) & (self.prices <= last))
+        )
+        return self.accepted & ~self.conditional & (last > 0) & crosses
+
+    def error_message(self, index: int) -> Optional[str]:
+        return REJECT_REASONS.get(int(self.reasons[index]))
+
+    def _reject(self, mask: np.ndarray, reason: int):
+        # Keep the first failing check's reason
+        self.reasons[mask & (self.reasons == ACCEPTED)] = reason
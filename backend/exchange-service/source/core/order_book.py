@@ -0,0 +1,138 @@
+# source/core/order_book.py
+import heapq
+import logging
+import math
+from typing import Dict, Iterable, List, Optional
+
+from source.models.enums import OrderSide
+from source.models.order import Order, Fill
+
+logger = logging.getLogger('order_book')
+
+
+class OrderBook:
+    """
+    Resting limit orders for a single symbol in price-time priority.
+
+    Each side keeps a FIFO list per price level and a heap of level prices,
+    so the best level is found in O(log n) and a bar only touches the levels
+    it actually crosses. Cancels are lazy: the order manager closes the
+    order and the book skips it when its level is next visited. Orders are
+    not indexed by id here; the order manager's index is the only one.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.resting = 0  # live orders in the book
+        self.bids: Dict[float, List[Order]] = {}
+        self.asks: Dict[float, List[Order]] = {}
+        self._bid_prices: List[float] = []  # max-heap (negated prices)
+        self._ask_prices: List[float] = []  # min-heap
+
+    def __len__(self) -> int:
+        return self.resting
+
+    def add(self, order: Order):
+        """Rest a limit order at the back of its price level"""
+        self.add_many((order,))
+
+    def add_many(self, orders: Iterable[Order]):
+        """Rest a batch of limit orders in order, pushing each new price level once"""
+        for order in orders:
+            price = order.price
+            if order.side == OrderSide.BUY:
+                levels, heap, key = self.bids, self._bid_prices, -price
+            else:
+                levels, heap, key = self.asks, self._ask_prices, price
+
+            level = levels.get(price)
+            if level is None:
+                level = levels[price] = [order]
+                heapq.heappush(heap, key)
+            else:
+                level.append(order)
+            self.resting += 1
+
+    def cancel(self, order: Order):
+        """Account for a resting order the caller is about to close"""
+        if order.is_open:
+            self.resting -= 1
+
+    def best_bid(self) -> Optional[float]:
+        return self._best(self.bids, self._bid_prices, sign=-1)
+
+    def best_ask(self) -> Optional[float]:
+        return self._best(self.asks, self._ask_prices, sign=1)
+
+    def match(self, bar: Dict, timestamp: float, liquidity: Optional[List[float]] = None) -> List[Fill]:
+        """
+        Cross the book against a market-data bar.
+
+        Bids at or above the bar low and asks at or below the bar high are
+        filled in price-time priority, at the limit price or at the open when
+        the bar gapped through the level. liquidity is the [buy, sell]
+        quantity the bar can still fill and is drawn down in place; once a
+        side runs dry the order at the front of the queue is left partially
+        filled. None means unlimited.
+        """
+        fills = []
+        low, high, bar_open = bar.get('low', 0), bar.get('high', 0), bar.get('open', 0)
+        if liquidity is None:
+            liquidity = [math.inf, math.inf]
+
+        if low > 0:
+            while liquidity[0] > 0:
+                price = self.best_bid()
+                if price is None or price < low:
+                    break
+                fill_price = min(price, bar_open) if bar_open > 0 else price
+                liquidity[0] = self._fill_level(self.bids[price], fill_price, timestamp, liquidity[0], fills)
+
+        if high > 0:
+            while liquidity[1] > 0:
+                price = self.best_ask()
+                if price is None or price > high:
+                    break
+                fill_price = max(price, bar_open) if bar_open > 0 else price
+                liquidity[1] = self._fill_level(self.asks[price], fill_price, timestamp, liquidity[1], fills)
+
+        return fills
+
+    def _best(self, levels: Dict[float, List[Order]], heap: List[float], sign: int) -> Optional[float]:
+        """Peek the best live price level, discarding levels emptied by cancels"""
+        while heap:
+            price = heap[0] * sign
+            level = levels[price]
+            for i, order in enumerate(level):
+                if order.is_open:
+                    if i:
+                        del level[:i]
+                    return price
+            heapq.heappop(heap)
+            del levels[price]
+        return None
+
+    def _fill_level(self, level: List[Order], fill_price: float, timestamp: float,
+                    available: float, fills: List[Fill]) -> float:
+        """Fill live orders at a price level in time priority, returning the liquidity left"""
+        for order in level:
+            if available <= 0:
+                break
+            if not order.is_open:
+                continue
+            quantity = min(order.remaining_quantity, available)
+            available -= quantity
+            order.update(quantity, fill_price, timestamp)
+            if not order.is_open:
+                self.resting -= 1
+            fills.append(Fill(
+                order_id=order.order_id,
+                symbol=order.symbol,
+                side=order.side,
+                quantity=quantity,
+                price=fill_price,
+                timestamp=timestamp,
+                remaining_quantity=order.remaining_quantity
+            ))
+        # Filled orders are trimmed from the level by _best
+        return available
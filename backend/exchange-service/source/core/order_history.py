@@ -0,0 +1,85 @@
+# source/core/order_history.py
+import logging
+from collections import OrderedDict, deque
+from typing import Deque, Iterator, List, Optional, Tuple
+
+from source.models.order import Order
+
+logger = logging.getLogger('order_history')
+
+# (order id, symbol, side, type, status, quantity, price, filled quantity,
+#  average price, error message, created at, closed at)
+ClosedOrderRow = Tuple
+
+
+class ClosedOrders:
+    """
+    Bounded buffer of the most recently closed orders.
+
+    Filled, canceled, expired and rejected orders leave the order manager's
+    open-order index for this buffer, where cancels, amends and stream
+    snapshots can still see them until newer closings push them out. Once
+    the buffer is at capacity each new closing evicts the oldest, so memory
+    and snapshot size stay put however long the session runs.
+
+    Every closed order is also queued as a row for the checkpoint writer to
+    save with its next batch. That queue is bounded as well; if the database
+    stays unreachable long enough, the oldest unsaved rows are dropped.
+    """
+
+    def __init__(self, capacity: int = 1000, persist: bool = True, max_unsaved: int = 100_000):
+        self.capacity = capacity
+        self.persist = persist
+        # order id -> (order, version it closed at), oldest first
+        self.orders: 'OrderedDict[int, Tuple[Order, int]]' = OrderedDict()
+        self.unsaved: Deque[ClosedOrderRow] = deque(maxlen=max_unsaved)
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self.orders
+
+    def __iter__(self) -> Iterator[Order]:
+        for order, _ in self.orders.values():
+            yield order
+
+    def get(self, order_id: int) -> Optional[Order]:
+        entry = self.orders.get(order_id)
+        return entry[0] if entry else None
+
+    def add(self, order: Order, external_id: str, version: int) -> List[Tuple[int, int]]:
+        """Add a closed order, returning (order id, close version) of each order evicted to make room"""
+        self.orders[order.order_id] = (order, version)
+        if self.persist:
+            if len(self.unsaved) == self.unsaved.maxlen:
+                self.dropped += 1
+            self.unsaved.append((
+                external_id, order.symbol, order.side.value, order.order_type.value, order.status.value,
+                order.quantity, order.price, order.filled_quantity, order.average_price,
+                order.error_message, order.created_at, order.updated_at
+            ))
+
+        evicted = []
+        while len(self.orders) > self.capacity:
+            order_id, (_, closed_version) = self.orders.popitem(last=False)
+            evicted.append((order_id, closed_version))
+        return evicted
+
+    def take_unsaved(self) -> List[ClosedOrderRow]:
+        """Hand the queued rows to the writer"""
+        rows = list(self.unsaved)
+        self.unsaved.clear()
+        return rows
+
+    def return_unsaved(self, rows: List[ClosedOrderRow]):
+        """Put back rows that failed to save, ahead of any queued since"""
+        newer = list(self.unsaved)
+        overflow = len(rows) + len(newer) - self.unsaved.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+            logger.warning(f"Closed order queue full; dropping {overflow} unsaved orders")
+        self.unsaved.clear()
+        self.unsaved.extend(rows)
+        self.unsaved.extend(newer)
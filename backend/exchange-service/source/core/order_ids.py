@@ -0,0 +1,63 @@
+# source/core/order_ids.py
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class OrderIdMap:
+    """
+    Translates client order ids to the exchange's internal order ids.
+
+    Inside the exchange an order is identified by a monotonic 64-bit
+    integer; the client's id (usually a uuid string from the order service)
+    is only needed where requests come in and updates go out. Both
+    directions are dicts holding only the orders not yet released, so the
+    map stays as small as the open orders and the closed-order buffer.
+
+    Re-submitting a client id maps it to the new order once the old one is
+    done with (reusable). While the old order still works, the new one is
+    issued an id that maps back to the client id but is not bound to it;
+    is_bound tells the caller to reject it as a duplicate.
+    """
+
+    def __init__(self, reusable: Optional[Callable[[int], bool]] = None):
+        self._internal: Dict[str, int] = {}
+        self._external: Dict[int, str] = {}
+        self._next_id = 1  # id 0 is never issued
+        # Whether an order's client id may move to a new order; any order's may if unset
+        self._reusable = reusable
+
+    def __len__(self) -> int:
+        return len(self._internal)
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
+
+    def assign(self, external_id: str) -> int:
+        """Issue the next internal id for a client order id"""
+        order_id = self._next_id
+        self._next_id += 1
+        self._external[order_id] = external_id
+        current = self._internal.get(external_id)
+        if current is None or self._reusable is None or self._reusable(current):
+            self._internal[external_id] = order_id
+        return order_id
+
+    def assign_many(self, external_ids: Iterable[str]) -> List[int]:
+        return [self.assign(external_id) for external_id in external_ids]
+
+    def is_bound(self, order_id: int) -> bool:
+        """Whether the order's client id refers to it, rather than to an earlier order still working"""
+        external_id = self._external.get(order_id)
+        return external_id is not None and self._internal.get(external_id) == order_id
+
+    def internal(self, external_id: str) -> Optional[int]:
+        return self._internal.get(external_id)
+
+    def external(self, order_id: int) -> Optional[str]:
+        return self._external.get(order_id)
+
+    def release(self, order_id: int):
+        """Forget an order's client id; later requests with it find no order"""
+        external_id = self._external.pop(order_id, None)
+        if external_id is not None and self._internal.get(external_id) == order_id:
+            del self._internal[external_id]
@@ -1,152 +1,704 @@
 # source/core/order_manager.py
 import logging
-import grpc
-from typing import Dict, List, Optional
+import math
+import time
+from dataclasses import replace
+from sys import intern
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
-from source.models.order import Order
-from source.models.enums import OrderSide, OrderType, OrderStatus
-from source.api.grpc.order_exchange_interface_pb2 import BatchOrderRequest, BatchCancelRequest, OrderRequest
-from source.api.grpc.order_exchange_interface_pb2_grpc import OrderExchangeSimulatorStub
 from source.config import config
+from source.models.order import Order, Fill
+from source.models.enums import OrderSide, OrderType, OrderStatus, TimeInForce
+from source.core.order_batch import (
+    OrderBatch, BUY, MARKET, LIMIT, STOP, STOP_LIMIT, TRAILING_STOP, GTC, DAY, IOC, FOK, GTD,
+    QUANTITY_LIMIT, NOTIONAL_LIMIT, REJECT_REASONS
+)
+from source.core.order_book import OrderBook
+from source.core.order_history import ClosedOrders
+from source.core.timer_wheel import TimerWheel
+from source.core.trigger_book import TriggerBook
+from source.utils.metrics import track_orders_expired
 
 logger = logging.getLogger('order_manager')
 
+# OrderBatch type codes
+ORDER_TYPES = {
+    MARKET: OrderType.MARKET,
+    LIMIT: OrderType.LIMIT,
+    STOP: OrderType.STOP,
+    STOP_LIMIT: OrderType.STOP_LIMIT,
+    TRAILING_STOP: OrderType.TRAILING_STOP,
+}
+
+CONDITIONAL_TYPES = (OrderType.STOP, OrderType.STOP_LIMIT, OrderType.TRAILING_STOP)
+
+# OrderBatch time in force codes
+TIMES_IN_FORCE = {
+    GTC: TimeInForce.GTC,
+    DAY: TimeInForce.DAY,
+    IOC: TimeInForce.IOC,
+    FOK: TimeInForce.FOK,
+    GTD: TimeInForce.GTD,
+}
+
+# Orders that never rest: whatever does not execute on arrival expires
+IMMEDIATE = (TimeInForce.IOC, TimeInForce.FOK)
+
+
 class OrderManager:
+    """
+    Order lifecycle for the simulated exchange.
+
+    Keeps one resting limit-order book per symbol. Market orders and
+    marketable limits execute against the last known close; everything else
+    rests until a market-data bar crosses it.
+
+    Each bar can only fill a share of its volume on each side (see
+    MatchingConfig). Executions draw that liquidity down until the next bar,
+    so large orders fill partially and keep working: a market order waits
+    for the next bar, a limit order rests for the remainder.
+
+    Stop, stop-limit and trailing-stop orders wait in a per-symbol
+    TriggerBook. A bar whose range reaches a stop turns the order into a
+    market order, executed at the stop (or the open if the bar gapped
+    through it), or into a limit order added to the book before the bar is
+    matched. A stop already crossed by the last price triggers on arrival.
+
+    IOC orders expire whatever does not execute on arrival (or, for a
+    conditional order, on triggering) and FOK orders expire unless the
+    whole quantity can execute then. DAY and GTD orders that are left
+    working get a timer in a hierarchical TimerWheel; expire_orders
+    collects the ones due without looking at any other order.
+
+    `orders` only indexes open orders. The exchange manager retires orders
+    that close into a bounded ClosedOrders buffer when it commits, so
+    nothing here grows with the number of orders the session has seen.
+    """
+
     def __init__(self, exchange_manager):
         self.exchange_manager = exchange_manager
-        self.orders: Dict[str, Order] = {}
-        self.order_service_url = config.order_exchange.service_url
-        self.channel = None
-        self.stub = None
-        self.connected = False
+        # Open orders by id; closed ones move to `closed` when retired
+        self.orders: Dict[int, Order] = {}
+        self.closed = ClosedOrders(config.order_history.buffer_size,
+                                   config.order_history.persist and config.checkpoint.enabled)
+        self.books: Dict[str, OrderBook] = {}
+        self.triggers: Dict[str, TriggerBook] = {}
+        # Market orders waiting for the next bar for their symbol
+        self.pending_market_orders: Dict[str, List[Order]] = {}
+        # symbol -> [buy, sell] quantity the current bar can still fill
+        self.liquidity: Dict[str, List[float]] = {}
+        # Expiry timers of working DAY and GTD orders, by order id
+        self.expiries = TimerWheel(exchange_manager.clock.now(), config.matching.expiry_resolution)
+        hours, minutes = config.matching.day_order_expiry_utc.split(':')
+        self.day_expiry = int(hours) * 3600 + int(minutes) * 60  # seconds after midnight UTC
 
     async def initialize(self):
-        """Initialize the order manager and connect to the order service"""
-        try:
-            # Connect to the order exchange service
-            self.channel = grpc.aio.insecure_channel(self.order_service_url)
-            self.stub = OrderExchangeSimulatorStub(self.channel)
-            self.connected = True
-            logger.info(f"Connected to order exchange service at {self.order_service_url}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to order exchange service: {e}")
-            self.connected = False
-            return False
+        """Initialize the order manager"""
+        logger.info("Order manager initialized")
+        return True
 
     async def cleanup(self):
         """Clean up resources"""
-        if self.channel:
-            await self.channel.close()
-            self.channel = None
-            self.stub = None
-            self.connected = False
-            logger.info("Disconnected from order exchange service")
-
-    async def submit_order(
+        self.books.clear()
+        self.triggers.clear()
+        self.pending_market_orders.clear()
+        self.liquidity.clear()
+
+    def drop_symbol(self, symbol: str):
+        """Free a symbol's per-symbol state once it has no open orders"""
+        self.books.pop(symbol, None)
+        self.triggers.pop(symbol, None)
+        self.pending_market_orders.pop(symbol, None)
+        self.liquidity.pop(symbol, None)
+
+    def get_book(self, symbol: str) -> OrderBook:
+        """Get the order book for a symbol, creating it on first use"""
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol)
+        return book
+
+    def get_triggers(self, symbol: str) -> TriggerBook:
+        """Get the trigger book for a symbol, creating it on first use"""
+        triggers = self.triggers.get(symbol)
+        if triggers is None:
+            triggers = self.triggers[symbol] = TriggerBook(symbol)
+        return triggers
+
+    def submit_order(
             self,
             symbol: str,
             side: OrderSide,
             quantity: float,
             order_type: OrderType,
-            price: Optional[float] = None
-    ) -> Order:
-        """Submit a new order through the order exchange service"""
+            price: Optional[float] = None,
+            order_id: int = 0,
+            stop_price: Optional[float] = None,
+            trail_amount: Optional[float] = None,
+            time_in_force: TimeInForce = TimeInForce.GTC,
+            expire_at: float = 0
+    ) -> Tuple[Order, List[Fill]]:
+        """Accept a new order, executing it immediately if it is marketable"""
+        now = self.exchange_manager.clock.now()
+        if time_in_force == TimeInForce.DAY:
+            expire_at = self.end_of_day(now)
+        elif time_in_force != TimeInForce.GTD:
+            expire_at = 0
         order = Order(
-            symbol=symbol,
+            symbol=intern(symbol),
             side=side,
             quantity=quantity,
             order_type=order_type,
-            price=price
+            price=price,
+            order_id=order_id,
+            created_at=now,
+            updated_at=now,
+            stop_price=stop_price,
+            trail_amount=trail_amount,
+            time_in_force=time_in_force,
+            expire_at=expire_at
         )
 
-        try:
-            if not self.connected:
-                success = await self.initialize()
-                if not success:
-                    order.status = OrderStatus.REJECTED
-                    order.error_message = "Order service unavailable"
-                    return order
+        risk = self.exchange_manager.risk
+        last_price = self.exchange_manager.get_last_price(symbol)
+        error = self._validate(order)
+        if not error:
+            if order_type in (OrderType.LIMIT, OrderType.STOP_LIMIT):
+                reference = price
+            elif order_type == OrderType.STOP:
+                reference = stop_price
+            else:
+                reference = last_price
+            error = risk.check_order(order.symbol, side, quantity, reference)
+        if error:
+            order.status = OrderStatus.REJECTED
+            order.error_message = error
+            logger.warning(f"Order {order.order_id} rejected: {error}")
+            self.orders[order.order_id] = order
+            return order, []
+
+        self.orders[order.order_id] = order
+        risk.on_accept(order)
+        fills = []
+
+        if order_type in CONDITIONAL_TYPES:
+            self._arm(order, last_price, now, fills)
+        else:
+            self._work(order, last_price, now, fills)
+        self._schedule_expiry(order)
 
-            # Convert to the appropriate enum values for gRPC
-            side_enum = 0 if side == OrderSide.BUY else 1
-            type_enum = 0 if order_type == OrderType.MARKET else 1
+        return order, fills
 
-            # Create the gRPC request
-            order_request = OrderRequest(
+    def submit_orders(self, batch: OrderBatch) -> Tuple[List[Order], List[Fill]]:
+        """
+        Accept a batch of orders, returning them in request order with any immediate fills
+
+        Validation, size limits, the pre-trade risk check and marketability
+        are evaluated for the whole batch at once. Marketable orders execute
+        at the last price as in submit_order, in request order while
+        liquidity lasts; the rest are added to their books one symbol at a
+        time, preserving request order within each book. IOC and FOK orders
+        take the single-order path, since they must not rest.
+        """
+        now = self.exchange_manager.clock.now()
+        last_prices = np.array(
+            [self.exchange_manager.get_last_price(symbol) for symbol in batch.unique_symbols], dtype=np.float64)
+
+        batch.validate(now)
+        batch.check_limits(last_prices, config.risk.max_order_quantity, config.risk.max_order_notional)
+        risk = self.exchange_manager.risk
+        risk.check_batch(batch, last_prices)
+        marketable = batch.marketable(last_prices).tolist()
+        fill_prices = last_prices.tolist()
+        accepted = batch.accepted.tolist()
+
+        is_buy = (batch.sides == BUY).tolist()
+        types = batch.types.tolist()
+        has_limit_price = batch.has_limit_price.tolist()
+        conditional = batch.conditional.tolist()
+        quantities = batch.quantities.tolist()
+        prices = batch.prices.tolist()
+        stop_prices = batch.stop_prices.tolist()
+        trail_amounts = batch.trail_amounts.tolist()
+        codes = batch.symbol_codes.tolist()
+        order_ids = batch.order_ids.tolist()
+        times_in_force = batch.time_in_force.tolist()
+        expire_times = batch.expire_times.tolist()
+        end_of_day = self.end_of_day(now)
+
+        orders: List[Order] = []
+        fills: List[Fill] = []
+        resting: Dict[int, List[Order]] = {}
+        rejected = 0
+
+        for i, symbol in enumerate(batch.symbols):
+            order_type = ORDER_TYPES.get(types[i], OrderType.MARKET)
+            time_in_force = TIMES_IN_FORCE.get(times_in_force[i], TimeInForce.GTC)
+            order = Order(
                 symbol=symbol,
-                side=side_enum,
-                quantity=float(quantity),
-                price=float(price) if price is not None else 0.0,
-                type=type_enum,
-                request_id=order.order_id
+                side=OrderSide.BUY if is_buy[i] else OrderSide.SELL,
+                quantity=quantities[i],
+                order_type=order_type,
+                price=prices[i] if has_limit_price[i] else None,
+                order_id=order_ids[i],
+                created_at=now,
+                updated_at=now,
+                time_in_force=time_in_force
             )
+            if time_in_force == TimeInForce.DAY:
+                order.expire_at = end_of_day
+            elif time_in_force == TimeInForce.GTD:
+                order.expire_at = expire_times[i] / 1000
+            if conditional[i]:
+                if order_type == OrderType.TRAILING_STOP:
+                    order.trail_amount = trail_amounts[i]
+                else:
+                    order.stop_price = stop_prices[i]
+            self.orders[order.order_id] = order
+            orders.append(order)
 
-            batch_request = BatchOrderRequest(
-                orders=[order_request]
-            )
+            if not accepted[i]:
+                order.status = OrderStatus.REJECTED
+                order.error_message = batch.error_message(i)
+                rejected += 1
+                continue
 
-            # Send the request
-            response = await self.stub.SubmitOrders(batch_request)
-
-            if response.success and len(response.results) > 0:
-                result = response.results[0]
-                if result.success:
-                    # Update the order with the response
-                    order.order_id = result.order_id
-                    order.status = OrderStatus.FILLED  # Simplified - assume immediate fill
-                    order.update(quantity, price or 0.0)
-                    logger.info(f"Order {order.order_id} submitted successfully")
-                else:
-                    # Handle failure
-                    order.status = OrderStatus.REJECTED
-                    order.error_message = result.error_message
-                    logger.warning(f"Order submission failed: {result.error_message}")
+            risk.on_accept(order)
+            if conditional[i]:
+                self._arm(order, fill_prices[codes[i]], now, fills)
+                self._schedule_expiry(order)
+                continue
+            if time_in_force in IMMEDIATE:
+                self._work(order, fill_prices[codes[i]], now, fills)
+                continue
+
+            if marketable[i]:
+                quantity = self._take_liquidity(symbol, order.side, order.quantity)
+                if quantity > 0:
+                    fills.append(self._execute(order, quantity, fill_prices[codes[i]], now))
+                    if not order.is_open:
+                        continue
+
+            if order_type == OrderType.LIMIT:
+                resting.setdefault(codes[i], []).append(order)
             else:
-                # Handle batch failure
-                order.status = OrderStatus.REJECTED
-                order.error_message = response.error_message
-                logger.warning(f"Order batch submission failed: {response.error_message}")
+                self.pending_market_orders.setdefault(symbol, []).append(order)
+            if order.expire_at:
+                self.expiries.schedule(order.order_id, order.expire_at)
 
-        except Exception as e:
-            order.status = OrderStatus.REJECTED
-            order.error_message = str(e)
-            logger.error(f"Error submitting order: {e}")
+        for code, symbol_orders in resting.items():
+            self.get_book(batch.unique_symbols[code]).add_many(symbol_orders)
 
-        # Store order
-        self.orders[order.order_id] = order
+        if rejected:
+            logger.warning(f"Rejected {rejected} of {len(orders)} orders in batch")
+        return orders, fills
+
+    def get_order(self, order_id: int) -> Optional[Order]:
+        """An open order, or a closed one still in the buffer"""
+        return self.orders.get(order_id) or self.closed.get(order_id)
+
+    def retire(self, order: Order, external_id: str, version: int) -> List[Tuple[int, int]]:
+        """
+        Move a closed order out of the open-order index into the closed buffer
+
+        Returns (order id, close version) of the orders the buffer evicted.
+        An order already retired, or replaced under its id by an amend, is
+        left alone.
+        """
+        if order.is_open or self.orders.get(order.order_id) is not order:
+            return []
+        del self.orders[order.order_id]
+        return self.closed.add(order, external_id, version)
+
+    def cancel_order(self, order_id: int) -> Tuple[bool, Optional[str]]:
+        """Cancel an open order, returning (success, error_message)"""
+        order = self.get_order(order_id)
+        if order is None:
+            return False, "Order not found"
+        if not order.is_open:
+            return False, f"Order is {order.status.value}"
+
+        pending = self.pending_market_orders.get(order.symbol)
+        if pending and order in pending:
+            pending.remove(order)
+        self._close(order, OrderStatus.CANCELED, self.exchange_manager.clock.now())
+        logger.info(f"Order {order_id} canceled")
+        return True, None
+
+    def amend_order(
+            self,
+            order_id: int,
+            quantity: float = 0,
+            price: float = 0,
+            stop_price: float = 0
+    ) -> Tuple[bool, Optional[str], List[Fill]]:
+        """
+        Change an open order in place, returning (success, error_message, fills)
 
-        return order
+        quantity is the new total including what has filled; 0 leaves a
+        field unchanged. Reducing the quantity keeps the order's place in
+        the queue. A new price or stop, or a larger quantity, sends a resting
+        or armed order to the back of its (new) level: the old entry is left
+        closed in its book, which skips it like any cancel, and a copy under
+        the same id is worked like a new order, so a limit amended through
+        the last price executes at once. Market and trailing-stop orders have
+        no price level and only change quantity, in place.
+        """
+        order = self.get_order(order_id)
+        if order is None:
+            return False, "Order not found", []
+        if not order.is_open:
+            return False, f"Order is {order.status.value}", []
 
-    async def cancel_order(self, order_id: str) -> bool:
-        """Cancel an existing order through the order exchange service"""
-        try:
-            if not self.connected:
-                success = await self.initialize()
-                if not success:
-                    return False
+        error = self._validate_amend(order, quantity, price, stop_price)
+        if error:
+            logger.warning(f"Amend of order {order_id} rejected: {error}")
+            return False, error, []
 
-            # Create the gRPC request
-            request = BatchCancelRequest(
-                order_ids=[order_id]
+        quantity = quantity or order.quantity
+        price = price or order.price
+        stop_price = stop_price or order.stop_price
+        risk = self.exchange_manager.risk
+        now = self.exchange_manager.clock.now()
+        fills = []
+
+        if order.order_type in (OrderType.MARKET, OrderType.TRAILING_STOP) or (
+                price == order.price and stop_price == order.stop_price and quantity <= order.quantity):
+            risk.on_cancel(order)
+            order.quantity = quantity
+            order.updated_at = now
+            risk.on_accept(order)
+        else:
+            self._close(order, OrderStatus.CANCELED, now)
+            order = self.orders[order_id] = replace(
+                order, quantity=quantity, price=price, stop_price=stop_price, status=OrderStatus.NEW, updated_at=now)
+            if order.filled_quantity > 0:
+                order.status = OrderStatus.PARTIALLY_FILLED
+            risk.on_accept(order)
+            last_price = self.exchange_manager.get_last_price(order.symbol)
+            if order.order_type in CONDITIONAL_TYPES:
+                self._arm(order, last_price, now, fills)
+            else:
+                self._work(order, last_price, now, fills)
+            self._schedule_expiry(order)
+
+        logger.info(f"Order {order_id} amended")
+        return True, None, fills
+
+    def expire_orders(self, now: float) -> List[Order]:
+        """
+        Expire the DAY and GTD orders due by now, returning them
+
+        Only the due timers are touched. Market orders waiting for a bar are
+        left in their queue, which skips closed orders.
+        """
+        expired = []
+        counts: Dict[TimeInForce, int] = {}
+        for order_id in self.expiries.advance(now):
+            order = self.orders.get(order_id)
+            if order is None or not order.is_open:
+                continue
+            self._close(order, OrderStatus.EXPIRED, now)
+            expired.append(order)
+            counts[order.time_in_force] = counts.get(order.time_in_force, 0) + 1
+
+        for time_in_force, count in counts.items():
+            track_orders_expired(time_in_force.value, count)
+        return expired
+
+    def end_of_day(self, now: float) -> float:
+        """When a DAY order placed at now expires: the next daily expiry time"""
+        expire_at = now - now % 86400 + self.day_expiry
+        return expire_at if expire_at > now else expire_at + 86400
+
+    def process_market_data(self, market_data_list: List[Dict]) -> Tuple[List[Fill], List[Order]]:
+        """
+        Cross resting orders against a batch of new bars
+
+        Returns the fills, and the triggered IOC and FOK orders that expired
+        without any (orders that filled are reported through their fills).
+        """
+        fills = []
+        expired = []
+        now = self.exchange_manager.clock.now()
+
+        rate = config.matching.participation_rate
+
+        for bar in market_data_list:
+            symbol = bar.get('symbol')
+
+            volume = bar.get('volume', 0)
+            available = volume * rate if rate > 0 and volume > 0 else math.inf
+            liquidity = self.liquidity[symbol] = [available, available]
+
+            pending = self.pending_market_orders.pop(symbol, None)
+            if pending:
+                fill_price = bar.get('open') or bar.get('close', 0)
+                for order in pending:
+                    if not order.is_open:
+                        continue
+                    quantity = self._take_liquidity(symbol, order.side, order.remaining_quantity)
+                    if quantity > 0:
+                        fills.append(self._execute(order, quantity, fill_price, now))
+                    if order.is_open:
+                        # Out of liquidity; keep working on the next bar
+                        self.pending_market_orders.setdefault(symbol, []).append(order)
+
+            triggers = self.triggers.get(symbol)
+            activated = self._trigger(triggers, bar, now, fills, expired) if triggers else None
+
+            book = self.books.get(symbol)
+            if book:
+                fills.extend(book.match(bar, now, liquidity))
+
+            if activated:
+                # Limits not marketable when triggered rest from the next bar on
+                self.get_book(symbol).add_many(activated)
+
+        return fills, expired
+
+    def get_open_orders(self) -> List[Order]:
+        return [order for order in self.orders.values() if order.is_open]
+
+    def dump_open_orders(self) -> List[Dict]:
+        """Open orders in a compact form for checkpointing, with internal order ids"""
+        # Trailing stops are saved at their current stop so they resume from the same peak
+        trailing_stops = {}
+        for triggers in self.triggers.values():
+            trailing_stops.update(triggers.trailing_stops())
+
+        return [
+            {
+                'order_id': order.order_id,
+                'symbol': order.symbol,
+                'side': order.side.value,
+                'type': order.order_type.value,
+                'quantity': order.quantity,
+                'price': order.price,
+                'filled_quantity': order.filled_quantity,
+                'average_price': order.average_price,
+                'created_at': order.created_at,
+                'stop_price': trailing_stops.get(order.order_id, order.stop_price),
+                'trail_amount': order.trail_amount,
+                'time_in_force': order.time_in_force.value,
+                'expire_at': order.expire_at
+            }
+            for order in self.get_open_orders()
+        ]
+
+    def restore_orders(self, dumped_orders: List[Dict]) -> List[Order]:
+        """Put checkpointed open orders (already given internal ids) back in their books without executing them"""
+        restored = []
+        for data in dumped_orders:
+            order = Order(
+                symbol=intern(data['symbol']),
+                side=OrderSide(data['side']),
+                quantity=data['quantity'],
+                order_type=OrderType(data['type']),
+                price=data.get('price'),
+                order_id=data['order_id'],
+                filled_quantity=data.get('filled_quantity', 0),
+                average_price=data.get('average_price', 0),
+                created_at=data.get('created_at', time.time()),
+                stop_price=data.get('stop_price'),
+                trail_amount=data.get('trail_amount'),
+                time_in_force=TimeInForce(data.get('time_in_force', TimeInForce.GTC.value)),
+                expire_at=data.get('expire_at', 0)
             )
+            if order.filled_quantity > 0:
+                order.status = OrderStatus.PARTIALLY_FILLED
 
-            # Send the request
-            response = await self.stub.CancelOrders(request)
+            self.orders[order.order_id] = order
+            self.exchange_manager.risk.on_accept(order)
+            if order.order_type == OrderType.TRAILING_STOP:
+                # Rearm at the saved stop: the peak is the stop plus the trail (minus, for buys).
+                # Without one it never had a price to trail from and waits for the first bar.
+                sign = -1 if order.side == OrderSide.BUY else 1
+                peak = order.stop_price + sign * order.trail_amount if order.stop_price else 0
+                self.get_triggers(order.symbol).add(order, peak)
+            elif order.order_type in CONDITIONAL_TYPES:
+                self.get_triggers(order.symbol).add(order, 0)
+            elif order.order_type == OrderType.MARKET:
+                self.pending_market_orders.setdefault(order.symbol, []).append(order)
+            else:
+                self.get_book(order.symbol).add(order)
+            # Orders that expired while the exchange was down go on the next sweep
+            self._schedule_expiry(order)
+            restored.append(order)
 
-            if response.success and len(response.results) > 0:
-                result = response.results[0]
-                if result.success:
-                    # Update order status
-                    logger.info(f"Order {order_id} canceled successfully")
-                    return True
-                else:
-                    logger.warning(f"Order cancellation failed: {result.error_message}")
-                    return False
+        return restored
+
+    def _validate(self, order: Order) -> Optional[str]:
+        if not self.exchange_manager.order_ids.is_bound(order.order_id):
+            return "An open order already has this id"
+        if not order.symbol:
+            return "Symbol is required"
+        if order.quantity <= 0:
+            return "Quantity must be positive"
+        if order.order_type in (OrderType.LIMIT, OrderType.STOP_LIMIT) and (order.price is None or order.price <= 0):
+            return "Limit orders require a positive price"
+        if order.order_type in (OrderType.STOP, OrderType.STOP_LIMIT) and (
+                order.stop_price is None or order.stop_price <= 0):
+            return "Stop orders require a positive stop price"
+        if order.order_type == OrderType.TRAILING_STOP and (order.trail_amount is None or order.trail_amount <= 0):
+            return "Trailing stops require a positive trail amount"
+        if order.time_in_force == TimeInForce.GTD and not order.expire_at > order.created_at:
+            return "GTD orders require an expire time in the future"
+        return None
+
+    def _validate_amend(self, order: Order, quantity: float, price: float, stop_price: float) -> Optional[str]:
+        if quantity < 0 or price < 0 or stop_price < 0:
+            return "Amended values must be positive"
+        if quantity and quantity <= order.filled_quantity:
+            return "Quantity must exceed the filled quantity"
+        if price and order.order_type not in (OrderType.LIMIT, OrderType.STOP_LIMIT):
+            return "Only limit orders have a price to amend"
+        if stop_price and order.order_type not in (OrderType.STOP, OrderType.STOP_LIMIT):
+            return "Only untriggered stop orders have a stop price to amend"
+
+        # Size limits and the risk check apply to what the amend adds
+        quantity = quantity or order.quantity
+        if order.price is not None or price:
+            reference = price or order.price
+        elif order.order_type == OrderType.STOP:
+            reference = stop_price or order.stop_price
+        else:
+            reference = self.exchange_manager.get_last_price(order.symbol)
+        if 0 < config.risk.max_order_quantity < quantity:
+            return REJECT_REASONS[QUANTITY_LIMIT]
+        if 0 < config.risk.max_order_notional < quantity * reference:
+            return REJECT_REASONS[NOTIONAL_LIMIT]
+        added = quantity - order.quantity
+        if added > 0:
+            return self.exchange_manager.risk.check_order(order.symbol, order.side, added, reference)
+        return None
+
+    def _work(self, order: Order, price: float, timestamp: float, fills: List[Fill]):
+        """
+        Execute what liquidity allows if the order is marketable at price,
+        then queue or rest the rest (or expire it, for IOC and FOK)
+        """
+        marketable = price > 0 and self._is_marketable(order, price)
+        if marketable and order.time_in_force == TimeInForce.FOK:
+            marketable = self._available(order.symbol, order.side) >= order.remaining_quantity
+        if marketable:
+            quantity = self._take_liquidity(order.symbol, order.side, order.remaining_quantity)
+            if quantity > 0:
+                fills.append(self._execute(order, quantity, price, timestamp))
+
+        if not order.is_open:
+            return
+        if order.time_in_force in IMMEDIATE:
+            self.exchange_manager.risk.on_cancel(order)
+            order.status = OrderStatus.EXPIRED
+            order.updated_at = timestamp
+            track_orders_expired(order.time_in_force.value)
+        elif order.order_type == OrderType.MARKET:
+            self.pending_market_orders.setdefault(order.symbol, []).append(order)
+        else:
+            self.get_book(order.symbol).add(order)
+
+    def _close(self, order: Order, status: OrderStatus, timestamp: float):
+        """Stop working an open order, taking it out of its trigger book or order book"""
+        if order.order_type in CONDITIONAL_TYPES:
+            self.triggers[order.symbol].cancel(order)
+        else:
+            book = self.books.get(order.symbol)
+            if book is not None and order.order_type == OrderType.LIMIT:
+                book.cancel(order)
+        self.expiries.cancel(order.order_id)
+        self.exchange_manager.risk.on_cancel(order)
+        order.status = status
+        order.updated_at = timestamp
+
+    def _schedule_expiry(self, order: Order):
+        if order.expire_at and order.is_open:
+            self.expiries.schedule(order.order_id, order.expire_at)
+
+    def _arm(self, order: Order, last_price: float, timestamp: float, fills: List[Fill]):
+        """Put a conditional order in its trigger book, or activate it now if the last price already crossed it"""
+        if order.order_type != OrderType.TRAILING_STOP and last_price > 0:
+            if order.side == OrderSide.BUY:
+                crossed = last_price >= order.stop_price
             else:
-                logger.warning(f"Order batch cancellation failed: {response.error_message}")
-                return False
+                crossed = last_price <= order.stop_price
+            if crossed:
+                self._activate(order, order.stop_price)
+                self._work(order, last_price, timestamp, fills)
+                return
+        self.get_triggers(order.symbol).add(order, last_price)
+
+    def _trigger(self, triggers: TriggerBook, bar: Dict, timestamp: float, fills: List[Fill],
+                 expired: List[Order]) -> List[Order]:
+        """
+        Activate the conditional orders a bar crosses
 
-        except Exception as e:
-            logger.error(f"Error canceling order: {e}")
-            return False
\ No newline at end of file
+        Each executes at its stop, or at the open if the bar opened beyond
+        it, as far as it is marketable there. IOC and FOK orders that get no
+        fill are added to expired. Returns the triggered limit orders that
+        are not marketable, for the caller to rest once the bar is matched.
+        """
+        bar_open = bar.get('open', 0)
+        to_rest = []
+        for order, stop in triggers.trigger(bar.get('low', 0), bar.get('high', 0)):
+            self._activate(order, stop)
+            if bar_open > 0:
+                price = max(stop, bar_open) if order.side == OrderSide.BUY else min(stop, bar_open)
+            else:
+                price = stop
+            if (order.order_type == OrderType.LIMIT and not self._is_marketable(order, price)
+                    and order.time_in_force not in IMMEDIATE):
+                to_rest.append(order)
+            else:
+                filled = order.filled_quantity
+                self._work(order, price, timestamp, fills)
+                if order.status == OrderStatus.EXPIRED and order.filled_quantity == filled:
+                    expired.append(order)
+        return to_rest
+
+    @staticmethod
+    def _activate(order: Order, stop: float):
+        """Turn a triggered conditional order into the order it stands for"""
+        order.stop_price = stop
+        order.order_type = OrderType.LIMIT if order.order_type == OrderType.STOP_LIMIT else OrderType.MARKET
+        logger.debug(f"Order {order.order_id} triggered at {stop}")
+
+    def _available(self, symbol: str, side: OrderSide) -> float:
+        """Quantity the current bar can still fill on a side"""
+        liquidity = self.liquidity.get(symbol)
+        if liquidity is None:
+            return math.inf
+        return liquidity[0 if side == OrderSide.BUY else 1]
+
+    def _take_liquidity(self, symbol: str, side: OrderSide, quantity: float) -> float:
+        """Claim up to quantity from the current bar's liquidity, returning how much was granted"""
+        liquidity = self.liquidity.get(symbol)
+        if liquidity is None:
+            return quantity
+        index = 0 if side == OrderSide.BUY else 1
+        granted = min(quantity, liquidity[index])
+        liquidity[index] -= granted
+        return granted
+
+    @staticmethod
+    def _is_marketable(order: Order, last_price: float) -> bool:
+        if order.order_type == OrderType.MARKET:
+            return True
+        if order.side == OrderSide.BUY:
+            return order.price >= last_price
+        return order.price <= last_price
+
+    @staticmethod
+    def _execute(order: Order, quantity: float, price: float, timestamp: float) -> Fill:
+        order.update(quantity, price, timestamp)
+        return Fill(
+            order_id=order.order_id,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=quantity,
+            price=price,
+            timestamp=timestamp,
+            remaining_quantity=order.remaining_quantity
+        )
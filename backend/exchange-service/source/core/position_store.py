@@ -0,0 +1,155 @@
+# source/core/position_store.py
+import logging
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger('position_store')
+
+
+class PositionStore:
+    """
+    Columnar position and risk store.
+
+    Every symbol the exchange has seen gets a slot in a set of contiguous
+    float64 columns (quantity, average cost, last price, market value).
+    Per-symbol updates touch a single slot; portfolio-wide figures are
+    vectorized over the occupied prefix of the columns.
+
+    A symbol counts as a held position while its quantity is non-zero.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.slots: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self.quantity = np.zeros(capacity)
+        self.average_cost = np.zeros(capacity)
+        self.last_price = np.zeros(capacity)
+        self.market_value = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.quantity[:len(self.symbols)]))
+
+    def __contains__(self, symbol: str) -> bool:
+        slot = self.slots.get(symbol)
+        return slot is not None and self.quantity[slot] != 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over held symbols"""
+        return iter(self.held_symbols())
+
+    def slot(self, symbol: str) -> int:
+        """Slot index for a symbol, allocated on first use"""
+        slot = self.slots.get(symbol)
+        if slot is None:
+            slot = len(self.symbols)
+            if slot == len(self.quantity):
+                self._grow()
+            self.slots[symbol] = slot
+            self.symbols.append(symbol)
+        return slot
+
+    def held_symbols(self) -> List[str]:
+        n = len(self.symbols)
+        return [self.symbols[i] for i in np.flatnonzero(self.quantity[:n])]
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Position as a dict, or None if the symbol is not held"""
+        slot = self.slots.get(symbol)
+        if slot is None or self.quantity[slot] == 0:
+            return None
+        return {
+            'quantity': float(self.quantity[slot]),
+            'average_cost': float(self.average_cost[slot]),
+            'last_price': float(self.last_price[slot]),
+            'market_value': float(self.market_value[slot])
+        }
+
+    def set_price(self, symbol: str, price: float) -> float:
+        """Set the last price, returning the change in the symbol's market value"""
+        slot = self.slot(symbol)
+        self.last_price[slot] = price
+        return self._revalue_slot(slot)
+
+    def set_position(self, symbol: str, quantity: float, average_cost: float) -> float:
+        """Set a position, returning the change in the symbol's market value"""
+        slot = self.slot(symbol)
+        self.quantity[slot] = quantity
+        self.average_cost[slot] = average_cost if quantity else 0.0
+        return self._revalue_slot(slot)
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Held positions keyed by symbol, in the layout the database expects"""
+        return {
+            symbol: {'quantity': position['quantity'], 'average_cost': position['average_cost']}
+            for symbol in self.held_symbols()
+            for position in (self.get(symbol),)
+        }
+
+    def load(self, positions: Dict[str, Dict]):
+        """Replace all held positions"""
+        n = len(self.symbols)
+        self.quantity[:n] = 0
+        self.average_cost[:n] = 0
+        for symbol, position in positions.items():
+            slot = self.slot(symbol)
+            self.quantity[slot] = position.get('quantity', 0)
+            self.average_cost[slot] = position.get('average_cost', 0)
+        self.revalue()
+
+    # Vectorized portfolio analytics
+
+    def revalue(self):
+        """Recompute every market value from quantity and last price"""
+        n = len(self.symbols)
+        np.multiply(self.quantity[:n], self.last_price[:n], out=self.market_value[:n])
+
+    def positions_value(self) -> float:
+        return float(self.market_value[:len(self.symbols)].sum())
+
+    def gross_exposure(self) -> float:
+        return float(np.abs(self.market_value[:len(self.symbols)]).sum())
+
+    def net_exposure(self) -> float:
+        return self.positions_value()
+
+    def unrealized_pnl(self) -> float:
+        n = len(self.symbols)
+        return float((self.quantity[:n] * (self.last_price[:n] - self.average_cost[:n])).sum())
+
+    def weights(self) -> Dict[str, float]:
+        """Share of gross exposure per held symbol"""
+        n = len(self.symbols)
+        market_value = self.market_value[:n]
+        gross = np.abs(market_value).sum()
+        if gross == 0:
+            return {}
+        held = np.flatnonzero(self.quantity[:n])
+        weights = market_value[held] / gross
+        return {self.symbols[i]: float(w) for i, w in zip(held, weights)}
+
+    def summary(self, cash_balance: float) -> Dict:
+        """Portfolio-level risk figures"""
+        positions_value = self.positions_value()
+        return {
+            'positions': len(self),
+            'cash_balance': cash_balance,
+            'positions_value': positions_value,
+            'total_value': cash_balance + positions_value,
+            'gross_exposure': self.gross_exposure(),
+            'net_exposure': positions_value,
+            'unrealized_pnl': self.unrealized_pnl()
+        }
+
+    def _revalue_slot(self, slot: int) -> float:
+        old_value = self.market_value[slot]
+        new_value = self.quantity[slot] * self.last_price[slot]
+        self.market_value[slot] = new_value
+        return float(new_value - old_value)
+
+    def _grow(self):
+        capacity = len(self.quantity) * 2
+        for name in ('quantity', 'average_cost', 'last_price', 'market_value'):
+            column = np.zeros(capacity)
+            column[:len(self.symbols)] = getattr(self, name)[:len(self.symbols)]
+            setattr(self, name, column)
@@ -0,0 +1,164 @@
+# source/core/recorder.py
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from source.models.order import Fill
+from source.utils.clock import Clock
+
+logger = logging.getLogger('recorder')
+
+MAGIC = b'LQREC\x00\x02\x00'
+
+# Record kinds
+MARKET_DATA = 1  # market_exchange.MarketDataUpdate
+SUBMIT_ORDERS = 2  # order_exchange.BatchOrderRequest
+CANCEL_ORDERS = 3  # order_exchange.BatchCancelRequest
+FILL_DIGEST = 4  # sha256 of every fill produced while recording, written on close
+AMEND_ORDERS = 5  # order_exchange.BatchAmendRequest
+UPDATE_SYMBOLS = 6  # session_exchange.UpdateSymbolsRequest
+EXPIRE_ORDERS = 7  # empty; orders due by the record's timestamp were expired between updates
+INITIAL_STATE = 8  # JSON; the restored portfolio, open orders, symbols and risk limits the session starts from
+
+# payload length, kind, exchange clock timestamp (seconds)
+RECORD_HEADER = struct.Struct('<IBd')
+FILL_RECORD = struct.Struct('<qdd')
+
+
+def update_fill_digest(digest, fills: Iterable[Fill]):
+    """Fold fills into a running digest; wall-clock fill timestamps are left out"""
+    for fill in fills:
+        digest.update(b'B' if fill.side.value == 'BUY' else b'S')
+        digest.update(FILL_RECORD.pack(fill.order_id, fill.quantity, fill.price))
+
+
+class SessionRecorder:
+    """
+    Append-only recording of everything that drives an exchange session.
+
+    The file is a magic header followed by length-prefixed records, each a
+    small fixed header and a serialized protobuf message. It is written
+    through a memory map that grows in fixed-size chunks, so recording an
+    event is a couple of memory copies rather than a write syscall. The
+    file is trimmed to its used length on close.
+
+    Records are stamped with the exchange's clock (set when the recorder is
+    attached), so a replay can run on a virtual clock that reads the same
+    time at every event. The exchange writes the state it starts from
+    (after restoring a checkpoint) as the first record, so a replay begins
+    where the session did rather than from a fresh account. Anything
+    recorded before that (market data arriving during the restore, which
+    the exchange holds back until after it) is written right after it,
+    stamped no earlier than it.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 16 * 1024 * 1024, clock: Clock = None):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.clock = clock or Clock()
+        self.records = 0
+        self.fill_digest = hashlib.sha256()
+        # Records made before the initial state; None once it is written
+        self._held: Optional[List[Tuple[int, bytes, float]]] = []
+
+        self._file = open(path, 'w+b')
+        self._file.write(MAGIC)
+        self._file.truncate(chunk_size)
+        self._mmap = mmap.mmap(self._file.fileno(), chunk_size)
+        self._offset = len(MAGIC)
+
+        logger.info(f"Recording exchange session to {path}")
+
+    def record_initial_state(self, state: Dict[str, Any]):
+        held, self._held = self._held, None
+        start = self.clock.now()
+        self._append(INITIAL_STATE, json.dumps(state, separators=(',', ':')).encode(), start)
+        for kind, payload, timestamp in held or ():
+            self._append(kind, payload, max(timestamp, start))
+
+    def record_market_data(self, update):
+        self._append(MARKET_DATA, update.SerializeToString())
+
+    def record_submit_orders(self, request):
+        self._append(SUBMIT_ORDERS, request.SerializeToString())
+
+    def record_cancel_orders(self, request):
+        self._append(CANCEL_ORDERS, request.SerializeToString())
+
+    def record_amend_orders(self, request):
+        self._append(AMEND_ORDERS, request.SerializeToString())
+
+    def record_update_symbols(self, request):
+        self._append(UPDATE_SYMBOLS, request.SerializeToString())
+
+    def record_expire_orders(self, timestamp: float):
+        self._append(EXPIRE_ORDERS, b'', timestamp)
+
+    def observe_fills(self, fills: Iterable[Fill]):
+        update_fill_digest(self.fill_digest, fills)
+
+    def close(self):
+        if self._mmap is None:
+            return
+        held, self._held = self._held, None
+        for kind, payload, timestamp in held or ():
+            self._append(kind, payload, timestamp)
+        self._append(FILL_DIGEST, self.fill_digest.digest())
+        self._mmap.flush()
+        self._mmap.close()
+        self._mmap = None
+        self._file.truncate(self._offset)
+        self._file.close()
+        logger.info(f"Closed session recording {self.path}: {self.records} records, {self._offset} bytes")
+
+    def _append(self, kind: int, payload: bytes, timestamp: float = None):
+        if self._mmap is None:
+            return
+        if timestamp is None:
+            timestamp = self.clock.now()
+        if self._held is not None:
+            self._held.append((kind, payload, timestamp))
+            return
+        end = self._offset + RECORD_HEADER.size + len(payload)
+        if end > len(self._mmap):
+            self._grow(end)
+
+        RECORD_HEADER.pack_into(self._mmap, self._offset, len(payload), kind, timestamp)
+        start = self._offset + RECORD_HEADER.size
+        self._mmap[start:end] = payload
+        self._offset = end
+        self.records += 1
+
+    def _grow(self, needed: int):
+        size = len(self._mmap)
+        while size < needed:
+            size += self.chunk_size
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+
+
+def read_recording(path: str) -> Iterator[Tuple[int, float, bytes]]:
+    """Yield (kind, timestamp, payload) for every record in a recording"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not an exchange session recording")
+
+            offset = len(MAGIC)
+            size = len(mm)
+            while offset + RECORD_HEADER.size <= size:
+                length, kind, timestamp = RECORD_HEADER.unpack_from(mm, offset)
+                if kind == 0:
+                    # Unused tail of a recording that was not closed cleanly
+                    break
+                start = offset + RECORD_HEADER.size
+                yield kind, timestamp, mm[start:start + length]
+                offset = start + length
@@ -0,0 +1,279 @@
+# source/core/risk_engine.py
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from source.config import config
+from source.models.enums import OrderSide
+from source.models.order import Fill, Order
+from source.core.order_batch import (
+    OrderBatch, BUY, SELL, ACCEPTED, BUYING_POWER, POSITION_LIMIT, TOTAL_RISK_LIMIT, UNPRICED,
+    INSUFFICIENT_POSITION, REJECT_REASONS
+)
+from source.utils.metrics import track_risk_rejections
+
+logger = logging.getLogger('risk_engine')
+
+# Metric labels for the rejection reasons
+REASON_LABELS = {
+    BUYING_POWER: 'buying_power',
+    POSITION_LIMIT: 'position_limit',
+    TOTAL_RISK_LIMIT: 'total_risk',
+    UNPRICED: 'unpriced',
+    INSUFFICIENT_POSITION: 'insufficient_position',
+}
+
+
+class RiskEngine:
+    """
+    Pre-trade checks against the book's exposure limits.
+
+    Exposure is long-side: a symbol's exposure is its position plus the
+    open buy quantity that could still fill, at the last price, and the
+    book's exposure is the sum over symbols. Open buys are also reserved
+    against cash for the buying power check. Until a symbol's first bar its
+    open buys are valued at their own limit or stop prices instead, and buys
+    with no price of their own (market and trailing-stop buys) are rejected.
+
+    Sells only reduce exposure, but the exchange does not model short
+    positions: a sell may not exceed the position less the quantity already
+    committed to open sells. That check is always on.
+
+    Position value is already kept incrementally by MarkToMarket; this adds
+    the open buy quantity per symbol and its running value, adjusted on
+    every accept, fill, cancel and price change. Checking an order is a few
+    lookups and comparisons, whatever the number of open orders.
+
+    A limit of 0 is off. Limits come from the book (trading.books, with the
+    desk id as book id) when it sets them, otherwise from RiskConfig.
+    """
+
+    def __init__(self, exchange_manager):
+        self.exchange_manager = exchange_manager
+        self.max_position_size = config.risk.max_position_size
+        self.max_total_risk = config.risk.max_total_risk
+        self.check_buying_power = config.risk.check_buying_power
+
+        # symbol -> [open buy quantity, price it is valued at]
+        self.open_buys: Dict[str, List[float]] = {}
+        # Sum of open buy quantity * price over symbols
+        self.open_buy_value = 0.0
+        # symbol -> open sell quantity
+        self.open_sells: Dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.check_buying_power or self.max_position_size > 0 or self.max_total_risk > 0
+
+    def set_limits(self, max_position_size: Optional[float] = None, max_total_risk: Optional[float] = None):
+        """Apply a book's limits; None keeps the configured default"""
+        if max_position_size is not None:
+            self.max_position_size = float(max_position_size)
+        if max_total_risk is not None:
+            self.max_total_risk = float(max_total_risk)
+        logger.info(f"Risk limits: max position {self.max_position_size}, max total {self.max_total_risk}, "
+                    f"buying power {'on' if self.check_buying_power else 'off'}")
+
+    # Checks
+
+    def check_order(self, symbol: str, side: OrderSide, quantity: float, price: float) -> Optional[str]:
+        """Reason a new order would breach a limit, or None; price is its limit or the last price"""
+        if side == OrderSide.SELL:
+            reason = ACCEPTED if quantity <= self.sellable(symbol) else INSUFFICIENT_POSITION
+        elif not self.enabled:
+            return None
+        elif price <= 0:
+            reason = UNPRICED
+        else:
+            reason = self._breach(quantity * price, self.cash_available(), self.total_exposure(),
+                                  self.symbol_exposure(symbol))
+        if reason != ACCEPTED:
+            track_risk_rejections(REASON_LABELS[reason])
+            return REJECT_REASONS[reason]
+        return None
+
+    def check_batch(self, batch: OrderBatch, last_prices: np.ndarray):
+        """
+        Reject the orders in a batch that would breach a limit
+
+        Each buy is checked at its own price on top of the buys accepted
+        before it, which (like every open buy) count at the last price, or at
+        their own price before the symbol has one, so a batch of buys gets
+        the same answers as submitting them one at a time. Sells in the batch
+        do not free capacity for its buys. When even the worst case fits,
+        that is settled with a few array sums; only a batch that runs into a
+        limit is walked order by order to find where.
+        """
+        self._check_sells(batch)
+        if not self.enabled:
+            return
+        buys = batch.accepted & (batch.sides == BUY)
+        if not buys.any():
+            return
+
+        codes = batch.symbol_codes
+        last = last_prices[codes]
+        reference = batch.reference_prices(last_prices)
+        unpriced = buys & ~(reference > 0)
+        if unpriced.any():
+            batch.reasons[unpriced] = UNPRICED
+            track_risk_rejections(REASON_LABELS[UNPRICED], int(unpriced.sum()))
+            buys &= ~unpriced
+            if not buys.any():
+                return
+
+        cost = np.where(buys, batch.quantities * reference, 0.0)
+        committed = np.where(buys, batch.quantities * np.where(last > 0, last, reference), 0.0)
+        # Every order fits if all the others are committed and it still fits at its own price
+        excess = np.maximum(cost - committed, 0.0)
+
+        cash = self.cash_available()
+        total = self.total_exposure()
+        symbols = [self.symbol_exposure(symbol) for symbol in batch.unique_symbols]
+
+        worst = float(committed.sum() + excess.max())
+        fits = not (self.check_buying_power and worst > cash)
+        if fits and self.max_total_risk > 0:
+            fits = total + worst <= self.max_total_risk
+        if fits and self.max_position_size > 0:
+            per_symbol = np.bincount(codes, weights=committed, minlength=len(symbols))
+            np.maximum.at(per_symbol, codes, per_symbol[codes] + excess)
+            fits = bool((np.array(symbols) + per_symbol <= self.max_position_size).all())
+        if fits:
+            return
+
+        rejected: Dict[int, int] = {}
+        cost = cost.tolist()
+        committed = committed.tolist()
+        codes = codes.tolist()
+        for i in np.flatnonzero(buys).tolist():
+            code = codes[i]
+            reason = self._breach(cost[i], cash, total, symbols[code])
+            if reason != ACCEPTED:
+                batch.reasons[i] = reason
+                rejected[reason] = rejected.get(reason, 0) + 1
+                continue
+            cash -= committed[i]
+            total += committed[i]
+            symbols[code] += committed[i]
+        for reason, count in rejected.items():
+            track_risk_rejections(REASON_LABELS[reason], count)
+
+    def _check_sells(self, batch: OrderBatch):
+        """
+        Reject the sells in a batch that exceed what is left to sell
+
+        Each sell counts against the sells accepted before it; buys in the
+        batch do not back its sells. Settled with one bincount unless some
+        symbol runs short, in which case the sells are walked in order.
+        """
+        sells = batch.accepted & (batch.sides == SELL)
+        if not sells.any():
+            return
+
+        codes = batch.symbol_codes
+        sellable = np.array([self.sellable(symbol) for symbol in batch.unique_symbols])
+        per_symbol = np.bincount(codes[sells], weights=batch.quantities[sells], minlength=len(sellable))
+        if (per_symbol <= sellable).all():
+            return
+
+        rejected = 0
+        sellable = sellable.tolist()
+        quantities = batch.quantities.tolist()
+        codes = codes.tolist()
+        for i in np.flatnonzero(sells).tolist():
+            code = codes[i]
+            if quantities[i] > sellable[code]:
+                batch.reasons[i] = INSUFFICIENT_POSITION
+                rejected += 1
+            else:
+                sellable[code] -= quantities[i]
+        track_risk_rejections(REASON_LABELS[INSUFFICIENT_POSITION], rejected)
+
+    def _breach(self, amount: float, cash: float, total: float, symbol: float) -> int:
+        if self.check_buying_power and amount > cash:
+            return BUYING_POWER
+        if self.max_position_size > 0 and symbol + amount > self.max_position_size:
+            return POSITION_LIMIT
+        if self.max_total_risk > 0 and total + amount > self.max_total_risk:
+            return TOTAL_RISK_LIMIT
+        return ACCEPTED
+
+    # Exposure
+
+    def cash_available(self) -> float:
+        """Cash not already reserved by open buys"""
+        return self.exchange_manager.cash_balance - self.open_buy_value
+
+    def total_exposure(self) -> float:
+        return self.exchange_manager.mark_to_market.positions_value + self.open_buy_value
+
+    def sellable(self, symbol: str) -> float:
+        """Position not already committed to open sells"""
+        position = self.exchange_manager.positions.get(symbol)
+        held = position['quantity'] if position else 0.0
+        return held - self.open_sells.get(symbol, 0.0)
+
+    def symbol_exposure(self, symbol: str) -> float:
+        exposure = self.exchange_manager.mark_to_market.market_value(symbol)
+        entry = self.open_buys.get(symbol)
+        if entry:
+            exposure += entry[0] * entry[1]
+        return exposure
+
+    # Counter maintenance
+
+    def on_accept(self, order: Order):
+        """An order starts working (or is restored) with its remaining quantity"""
+        if order.side == OrderSide.BUY:
+            self._add_open_buy(order.symbol, order.remaining_quantity, order.price or order.stop_price or 0.0)
+        else:
+            self._add_open_sell(order.symbol, order.remaining_quantity)
+
+    def on_cancel(self, order: Order):
+        """An open order stops working with its remaining quantity unfilled"""
+        if order.side == OrderSide.BUY:
+            self._add_open_buy(order.symbol, -order.remaining_quantity, order.price or order.stop_price or 0.0)
+        else:
+            self._add_open_sell(order.symbol, -order.remaining_quantity)
+
+    def on_fills(self, fills: List[Fill]):
+        for fill in fills:
+            if fill.side == OrderSide.BUY:
+                self._add_open_buy(fill.symbol, -fill.quantity, fill.price)
+            else:
+                self._add_open_sell(fill.symbol, -fill.quantity)
+
+    def update_price(self, symbol: str, price: float):
+        entry = self.open_buys.get(symbol)
+        if entry:
+            self.open_buy_value += entry[0] * (price - entry[1])
+            entry[1] = price
+
+    def rebuild(self):
+        """Recompute the counters from the open orders, discarding accumulated rounding"""
+        self.open_buys.clear()
+        self.open_buy_value = 0.0
+        self.open_sells.clear()
+        for order in self.exchange_manager.order_manager.get_open_orders():
+            self.on_accept(order)
+
+    def _add_open_buy(self, symbol: str, quantity: float, price: float):
+        last_price = self.exchange_manager.get_last_price(symbol)
+        entry = self.open_buys.get(symbol)
+        if entry is None:
+            entry = self.open_buys[symbol] = [0.0, last_price]
+        if last_price > 0:
+            entry[0] += quantity
+            self.open_buy_value += quantity * entry[1]
+            return
+
+        # No bar yet: the entry's price is the average of the orders' own prices
+        value = entry[0] * entry[1] + quantity * price
+        entry[0] += quantity
+        entry[1] = value / entry[0] if entry[0] > 0 else 0.0
+        self.open_buy_value += quantity * price
+
+    def _add_open_sell(self, symbol: str, quantity: float):
+        self.open_sells[symbol] = self.open_sells.get(symbol, 0.0) + quantity
@@ -0,0 +1,201 @@
+# source/core/tenant_registry.py
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from source.config import config
+from source.core.checkpoint import CheckpointWriter
+from source.core.exchange_manager import ExchangeManager
+from source.core.market_data_manager import MarketDataClient
+from source.db.database import DatabaseManager
+from source.utils.metrics import track_active_simulators
+
+logger = logging.getLogger('tenant_registry')
+
+# (user_id, desk_id)
+TenantKey = Tuple[str, str]
+
+
+class TenantRegistry:
+    """
+    Hosts one ExchangeManager per user/desk in a single process.
+
+    Tenants share the process-wide services: one database pool, one
+    checkpoint writer (so a flush round batches every tenant that changed)
+    and one market data subscription covering the union of their symbols.
+    Each tick from the subscription is fanned out to every tenant; cash,
+    positions, orders and books stay private to each ExchangeManager.
+    Tenants are created on first use and restored from their checkpoint.
+
+    A tenant with no calls for tenant_idle_seconds, no open streams and no
+    open orders is checkpointed and dropped, to be restored again on its
+    next call; the default tenant is kept.
+    """
+
+    def __init__(self, symbols: Optional[List[str]] = None, default_tenant: Optional[TenantKey] = None):
+        self.symbols = list(symbols or config.simulator.default_symbols)
+        self.default_tenant = default_tenant
+
+        self.database_manager = DatabaseManager()
+        self.checkpoint_writer = CheckpointWriter(self.database_manager, config.checkpoint.interval_seconds)
+        self.market_data_client = MarketDataClient(self, self.symbols)
+
+        self.managers: Dict[TenantKey, ExchangeManager] = {}
+        self._pending: Dict[TenantKey, asyncio.Task] = {}
+        # Final checkpoints of removed tenants, waited on before one is recreated
+        self._removing: Dict[TenantKey, asyncio.Task] = {}
+
+        # When each tenant was last resolved (monotonic seconds), for idle eviction
+        self.last_used: Dict[TenantKey, float] = {}
+        self._eviction_task: Optional[asyncio.Task] = None
+
+        # Callbacks run with the key of each removed tenant (e.g. to drop its stream hub)
+        self.removal_listeners: List[Callable[[TenantKey], None]] = []
+
+        # Latest bar per symbol, used to prime tenants created mid-session
+        self.current_market_data: Dict[str, Dict[str, Any]] = {}
+
+        # Read by the market data client; recording is single-tenant only
+        self.recorder = None
+
+    async def start(self, live_market_data: bool = True):
+        """Connect the shared services and start the market data subscription"""
+        # Subscribe first so the handshake overlaps the database connect
+        if live_market_data:
+            await self.market_data_client.start()
+
+        await self.database_manager.connect()
+        if not await self.database_manager.check_connection():
+            logger.warning("Database connection established but not responding to queries")
+
+        if config.checkpoint.enabled:
+            await self.checkpoint_writer.start()
+
+        if config.simulator.tenant_idle_seconds > 0:
+            self._eviction_task = asyncio.create_task(self._evict_periodically())
+
+        logger.info(f"Tenant registry started for symbols {self.symbols}")
+
+    async def stop(self):
+        """Clean up every tenant, then the shared services"""
+        if self._eviction_task:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+
+        for exchange_manager in list(self.managers.values()):
+            await exchange_manager.cleanup()
+
+        # Final checkpoint for every tenant while the database is still open
+        await self.checkpoint_writer.stop()
+        await self.market_data_client.stop()
+        await self.database_manager.close()
+
+        self.managers.clear()
+        track_active_simulators(0)
+        logger.info("Tenant registry stopped")
+
+    def get(self, user_id: str, desk_id: str) -> Optional[ExchangeManager]:
+        return self.managers.get((user_id, desk_id))
+
+    async def get_or_create(self, user_id: str, desk_id: str) -> ExchangeManager:
+        """Return the tenant's exchange, creating and restoring it on first use"""
+        key = (user_id, desk_id)
+        self.last_used[key] = time.monotonic()
+        exchange_manager = self.managers.get(key)
+        if exchange_manager is not None:
+            return exchange_manager
+
+        # Concurrent first requests for one tenant share a single initialization
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._create(key))
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._pending.pop(key, None)
+
+    async def remove(self, user_id: str, desk_id: str):
+        """Checkpoint and drop a tenant"""
+        key = (user_id, desk_id)
+        exchange_manager = self.managers.pop(key, None)
+        if exchange_manager is None:
+            return
+        self.last_used.pop(key, None)
+        for listener in self.removal_listeners:
+            listener(key)
+
+        task = self._removing[key] = asyncio.create_task(exchange_manager.cleanup())
+        try:
+            await task
+        finally:
+            if self._removing.get(key) is task:
+                del self._removing[key]
+        track_active_simulators(len(self.managers))
+        logger.info(f"Removed exchange for user {user_id}, desk {desk_id}")
+
+    def is_idle(self, key: TenantKey, now: float) -> bool:
+        exchange_manager = self.managers.get(key)
+        return (
+            exchange_manager is not None
+            and key != self.default_tenant
+            and now - self.last_used.get(key, now) >= config.simulator.tenant_idle_seconds
+            and exchange_manager.open_streams == 0
+            and not exchange_manager.order_manager.orders
+        )
+
+    async def evict_idle(self) -> int:
+        """Checkpoint and remove every idle tenant, returning how many were removed"""
+        evicted = 0
+        for key in list(self.managers):
+            # Checked again per tenant: a call may have arrived while the last one was saved
+            if self.is_idle(key, time.monotonic()):
+                await self.remove(*key)
+                evicted += 1
+        if evicted:
+            logger.info(f"Evicted {evicted} idle tenants ({len(self.managers)} remain)")
+        return evicted
+
+    async def _evict_periodically(self):
+        interval = min(config.simulator.tenant_idle_seconds / 4, 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.error(f"Idle tenant eviction failed: {e}")
+
+    async def update_market_data(self, market_data_list: List[Dict[str, Any]], origin_timestamp: int = 0):
+        """Fan one market data update out to every tenant"""
+        for market_data in market_data_list:
+            symbol = market_data.get('symbol')
+            if symbol:
+                self.current_market_data[symbol] = market_data
+
+        for exchange_manager in list(self.managers.values()):
+            await exchange_manager.update_market_data(market_data_list, origin_timestamp)
+        return True
+
+    async def _create(self, key: TenantKey) -> ExchangeManager:
+        user_id, desk_id = key
+        # Load the tenant's state only once its last checkpoint is written
+        removing = self._removing.get(key)
+        if removing is not None:
+            await asyncio.shield(removing)
+
+        exchange_manager = ExchangeManager(
+            user_id=user_id,
+            desk_id=desk_id,
+            database_manager=self.database_manager,
+            checkpoint_writer=self.checkpoint_writer,
+            market_data_client=self.market_data_client,
+            symbols=self.symbols
+        )
+        await exchange_manager.initialize()
+        exchange_manager.seed_market_data(list(self.current_market_data.values()))
+
+        self.managers[key] = exchange_manager
+        track_active_simulators(len(self.managers))
+        logger.info(f"Created exchange for user {user_id}, desk {desk_id} ({len(self.managers)} tenants)")
+        return exchange_manager
@@ -0,0 +1,133 @@
+# source/core/timer_wheel.py
+import logging
+import math
+from typing import Dict, List
+
+logger = logging.getLogger('timer_wheel')
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel keyed by integer ids (order ids).
+
+    Time is counted in ticks of `resolution` seconds. Level 0 has one slot
+    per tick for the next 64 ticks, level 1 one slot per 64 ticks for the
+    next 64**2, and so on; a timer goes in the lowest level whose span
+    covers its deadline. When the wheel reaches a higher-level slot, the
+    timers in it are redistributed to lower levels, so each timer moves at
+    most once per level on its way to firing.
+
+    Scheduling and cancelling are a couple of dict operations. Advancing
+    jumps straight to the next occupied slot instead of stepping through
+    empty ticks, so long idle gaps (or a backtest clock leaping forward)
+    cost nothing. Timers fire on the first tick at or after their deadline.
+    """
+
+    BITS = 6
+    SLOTS = 1 << BITS
+    MASK = SLOTS - 1
+
+    def __init__(self, now: float, resolution: float = 1.0, levels: int = 5):
+        self.resolution = resolution
+        self.levels = levels
+        self.current = self._tick(now)
+        self.wheel: List[List[Dict[int, int]]] = [[{} for _ in range(self.SLOTS)] for _ in range(levels)]
+        # key -> the slot holding it, for O(1) cancel
+        self.locations: Dict[int, Dict[int, int]] = {}
+        # Timers already due, fired on the next advance
+        self.due: Dict[int, int] = {}
+        # Deadlines further out than the top level's span
+        self.horizon = self.SLOTS ** levels - 1
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.locations
+
+    def schedule(self, key: int, deadline: float):
+        """Fire key at deadline (epoch seconds), replacing any timer it already has"""
+        self.cancel(key)
+        self._insert(key, math.ceil(deadline / self.resolution))
+
+    def cancel(self, key: int) -> bool:
+        slot = self.locations.pop(key, None)
+        if slot is None:
+            return False
+        del slot[key]
+        return True
+
+    def advance(self, now: float) -> List[int]:
+        """Move the wheel to now, returning the keys that fell due in deadline order"""
+        target = self._tick(now)
+        fired: List[int] = []
+        self._fire(self.due, fired)
+
+        while self.locations:
+            tick = self._next_tick()
+            if tick > target:
+                break
+            self.current = tick
+            # Every level can have a slot starting at this tick; cascade from the top down
+            for level in range(self.levels - 1, -1, -1):
+                shift = self.BITS * level
+                if tick & ((1 << shift) - 1):
+                    continue
+                slot = self.wheel[level][(tick >> shift) & self.MASK]
+                if not slot:
+                    continue
+                if level == 0:
+                    self._fire(slot, fired)
+                else:
+                    # Redistribute to the lower levels relative to the new current tick
+                    entries = list(slot.items())
+                    slot.clear()
+                    for key, deadline_tick in entries:
+                        del self.locations[key]
+                        self._insert(key, deadline_tick)
+            self._fire(self.due, fired)
+
+        self.current = max(self.current, target)
+        return fired
+
+    def _insert(self, key: int, tick: int):
+        delta = tick - self.current
+        if delta <= 0:
+            slot = self.due
+        else:
+            # Far deadlines wait in the top level and are re-placed each time it comes round
+            if delta > self.horizon:
+                delta = self.horizon
+            level = (delta.bit_length() - 1) // self.BITS
+            slot = self.wheel[level][((self.current + delta) >> (self.BITS * level)) & self.MASK]
+        slot[key] = tick
+        self.locations[key] = slot
+
+    def _next_tick(self) -> int:
+        """Start of the earliest occupied slot after the current tick"""
+        best = None
+        for level in range(self.levels):
+            shift = self.BITS * level
+            position = self.current >> shift
+            if best is not None and (position + 1) << shift >= best:
+                # Slots at this level and above all start later
+                break
+            slots = self.wheel[level]
+            for step in range(1, self.SLOTS + 1):
+                if slots[(position + step) & self.MASK]:
+                    tick = (position + step) << shift
+                    if best is None or tick < best:
+                        best = tick
+                    break
+        return best
+
+    def _fire(self, slot: Dict[int, int], fired: List[int]):
+        if not slot:
+            return
+        for key in sorted(slot, key=slot.__getitem__):
+            del self.locations[key]
+            fired.append(key)
+        slot.clear()
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution)
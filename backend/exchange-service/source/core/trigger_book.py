@@ -0,0 +1,177 @@
+# source/core/trigger_book.py
+import heapq
+import logging
+from itertools import count
+from typing import Dict, List, Tuple
+
+from source.models.enums import OrderSide, OrderType
+from source.models.order import Order
+
+logger = logging.getLogger('trigger_book')
+
+# Entries carry a global arrival number so equal keys trigger in time priority
+_arrival = count()
+
+
+class _StopSide:
+    """
+    Fixed stops for one side, in sell orientation: an entry triggers once
+    the price falls to its stop. Buy stops are stored with prices negated.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int, Order]] = []  # max-heap on stop (negated keys)
+
+    def add(self, order: Order, stop: float):
+        heapq.heappush(self.heap, (-stop, next(_arrival), order))
+
+    def trigger(self, low: float, triggered: List[Tuple[Order, float]]):
+        heap = self.heap
+        while heap and -heap[0][0] >= low:
+            key, _, order = heapq.heappop(heap)
+            if order.is_open:
+                triggered.append((order, -key))
+
+
+class _TrailingSide:
+    """
+    Trailing stops for one side, in sell orientation: an entry's stop is
+    the highest price seen since it was placed minus its trail.
+
+    Entries placed at different times have different peaks, but once the
+    price makes a new high every entry below it shares that high as its
+    peak. Entries are therefore kept in groups with a common peak, each a
+    min-heap on trail (the smallest trail is the highest stop, the first to
+    trigger). Groups form a stack with peaks falling towards the top, since
+    a new entry is placed at the current price, below every older peak. A
+    new high merges the groups it passes into one; a low peeks at each
+    group's tightest stop and pops only the entries it crosses.
+    """
+
+    def __init__(self):
+        self.groups: List[List] = []  # [peak, heap of (trail, arrival, order)]
+
+    def add(self, order: Order, trail: float, peak: float):
+        self.raise_peak(peak)
+        groups = self.groups
+        if groups and groups[-1][0] == peak:
+            heapq.heappush(groups[-1][1], (trail, next(_arrival), order))
+        else:
+            groups.append([peak, [(trail, next(_arrival), order)]])
+
+    def raise_peak(self, high: float):
+        groups = self.groups
+        if not groups or groups[-1][0] >= high:
+            return
+        merged = groups.pop()[1]
+        while groups and groups[-1][0] <= high:
+            heap = groups.pop()[1]
+            # Push the smaller heap's entries into the larger one
+            if len(heap) > len(merged):
+                heap, merged = merged, heap
+            for entry in heap:
+                heapq.heappush(merged, entry)
+        groups.append([high, merged])
+
+    def trigger(self, low: float, triggered: List[Tuple[Order, float]]):
+        groups = self.groups
+        for group in groups:
+            peak, heap = group
+            while heap and heap[0][0] <= peak - low:
+                trail, _, order = heapq.heappop(heap)
+                if order.is_open:
+                    triggered.append((order, peak - trail))
+        if any(not heap for _, heap in groups):
+            groups[:] = [group for group in groups if group[1]]
+
+    def stops(self, sign: float) -> Dict[int, float]:
+        return {
+            order.order_id: sign * (peak - trail)
+            for peak, heap in self.groups
+            for trail, _, order in heap
+            if order.is_open
+        }
+
+
+class TriggerBook:
+    """
+    Armed stop, stop-limit and trailing-stop orders for a single symbol.
+
+    Sell stops trigger when the price falls to the stop and buy stops when
+    it rises to it. Stops are held in price-ordered heaps, so a bar pops
+    exactly the triggers it crosses and never scans the rest; protective
+    stops on every position can far outnumber resting limits. Buy-side
+    structures store negated prices so both sides share one implementation.
+    Cancels are lazy, as in OrderBook.
+
+    Within a bar, trailing stops are checked against the peak from earlier
+    bars before the bar's own extreme moves them. A trailing stop placed
+    before the symbol has a price waits for the first bar and starts
+    trailing from its extreme.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.armed = 0  # live orders waiting to trigger
+        self.stops = {OrderSide.BUY: _StopSide(), OrderSide.SELL: _StopSide()}
+        self.trailing = {OrderSide.BUY: _TrailingSide(), OrderSide.SELL: _TrailingSide()}
+        # Trailing stops with nothing to trail from yet
+        self.unpriced: List[Order] = []
+
+    def __len__(self) -> int:
+        return self.armed
+
+    def add(self, order: Order, reference: float):
+        """
+        Arm a conditional order
+
+        reference is the price a trailing stop starts trailing from (0 if
+        there is none yet); it is ignored for fixed stops.
+        """
+        sign = -1.0 if order.side == OrderSide.BUY else 1.0
+        if order.order_type == OrderType.TRAILING_STOP and reference <= 0:
+            self.unpriced.append(order)
+        elif order.order_type == OrderType.TRAILING_STOP:
+            self.trailing[order.side].add(order, order.trail_amount, sign * reference)
+        else:
+            self.stops[order.side].add(order, sign * order.stop_price)
+        self.armed += 1
+
+    def cancel(self, order: Order):
+        """Account for an armed order the caller is about to close"""
+        if order.is_open:
+            self.armed -= 1
+
+    def trigger(self, low: float, high: float) -> List[Tuple[Order, float]]:
+        """Pop every order the bar's range crosses, with the stop price it triggered at"""
+        triggered: List[Tuple[Order, float]] = []
+        if low > 0:
+            self.stops[OrderSide.SELL].trigger(low, triggered)
+            self.trailing[OrderSide.SELL].trigger(low, triggered)
+        if high > 0:
+            buys: List[Tuple[Order, float]] = []
+            self.stops[OrderSide.BUY].trigger(-high, buys)
+            self.trailing[OrderSide.BUY].trigger(-high, buys)
+            triggered.extend((order, -stop) for order, stop in buys)
+
+        if high > 0:
+            self.trailing[OrderSide.SELL].raise_peak(high)
+        if low > 0:
+            self.trailing[OrderSide.BUY].raise_peak(-low)
+        if self.unpriced and low > 0 and high > 0:
+            for order in self.unpriced:
+                if order.is_open:
+                    if order.side == OrderSide.BUY:
+                        self.trailing[OrderSide.BUY].add(order, order.trail_amount, -low)
+                    else:
+                        self.trailing[OrderSide.SELL].add(order, order.trail_amount, high)
+            self.unpriced.clear()
+
+        self.armed -= len(triggered)
+        return triggered
+
+    def trailing_stops(self) -> Dict[int, float]:
+        """Current stop price of every armed trailing stop, by order id"""
+        stops = self.trailing[OrderSide.SELL].stops(1.0)
+        stops.update(self.trailing[OrderSide.BUY].stops(-1.0))
+        return stops
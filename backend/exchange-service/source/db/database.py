@@ -1,8 +1,11 @@
 # In exchange-service/source/db/database.py
-import asyncpg
 import logging
 import asyncio
-from typing import Dict, Any
+import json
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Any, List, Tuple
+
+if TYPE_CHECKING:
+    import asyncpg
 
 from source.config import config
 
@@ -32,6 +35,9 @@ class DatabaseManager:
             logger.info(f"Database Name: {self.db_config.database}")
             logger.info(f"Username: {self.db_config.user}")
 
+            # Imported on first connect, so replays that never connect do not pay for it
+            import asyncpg
+
             while retry_count < max_retries:
                 try:
                     self.pool = await asyncpg.create_pool(
@@ -80,19 +86,193 @@ class DatabaseManager:
 
         Returns:
             Dict with historical state or empty dict if no state found
+
+        Raises:
+            Exception: if the state cannot be read. An unreadable state is not
+                an absent one; starting empty would checkpoint over it.
         """
         async with self.pool.acquire() as conn:
             try:
-                # Implement database query to retrieve user's historical state
-                # This is a placeholder query, you'll need to adapt it to your database schema
+                row = await conn.fetchrow(
+                    """
+                    SELECT version, cash_balance, positions, open_orders
+                    FROM simulator.exchange_state
+                    WHERE user_id = $1 AND desk_id = $2
+                    """,
+                    user_id, desk_id
+                )
+
+                if not row:
+                    return {}
 
                 return {
-                    'cash_balance': 1000,
-                    'positions': {}
+                    'version': row['version'],
+                    'cash_balance': float(row['cash_balance']),
+                    'positions': json.loads(row['positions']),
+                    'open_orders': json.loads(row['open_orders'])
                 }
 
+            except Exception as e:
+                logger.error(f"Error loading user exchange state: {e}")
+                raise
+
+    async def load_book_limits(self, user_id: str, book_id: str) -> Dict[str, Any]:
+        """
+        Load a book's exposure limits from trading.books
+
+        Args:
+            user_id (str): User identifier
+            book_id (str): Book identifier (the exchange's desk id)
+
+        Returns:
+            Dict with max_position_size and max_total_risk (None where the
+            book leaves them unset), or empty dict if there is no such book
+        """
+        async with self.pool.acquire() as conn:
+            try:
+                row = await conn.fetchrow(
+                    """
+                    SELECT max_position_size::float8, max_total_risk::float8
+                    FROM trading.books
+                    WHERE book_id::text = $1 AND user_id = $2
+                    """,
+                    book_id, user_id
+                )
+
+                if not row:
+                    return {}
+
+                return {
+                    'max_position_size': row['max_position_size'],
+                    'max_total_risk': row['max_total_risk']
+                }
+
+            except Exception as e:
+                logger.error(f"Error loading book limits: {e}")
                 return {}
 
+    async def stream_market_data(
+            self,
+            symbols: List[str],
+            start_time: int,
+            end_time: int,
+            batch_size: int = 5000
+    ) -> AsyncGenerator[List['asyncpg.Record'], None]:
+        """
+        Stream historical bars in timestamp order through a server-side cursor
+
+        Args:
+            symbols: Symbols to include
+            start_time: Inclusive start, epoch milliseconds
+            end_time: Exclusive end, epoch milliseconds
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Batches of rows with symbol, timestamp, open, high, low, close,
+            volume, trade_count and vwap
+        """
+        async with self.pool.acquire() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction(readonly=True):
+                cursor = await conn.cursor(
+                    """
+                    SELECT symbol, timestamp, open::float8, high::float8, low::float8, close::float8,
+                           volume, COALESCE(trade_count, 0) AS trade_count, COALESCE(vwap, 0)::float8 AS vwap
+                    FROM marketdata.market_data
+                    WHERE symbol = ANY($1::text[]) AND timestamp >= $2 AND timestamp < $3
+                    ORDER BY timestamp, symbol
+                    """,
+                    symbols, start_time, end_time
+                )
+                while True:
+                    rows = await cursor.fetch(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+
+    async def save_exchange_states(self, states: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert a batch of exchange state checkpoints
+
+        Args:
+            states: Checkpoints with user_id, desk_id, version, cash_balance,
+                positions and open_orders
+
+        Returns:
+            True if the batch was written
+        """
+        if not states:
+            return True
+
+        async with self.pool.acquire() as conn:
+            try:
+                await conn.executemany(
+                    """
+                    INSERT INTO simulator.exchange_state
+                        (user_id, desk_id, version, cash_balance, positions, open_orders, updated_at)
+                    VALUES ($1, $2, $3, $4, $5::jsonb, $6::jsonb, NOW())
+                    ON CONFLICT (user_id, desk_id) DO UPDATE SET
+                        version = EXCLUDED.version,
+                        cash_balance = EXCLUDED.cash_balance,
+                        positions = EXCLUDED.positions,
+                        open_orders = EXCLUDED.open_orders,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    [
+                        (
+                            state['user_id'],
+                            state['desk_id'],
+                            state['version'],
+                            state['cash_balance'],
+                            json.dumps(state['positions'], separators=(',', ':')),
+                            json.dumps(state['open_orders'], separators=(',', ':'))
+                        )
+                        for state in states
+                    ]
+                )
+                return True
+
             except Exception as e:
-                logger.error(f"Error loading user exchange state: {e}")
-                return {}
\ No newline at end of file
+                logger.error(f"Error saving exchange state checkpoints: {e}")
+                return False
+
+    async def save_closed_orders(self, rows: List[Tuple]) -> bool:
+        """
+        Append a batch of closed orders to simulator.closed_orders
+
+        Args:
+            rows: (user_id, desk_id, order_id, symbol, side, order_type,
+                status, quantity, price, filled_quantity, average_price,
+                error_message, created_at, closed_at) with times in epoch seconds
+
+        Returns:
+            True if the batch was written
+        """
+        if not rows:
+            return True
+
+        async with self.pool.acquire() as conn:
+            try:
+                # One statement for the whole batch: a column array per field
+                columns = [list(column) for column in zip(*rows)]
+                await conn.execute(
+                    """
+                    INSERT INTO simulator.closed_orders
+                        (user_id, desk_id, order_id, symbol, side, order_type, status, quantity, price,
+                         filled_quantity, average_price, error_message, created_at, closed_at)
+                    SELECT user_id, desk_id, order_id, symbol, side, order_type, status, quantity, price,
+                           filled_quantity, average_price, error_message,
+                           to_timestamp(created_at), to_timestamp(closed_at)
+                    FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[],
+                                $7::text[], $8::float8[], $9::float8[], $10::float8[], $11::float8[],
+                                $12::text[], $13::float8[], $14::float8[])
+                        AS t(user_id, desk_id, order_id, symbol, side, order_type, status, quantity, price,
+                             filled_quantity, average_price, error_message, created_at, closed_at)
+                    """,
+                    *columns
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"Error saving closed orders: {e}")
+                return False
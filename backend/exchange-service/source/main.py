@@ -1,3 +1,8 @@
+import time
+
+# Taken before the imports below, which are part of what startup spends
+STARTED_AT = time.perf_counter()
+
 import asyncio
 import logging
 import grpc
@@ -8,13 +13,16 @@ from source.config import config
 from source.utils.logging import setup_logging
 from source.utils.metrics import setup_metrics
 from source.utils.tracing import setup_tracing
+from source.utils.startup import StartupProfile
 
 from source.core.exchange_manager import ExchangeManager
+from source.core.tenant_registry import TenantRegistry
+from source.core.recorder import SessionRecorder
+from source.core.backtest import BacktestRunner
+from source.utils.clock import VirtualClock
 
-from source.api.service import ExchangeSimulatorService
-
-from source.api.grpc.session_exchange_interface_pb2_grpc import add_SessionExchangeSimulatorServicer_to_server
-from source.api.grpc.order_exchange_interface_pb2_grpc import add_OrderExchangeSimulatorServicer_to_server
+from source.api.rest.health import HealthService
+from source.api.service import ExchangeSimulatorService, add_order_servicer_to_server, add_session_servicer_to_server
 
 logger = logging.getLogger('exchange_simulator')
 
@@ -22,7 +30,11 @@ logger = logging.getLogger('exchange_simulator')
 class ExchangeSimulator:
     def __init__(self):
         self.exchange_manager = None
+        self.tenant_registry = None
         self.grpc_server = None
+        self.backtest_task = None
+        self.health_service = None
+        self.startup = StartupProfile(STARTED_AT)
 
     async def initialize_exchange(self):
         """
@@ -37,14 +49,35 @@ class ExchangeSimulator:
             if not user_id:
                 raise ValueError("User ID is required to initialize exchange")
 
+            if config.simulator.multi_tenant:
+                if config.backtest.enabled or config.recorder.path:
+                    raise ValueError("Backtesting and session recording are single-tenant only")
+
+                # The configured user becomes the default tenant; others are created on first call
+                self.tenant_registry = TenantRegistry(default_tenant=(user_id, desk_id))
+                await self.tenant_registry.start()
+                self.exchange_manager = await self.tenant_registry.get_or_create(user_id, desk_id)
+
+                logger.info(f"Multi-tenant exchange initialized, default user {user_id}, desk {desk_id}")
+                return self.exchange_manager
+
+            # Backtests run on simulated time taken from the historical bars
+            backtest = config.backtest.enabled
+            clock = VirtualClock(config.backtest.start_time / 1000) if backtest else None
+
             # Create Exchange Manager
             self.exchange_manager = ExchangeManager(
                 user_id=user_id,
-                desk_id=desk_id
+                desk_id=desk_id,
+                clock=clock
             )
 
+            # Record the session if asked to
+            if config.recorder.path:
+                self.exchange_manager.attach_recorder(SessionRecorder(config.recorder.path))
+
             # Perform initial setup
-            await self.exchange_manager.initialize()
+            await self.exchange_manager.initialize(live_market_data=not backtest, persist=not backtest)
 
             logger.info(f"Exchange initialized for User ID: {user_id}")
             logger.info(f"Desk ID: {desk_id}")
@@ -69,9 +102,10 @@ class ExchangeSimulator:
         )
 
         # Create and add service
-        self.simulator_service = ExchangeSimulatorService(self.exchange_manager)
-        add_SessionExchangeSimulatorServicer_to_server(self.simulator_service, self.grpc_server)
-        add_OrderExchangeSimulatorServicer_to_server(self.simulator_service, self.grpc_server)
+        self.simulator_service = ExchangeSimulatorService(
+            self.exchange_manager, self.tenant_registry, health_service=self.health_service)
+        add_session_servicer_to_server(self.simulator_service, self.grpc_server)
+        add_order_servicer_to_server(self.simulator_service, self.grpc_server)
 
         # Bind server to port
         listen_addr = f'{config.server.host}:{config.server.grpc_port}'
@@ -81,35 +115,56 @@ class ExchangeSimulator:
 
     async def setup_observability(self):
         """Setup tracing and metrics"""
-        if config.tracing.enabled:
-            setup_tracing()
         if config.metrics.enabled:
             setup_metrics()
+        if config.tracing.enabled:
+            # The OpenTelemetry SDK and exporter are slow to import; do it off the event loop
+            await asyncio.to_thread(setup_tracing)
 
     async def start(self):
         """
         Full startup sequence for the exchange simulator
+
+        Liveness is served first and readiness as soon as the gRPC server is
+        up with the exchange state restored. Tracing is set up alongside the
+        exchange rather than before it, so spans from the first moments of
+        startup may go untraced.
         """
         try:
             # Setup logging
             setup_logging()
             logger.info("Starting Exchange Simulator")
+            self.startup.mark('imports')
+
+            # Answer probes while starting up; readiness stays 503 until ready
+            self.health_service = HealthService(http_port=config.server.http_port, startup=self.startup)
+            await self.health_service.setup()
+            self.startup.mark('health_server')
 
-            # Setup observability
-            await self.setup_observability()
+            # Setup observability alongside the exchange
+            observability_task = asyncio.create_task(self.setup_observability())
 
             # Initialize exchange
             await self.initialize_exchange()
+            self.startup.mark('exchange')
 
             # Create gRPC server
             server, listen_addr = await self.create_grpc_server()
 
-            # Start HTTP health server (add this line)
-            await self.simulator_service.start_health_service()
-            
             # Start server
             await server.start()
             logger.info(f"gRPC Exchange Simulator started on {listen_addr}")
+            self.startup.mark('grpc_server')
+
+            # A stream subscriber now gets the restored state as its snapshot
+            self.health_service.ready = True
+            self.startup.ready()
+
+            await observability_task
+
+            # Drive the exchange from history instead of the live feed
+            if config.backtest.enabled:
+                self.backtest_task = asyncio.create_task(self.run_backtest())
 
             # Keep server running
             await server.wait_for_termination()
@@ -118,16 +173,36 @@ class ExchangeSimulator:
             logger.error(f"Failed to start Exchange Simulator: {e}")
             raise
 
+    async def run_backtest(self):
+        """Run the configured backtest and keep its report for the health server"""
+        try:
+            runner = BacktestRunner(
+                self.exchange_manager,
+                symbols=config.backtest.symbols or config.simulator.default_symbols,
+                start_time=config.backtest.start_time,
+                end_time=config.backtest.end_time,
+                fetch_batch_size=config.backtest.fetch_batch_size
+            )
+            self.exchange_manager.backtest_report = await runner.run()
+        except Exception as e:
+            logger.error(f"Backtest failed: {e}")
+            self.exchange_manager.backtest_report = {'error': str(e)}
+
     async def stop(self):
         """Gracefully stop the exchange and server"""
         try:
-            if hasattr(self, 'simulator_service') and self.simulator_service:
-                await self.simulator_service.stop_health_service()
+            if self.health_service:
+                await self.health_service.shutdown()
                 
+            if self.backtest_task:
+                self.backtest_task.cancel()
+
             if self.grpc_server:
                 await self.grpc_server.stop(0)
 
-            if self.exchange_manager:
+            if self.tenant_registry:
+                await self.tenant_registry.stop()
+            elif self.exchange_manager:
                 await self.exchange_manager.cleanup()
 
             logger.info("Exchange Simulator stopped successfully")
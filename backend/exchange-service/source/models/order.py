@@ -1,32 +1,74 @@
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Optional
-from source.models.enums import OrderSide, OrderType, OrderStatus
+from source.models.enums import OrderSide, OrderType, OrderStatus, TimeInForce
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
+    """
+    An exchange order.
+
+    Slotted, with a dense integer id minted by the exchange's OrderIdMap;
+    the client's string id only exists at the API edge. Symbols should be
+    interned so every order on a symbol shares one string.
+
+    Stop, stop-limit and trailing-stop orders wait in a TriggerBook; when
+    they trigger their order_type becomes MARKET or LIMIT and stop_price
+    records the price they triggered at.
+
+    DAY and GTD orders carry the time they expire at (epoch seconds) in
+    expire_at; IOC and FOK orders never rest, so they have none.
+    """
     symbol: str
     side: OrderSide
     quantity: float
     order_type: OrderType
     price: Optional[float] = None
-    order_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    order_id: int = 0
     status: OrderStatus = OrderStatus.NEW
     filled_quantity: float = 0
     average_price: float = 0
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
     error_message: Optional[str] = None
+    stop_price: Optional[float] = None
+    trail_amount: Optional[float] = None
+    time_in_force: TimeInForce = TimeInForce.GTC
+    expire_at: float = 0
+
+    @property
+    def remaining_quantity(self) -> float:
+        return self.quantity - self.filled_quantity
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in (OrderStatus.NEW, OrderStatus.PARTIALLY_FILLED)
 
-    def update(self, filled_quantity: float, average_price: float):
+    def update(self, filled_quantity: float, average_price: float, timestamp: Optional[float] = None):
         """Update order status based on execution"""
-        self.filled_quantity += filled_quantity
-        self.average_price = average_price
-        self.updated_at = time.time()
+        total_quantity = self.filled_quantity + filled_quantity
+        if total_quantity > 0:
+            self.average_price = (
+                self.average_price * self.filled_quantity + average_price * filled_quantity
+            ) / total_quantity
+        self.filled_quantity = total_quantity
+        self.updated_at = timestamp if timestamp is not None else time.time()
 
         if self.filled_quantity >= self.quantity:
             self.status = OrderStatus.FILLED
         elif self.filled_quantity > 0:
             self.status = OrderStatus.PARTIALLY_FILLED
+
+
+@dataclass(slots=True)
+class Fill:
+    """A single execution against an order"""
+    order_id: int
+    symbol: str
+    side: OrderSide
+    quantity: float
+    price: float
+    timestamp: float = field(default_factory=time.time)
+    remaining_quantity: float = 0  # left open on the order after this fill
+    sequence: int = 0  # assigned by the exchange as fills are applied
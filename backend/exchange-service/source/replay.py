@@ -0,0 +1,157 @@
+# source/replay.py
+"""
+Deterministic replay of a recorded exchange session.
+
+Starts an ExchangeManager from the recorded initial state (the restored
+portfolio, open orders, symbols and risk limits), then feeds every recorded
+market data update, order/cancel/amend batch, symbol change and expiry
+sweep back into it as fast as possible, with no database, market data
+service or wall-clock pacing involved, and checks that the fills produced
+match the digest written when the session was recorded. The exchange runs
+on a virtual clock moved to each record's timestamp, so order timestamps,
+DAY and GTD deadlines and expiries read the same time they did when
+recorded.
+
+Usage: python -m source.replay <recording> [--output report.json]
+"""
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict
+
+from source.config import config
+from source.core.exchange_manager import ExchangeManager
+from source.core.market_data_manager import convert_market_data_update
+from source.core.recorder import (
+    read_recording, update_fill_digest,
+    MARKET_DATA, SUBMIT_ORDERS, CANCEL_ORDERS, AMEND_ORDERS, UPDATE_SYMBOLS, EXPIRE_ORDERS, FILL_DIGEST,
+    INITIAL_STATE
+)
+from source.api.service import ExchangeSimulatorService
+from source.api.grpc.market_exchange_interface_pb2 import MarketDataUpdate
+from source.api.grpc.order_exchange_interface_pb2 import BatchOrderRequest, BatchCancelRequest, BatchAmendRequest
+from source.api.grpc.session_exchange_interface_pb2 import UpdateSymbolsRequest
+from source.utils.clock import VirtualClock
+
+logger = logging.getLogger('replay')
+
+
+async def replay(path: str, user_id: str = None, desk_id: str = None) -> Dict[str, Any]:
+    """
+    Replay a recording and report throughput and whether the outputs matched
+
+    Args:
+        path: Recording written by SessionRecorder
+        user_id: User to replay as (defaults to the configured user)
+        desk_id: Desk to replay as (defaults to the configured desk)
+
+    Returns:
+        Report with event counts, timing, fill digests and the final portfolio
+    """
+    records = read_recording(path)
+    first = next(records, None)
+    initial_state = None
+    if first is not None and first[0] == INITIAL_STATE:
+        initial_state = json.loads(bytes(first[2]))
+    elif first is not None:
+        # Recorded before initial states were: starts from a fresh account
+        records = itertools.chain([first], records)
+
+    # Start the clock at the first record so timers are set up from the recorded time
+    clock = VirtualClock(first[1] if first else 0.0)
+    exchange_manager = ExchangeManager(
+        user_id=user_id or config.simulator.user_id,
+        desk_id=desk_id or config.simulator.desk_id,
+        clock=clock,
+        symbols=initial_state['symbols'] if initial_state else None
+    )
+    if initial_state:
+        exchange_manager.start_from(initial_state)
+    service = ExchangeSimulatorService(exchange_manager)
+
+    fill_digest = hashlib.sha256()
+    fill_count = 0
+
+    def observe_fills(fills):
+        nonlocal fill_count
+        fill_count += len(fills)
+        update_fill_digest(fill_digest, fills)
+
+    exchange_manager.fill_listeners.append(observe_fills)
+
+    counts = {MARKET_DATA: 0, SUBMIT_ORDERS: 0, CANCEL_ORDERS: 0, AMEND_ORDERS: 0, UPDATE_SYMBOLS: 0,
+              EXPIRE_ORDERS: 0}
+    recorded_digest = None
+    start_time = time.perf_counter()
+
+    for kind, timestamp, payload in records:
+        clock.advance_to(timestamp)
+        if kind == MARKET_DATA:
+            update = MarketDataUpdate.FromString(payload)
+            await exchange_manager.update_market_data(convert_market_data_update(update))
+        elif kind == SUBMIT_ORDERS:
+            await service.SubmitOrders(BatchOrderRequest.FromString(payload), None)
+        elif kind == CANCEL_ORDERS:
+            await service.CancelOrders(BatchCancelRequest.FromString(payload), None)
+        elif kind == AMEND_ORDERS:
+            await service.AmendOrders(BatchAmendRequest.FromString(payload), None)
+        elif kind == UPDATE_SYMBOLS:
+            await service.UpdateSymbols(UpdateSymbolsRequest.FromString(payload), None)
+        elif kind == EXPIRE_ORDERS:
+            exchange_manager.expire_orders()
+        elif kind == FILL_DIGEST:
+            recorded_digest = bytes(payload).hex()
+            continue
+        else:
+            logger.warning(f"Skipping unknown record kind {kind}")
+            continue
+        counts[kind] += 1
+
+    elapsed = time.perf_counter() - start_time
+    events = sum(counts.values())
+    replay_digest = fill_digest.hexdigest()
+
+    return {
+        'recording': path,
+        'market_data_updates': counts[MARKET_DATA],
+        'order_batches': counts[SUBMIT_ORDERS],
+        'cancel_batches': counts[CANCEL_ORDERS],
+        'amend_batches': counts[AMEND_ORDERS],
+        'symbol_updates': counts[UPDATE_SYMBOLS],
+        'expiry_sweeps': counts[EXPIRE_ORDERS],
+        'fills': fill_count,
+        'elapsed_seconds': elapsed,
+        'events_per_second': events / elapsed if elapsed > 0 else 0.0,
+        'fill_digest': replay_digest,
+        'recorded_fill_digest': recorded_digest,
+        'identical': recorded_digest == replay_digest if recorded_digest else None,
+        'cash_balance': exchange_manager.cash_balance,
+        'positions': exchange_manager.positions.to_dict()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded exchange session")
+    parser.add_argument('recording', help="Path to the session recording")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(replay(args.recording))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if report['identical'] is False:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# source/utils/clock.py
+import time
+
+
+class Clock:
+    """Wall-clock time, in seconds since the epoch"""
+
+    def now(self) -> float:
+        return time.time()
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when told to, e.g. by historical bar timestamps"""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance_to(self, timestamp: float):
+        """Move the clock forward; it never runs backwards"""
+        if timestamp > self._now:
+            self._now = timestamp
@@ -1,11 +1,33 @@
 import logging
 import threading
-from prometheus_client import start_http_server, Counter, Histogram, Gauge
 
 from source.config import config
 
 logger = logging.getLogger('metrics')
 
+if config.metrics.enabled:
+    from prometheus_client import start_http_server, Counter, Histogram, Gauge
+else:
+    class _NullMetric:
+        """Stands in for every metric when metrics are off, so prometheus_client is never imported"""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs):
+            return self
+
+        def inc(self, amount=1):
+            pass
+
+        def set(self, value):
+            pass
+
+        def observe(self, value):
+            pass
+
+    Counter = Histogram = Gauge = _NullMetric
+
 # gRPC Method Metrics
 GRPC_REQUESTS = Counter(
     'exchange_grpc_requests_total', 
@@ -30,6 +52,41 @@ MARKET_DATA_UPDATES = Counter(
     'Total market data updates'
 )
 
+MARKET_DATA_GAP_UPDATES = Counter(
+    'exchange_market_data_gap_updates_total',
+    'Market data updates missing from the stream, by whether backfill recovered them',
+    ['result']
+)
+
+RISK_REJECTIONS = Counter(
+    'exchange_risk_rejections_total',
+    'Orders rejected by the pre-trade risk checks',
+    ['reason']
+)
+
+ORDERS_EXPIRED = Counter(
+    'exchange_orders_expired_total',
+    'Orders expired by their time in force',
+    ['time_in_force']
+)
+
+# Hot path latency, from a market data bar to the client stream. Buckets
+# reach down to 100us since most in-process stages are well under 1ms.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+STAGE_LATENCY = Histogram(
+    'exchange_stage_latency_seconds',
+    'Time spent in each stage between a market data bar and the client stream',
+    ['stage'],
+    buckets=LATENCY_BUCKETS
+)
+
+TICK_TO_STREAM_LATENCY = Histogram(
+    'exchange_tick_to_stream_seconds',
+    'From the market data service publishing a bar to the update carrying it being written to a client stream',
+    buckets=LATENCY_BUCKETS
+)
+
 # Add these metrics
 STREAM_CONNECTIONS = Counter(
     'exchange_stream_connections_total', 
@@ -43,6 +100,33 @@ STREAM_UPDATES_SENT = Counter(
     ['client_id']
 )
 
+STREAM_SUBSCRIBERS = Gauge(
+    'exchange_stream_subscribers',
+    'Number of connected exchange data stream subscribers'
+)
+
+STREAM_UPDATES_COALESCED = Counter(
+    'exchange_stream_updates_coalesced_total',
+    'Published updates merged into a later one before a slow subscriber took them'
+)
+
+STREAM_RESYNCS = Counter(
+    'exchange_stream_resyncs_total',
+    'Times a stream subscriber was moved onto a snapshot because its version aged out'
+)
+
+SNAPSHOT_CACHE_REQUESTS = Counter(
+    'exchange_snapshot_cache_requests_total',
+    'Stream update cache lookups',
+    ['kind', 'result']
+)
+
+STARTUP_PHASE_DURATION = Gauge(
+    'exchange_startup_phase_seconds',
+    'Wall time of each startup phase of the last start',
+    ['phase']
+)
+
 def setup_metrics():
     """Start Prometheus metrics server"""
     try:
@@ -58,6 +142,10 @@ def setup_metrics():
     except Exception as e:
         logger.error(f"Failed to start metrics server: {e}")
 
+def track_startup_phase(phase, seconds):
+    """Track how long a startup phase took"""
+    STARTUP_PHASE_DURATION.labels(phase=phase).set(seconds)
+
 def track_grpc_request(method):
     """Track gRPC request metrics"""
     GRPC_REQUESTS.labels(method=method).inc()
@@ -72,4 +160,43 @@ def track_active_simulators(count):
 
 def track_market_data_update():
     """Track market data updates"""
-    MARKET_DATA_UPDATES.inc()
\ No newline at end of file
+    MARKET_DATA_UPDATES.inc()
+
+def track_market_data_gap(recovered, lost):
+    """Track market data updates recovered or lost after a sequence gap"""
+    if recovered:
+        MARKET_DATA_GAP_UPDATES.labels(result='recovered').inc(recovered)
+    if lost:
+        MARKET_DATA_GAP_UPDATES.labels(result='lost').inc(lost)
+
+def track_risk_rejections(reason, count=1):
+    """Track orders rejected by a pre-trade risk check"""
+    RISK_REJECTIONS.labels(reason=reason).inc(count)
+
+def track_orders_expired(time_in_force, count=1):
+    """Track orders expired by their time in force"""
+    ORDERS_EXPIRED.labels(time_in_force=time_in_force).inc(count)
+
+def track_stage_latency(stage, seconds):
+    """Track time spent in one hot path stage"""
+    STAGE_LATENCY.labels(stage=stage).observe(seconds)
+
+def track_tick_to_stream(seconds):
+    """Track end-to-end latency from market data publication to a stream write"""
+    TICK_TO_STREAM_LATENCY.observe(seconds)
+
+def track_stream_subscribers(count):
+    """Track number of connected stream subscribers"""
+    STREAM_SUBSCRIBERS.set(count)
+
+def track_stream_coalesced(count):
+    """Track updates folded into one delta for a subscriber"""
+    STREAM_UPDATES_COALESCED.inc(count)
+
+def track_stream_resync():
+    """Track a stream subscriber falling back to a snapshot"""
+    STREAM_RESYNCS.inc()
+
+def track_snapshot_cache(kind, hit):
+    """Track a stream update cache hit or miss"""
+    SNAPSHOT_CACHE_REQUESTS.labels(kind=kind, result='hit' if hit else 'miss').inc()
\ No newline at end of file
@@ -0,0 +1,52 @@
+# source/utils/startup.py
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from source.config import config
+from source.utils.metrics import track_startup_phase
+
+logger = logging.getLogger('startup')
+
+
+class StartupProfile:
+    """
+    Wall time of each startup phase, from the first line of main to ready.
+
+    Each session waits on a fresh simulator, so these phases are latency the
+    user sees. They are logged once the service is ready, exported as
+    metrics and reported by the readiness probe, and a start that runs past
+    the configured budget is logged as a warning.
+    """
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.last_mark = started_at
+        self.phases: Dict[str, float] = {}
+        self.ready_seconds: Optional[float] = None
+
+    def mark(self, phase: str):
+        """End a phase that began at the previous mark"""
+        now = time.perf_counter()
+        self.phases[phase] = now - self.last_mark
+        self.last_mark = now
+        track_startup_phase(phase, self.phases[phase])
+
+    def ready(self):
+        """Record the service as ready and check the total against the budget"""
+        self.ready_seconds = time.perf_counter() - self.started_at
+        track_startup_phase('total', self.ready_seconds)
+
+        breakdown = ', '.join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in self.phases.items())
+        budget = config.startup.budget_seconds
+        if budget and self.ready_seconds > budget:
+            logger.warning(f"Ready after {self.ready_seconds:.2f}s, over the {budget:.2f}s startup budget ({breakdown})")
+        else:
+            logger.info(f"Ready after {self.ready_seconds:.2f}s ({breakdown})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'phases': self.phases,
+            'ready_seconds': self.ready_seconds,
+            'budget_seconds': config.startup.budget_seconds
+        }
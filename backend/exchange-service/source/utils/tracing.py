@@ -1,9 +1,4 @@
 import logging
-from opentelemetry import trace
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 
 from source.config import config
 
@@ -16,6 +11,14 @@ def setup_tracing():
         return False
 
     try:
+        # Imported here: the SDK and exporter take longer to import than the
+        # rest of startup, and are not needed at all with tracing disabled
+        from opentelemetry import trace
+        from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+
         # Create resource with service name
         resource = Resource(attributes={
             SERVICE_NAME: config.tracing.service_name
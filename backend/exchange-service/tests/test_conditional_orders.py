@@ -0,0 +1,44 @@
+# tests/test_conditional_orders.py
+import asyncio
+
+from source.config import config
+from source.core.exchange_manager import ExchangeManager
+from source.models.enums import OrderStatus
+
+
+def bar(symbol, close, volume=100):
+    return {'symbol': symbol, 'open': close, 'high': close, 'low': close, 'close': close,
+            'volume': volume, 'trade_count': 1, 'vwap': close}
+
+
+def test_triggered_ioc_stop_without_liquidity_expires_and_retires(monkeypatch):
+    # Each side of a 100-share bar can fill 1 share
+    monkeypatch.setattr(config.matching, 'participation_rate', 0.01)
+    monkeypatch.setattr(config.risk, 'check_buying_power', False)
+
+    async def run():
+        exchange_manager = ExchangeManager('user', 'desk', symbols=['AAPL'])
+        await exchange_manager.update_market_data([bar('AAPL', 100)])
+
+        # The first market buy takes this bar's only share; the second queues
+        # and takes the next bar's before the stop triggers
+        await exchange_manager.submit_order('AAPL', 'BUY', 1, 'MARKET', None, 'market-1')
+        await exchange_manager.submit_order('AAPL', 'BUY', 1, 'MARKET', None, 'market-2')
+        await exchange_manager.submit_order('AAPL', 'BUY', 5, 'STOP', None, 'stop',
+                                            stop_price=105, time_in_force='IOC')
+        version = exchange_manager.changes.version
+        await exchange_manager.update_market_data([bar('AAPL', 110)])
+        return exchange_manager, version
+
+    exchange_manager, version = asyncio.run(run())
+    order_manager = exchange_manager.order_manager
+    order_id = exchange_manager.order_ids.internal('stop')
+
+    stop = order_manager.get_order(order_id)
+    assert stop.status == OrderStatus.EXPIRED
+    assert stop.filled_quantity == 0
+    # Retired from the open-order index, and carried by the update's delta
+    assert order_id not in order_manager.orders
+    assert order_id in order_manager.closed
+    assert order_id in exchange_manager.changes.changes_since(version).orders
+    assert exchange_manager.risk.open_buy_value == 0
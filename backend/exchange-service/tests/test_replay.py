@@ -0,0 +1,82 @@
+# tests/test_replay.py
+import asyncio
+
+from source.config import config
+from source.core.exchange_manager import ExchangeManager
+from source.core.market_data_manager import convert_market_data_update
+from source.core.recorder import SessionRecorder, read_recording, INITIAL_STATE
+from source.api.service import ExchangeSimulatorService
+from source.api.grpc.market_exchange_interface_pb2 import MarketDataUpdate, SymbolData
+from source.api.grpc.order_exchange_interface_pb2 import BatchOrderRequest, OrderRequest
+from source.models.enums import OrderStatus
+from source.replay import replay
+
+SAVED_STATE = {
+    'cash_balance': 5000.0,
+    'positions': {'AAPL': {'quantity': 10.0, 'average_cost': 90.0}},
+    'open_orders': [
+        {'order_id': 'resting-buy', 'symbol': 'AAPL', 'side': 'BUY', 'type': 'LIMIT', 'quantity': 20.0,
+         'price': 95.0, 'filled_quantity': 0.0, 'average_price': 0.0, 'created_at': 1.0, 'stop_price': None,
+         'trail_amount': None, 'time_in_force': 'GTC', 'expire_at': 0},
+        {'order_id': 'take-profit', 'symbol': 'AAPL', 'side': 'SELL', 'type': 'LIMIT', 'quantity': 10.0,
+         'price': 105.0, 'filled_quantity': 0.0, 'average_price': 0.0, 'created_at': 1.0, 'stop_price': None,
+         'trail_amount': None, 'time_in_force': 'GTC', 'expire_at': 0},
+    ]
+}
+
+
+class SavedStateDatabase:
+    """Serves a checkpoint and a book limit the configuration does not have"""
+
+    async def load_user_exchange_state(self, user_id, desk_id):
+        return SAVED_STATE
+
+    async def load_book_limits(self, user_id, desk_id):
+        return {'max_position_size': 3000.0}
+
+
+async def feed(exchange_manager, close):
+    update = MarketDataUpdate(data=[SymbolData(symbol='AAPL', open=close, high=close, low=close, close=close,
+                                               volume=100000, trade_count=1, vwap=close)])
+    exchange_manager.recorder.record_market_data(update)
+    await exchange_manager.update_market_data(convert_market_data_update(update))
+
+
+def test_replay_starts_from_restored_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(config.risk, 'check_buying_power', True)
+    monkeypatch.setattr(config.risk, 'max_position_size', 0)
+    monkeypatch.setattr(config.risk, 'max_total_risk', 0)
+    path = str(tmp_path / 'session.rec')
+
+    async def record():
+        exchange_manager = ExchangeManager('user', 'desk', symbols=['AAPL'], database_manager=SavedStateDatabase())
+        exchange_manager.attach_recorder(SessionRecorder(path, chunk_size=4096))
+        await exchange_manager.initialize(live_market_data=False)
+        service = ExchangeSimulatorService(exchange_manager)
+
+        await feed(exchange_manager, 94)
+        # Over the book's position limit, and the restored cash, but within the configured ones
+        await service.SubmitOrders(BatchOrderRequest(orders=[
+            OrderRequest(symbol='AAPL', side=OrderRequest.BUY, quantity=5, price=100, type=OrderRequest.LIMIT,
+                         request_id='over-limit'),
+            OrderRequest(symbol='AAPL', side=OrderRequest.BUY, quantity=100, price=93, type=OrderRequest.LIMIT,
+                         request_id='over-cash'),
+        ]), None)
+        await feed(exchange_manager, 106)
+        exchange_manager.recorder.close()
+        return exchange_manager
+
+    exchange_manager = asyncio.run(record())
+    for request_id in ('over-limit', 'over-cash'):
+        order = exchange_manager.order_manager.get_order(exchange_manager.order_ids.internal(request_id))
+        assert order.status == OrderStatus.REJECTED
+    assert exchange_manager.positions.get('AAPL')['quantity'] == 20
+
+    kinds = [kind for kind, _, _ in read_recording(path)]
+    assert kinds[0] == INITIAL_STATE
+
+    report = asyncio.run(replay(path))
+    assert report['fills'] == 2
+    assert report['identical'] is True
+    assert report['cash_balance'] == exchange_manager.cash_balance
+    assert report['positions'] == exchange_manager.positions.to_dict()
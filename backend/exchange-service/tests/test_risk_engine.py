@@ -0,0 +1,82 @@
+# tests/test_risk_engine.py
+import asyncio
+
+import numpy as np
+
+from source.config import config
+from source.core.exchange_manager import ExchangeManager
+from source.core.order_batch import OrderBatch, ACCEPTED, INSUFFICIENT_POSITION, REJECT_REASONS
+from source.core.order_ids import OrderIdMap
+from source.api.grpc.order_exchange_interface_pb2 import BatchOrderRequest, OrderRequest
+from source.models.enums import OrderSide, OrderStatus
+from source.models.order import Fill
+
+
+def bar(symbol, close, volume=100):
+    return {'symbol': symbol, 'open': close, 'high': close, 'low': close, 'close': close,
+            'volume': volume, 'trade_count': 1, 'vwap': close}
+
+
+def new_exchange(monkeypatch, held=20):
+    monkeypatch.setattr(config.risk, 'check_buying_power', False)
+    monkeypatch.setattr(config.risk, 'max_position_size', 0)
+    monkeypatch.setattr(config.risk, 'max_total_risk', 0)
+    exchange_manager = ExchangeManager('user', 'desk', initial_cash=1000, symbols=['AAPL', 'MSFT'])
+    asyncio.run(exchange_manager.update_market_data([bar('AAPL', 100), bar('MSFT', 100)]))
+    exchange_manager.mark_to_market.update_position('AAPL', held, 100.0)
+    return exchange_manager
+
+
+def sell(exchange_manager, quantity, request_id):
+    return asyncio.run(exchange_manager.submit_order('AAPL', 'SELL', quantity, 'LIMIT', 200, request_id))
+
+
+def test_sell_beyond_position_rejected(monkeypatch):
+    exchange_manager = new_exchange(monkeypatch)
+
+    result = sell(exchange_manager, 100, 'oversell')
+    assert not result['success']
+    assert result['error_message'] == REJECT_REASONS[INSUFFICIENT_POSITION]
+
+    # Open sells count against the position
+    assert sell(exchange_manager, 15, 'sell-1')['success']
+    assert not sell(exchange_manager, 10, 'sell-2')['success']
+    assert sell(exchange_manager, 5, 'sell-3')['success']
+    assert exchange_manager.risk.open_sells['AAPL'] == 20
+
+    # Cancelling one frees its quantity again
+    asyncio.run(exchange_manager.cancel_order(exchange_manager.order_ids.internal('sell-1')))
+    assert sell(exchange_manager, 15, 'sell-4')['success']
+    assert exchange_manager.cash_balance == 1000
+
+
+def test_batch_sells_checked_in_request_order(monkeypatch):
+    exchange_manager = new_exchange(monkeypatch)
+    request = BatchOrderRequest(orders=[
+        OrderRequest(symbol=symbol, side=OrderRequest.SELL, quantity=quantity, price=200,
+                     type=OrderRequest.LIMIT, request_id=f'sell-{i}')
+        for i, (symbol, quantity) in enumerate([('AAPL', 15), ('AAPL', 10), ('MSFT', 1), ('AAPL', 5)])
+    ])
+    batch = OrderBatch.from_request(request, OrderIdMap())
+    exchange_manager.risk.check_batch(batch, np.full(len(batch.unique_symbols), 100.0))
+    assert batch.reasons.tolist() == [ACCEPTED, INSUFFICIENT_POSITION, INSUFFICIENT_POSITION, ACCEPTED]
+
+
+def test_batch_sells_within_position_accepted(monkeypatch):
+    exchange_manager = new_exchange(monkeypatch)
+    request = BatchOrderRequest(orders=[
+        OrderRequest(symbol='AAPL', side=OrderRequest.SELL, quantity=10, price=200,
+                     type=OrderRequest.LIMIT, request_id=f'sell-{i}')
+        for i in range(2)
+    ])
+    orders = asyncio.run(exchange_manager.submit_orders(OrderBatch.from_request(request, exchange_manager.order_ids)))
+    assert all(order.status == OrderStatus.NEW for order in orders)
+    assert exchange_manager.risk.open_sells['AAPL'] == 20
+    assert exchange_manager.risk.sellable('AAPL') == 0
+
+
+def test_oversold_fill_credits_only_the_position(monkeypatch):
+    exchange_manager = new_exchange(monkeypatch)
+    exchange_manager._apply_fill(Fill(order_id=1, symbol='AAPL', side=OrderSide.SELL, quantity=100, price=100))
+    assert exchange_manager.cash_balance == 1000 + 20 * 100
+    assert exchange_manager.positions.get('AAPL') is None
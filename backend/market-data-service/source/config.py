@@ -24,6 +24,7 @@ class Config:
     # Market data configuration
     SYMBOLS: List[str] = os.getenv("SYMBOLS", "AAPL,GOOGL,MSFT,AMZN,TSLA,FB").split(",")
     UPDATE_INTERVAL: int = int(os.getenv("UPDATE_INTERVAL", "60"))  # Seconds
+    REPLAY_BUFFER_SIZE: int = int(os.getenv("REPLAY_BUFFER_SIZE", "1440"))  # Updates kept for resume/backfill
     
     # Database configuration
     db: DatabaseConfig = DatabaseConfig()
@@ -2,7 +2,7 @@
 import random
 import logging
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ class MarketDataGenerator:
         Args:
             symbols: List of ticker symbols to generate data for
         """
-        self.symbols = symbols
+        self.symbols = list(symbols)
         self.prices: Dict[str, float] = {}
         self.last_update_time = 0
         
@@ -29,7 +29,24 @@ class MarketDataGenerator:
         
         logger.info(f"Market data generator initialized with {len(symbols)} symbols")
     
-    def _initialize_prices(self):
+    def add_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Start generating data for symbols not already covered.
+
+        Args:
+            symbols: Ticker symbols a subscriber asked for
+
+        Returns:
+            The symbols that were new to the generator
+        """
+        added = [symbol for symbol in dict.fromkeys(symbols) if symbol and symbol not in self.prices]
+        if added:
+            self.symbols.extend(added)
+            self._initialize_prices(added)
+            logger.info(f"Market data generator added {len(added)} symbols: {added}")
+        return added
+
+    def _initialize_prices(self, symbols: Optional[List[str]] = None):
         """Initialize price data with realistic values for symbols"""
         # Sample realistic prices for common stocks
         base_prices = {
@@ -46,7 +63,7 @@ class MarketDataGenerator:
         }
         
         # Set initial prices based on base prices or random if not in the list
-        for symbol in self.symbols:
+        for symbol in symbols or self.symbols:
             if symbol in base_prices:
                 self.prices[symbol] = base_prices[symbol]
             else:
@@ -81,17 +98,20 @@ class MarketDataGenerator:
         
         logger.debug(f"Updated prices for {len(self.symbols)} symbols")
     
-    def get_market_data(self) -> List[Dict[str, Any]]:
+    def get_market_data(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Generate market data records with OHLCV and additional fields.
         
+        Args:
+            symbols: Symbols to generate records for (default: all)
+            
         Returns:
             List of market data dictionaries
         """
         market_data = []
         current_time = int(time.time() * 1000)  # Milliseconds
         
-        for symbol in self.symbols:
+        for symbol in self.symbols if symbols is None else symbols:
             price = self.prices[symbol]
             
             # Generate realistic OHLC data
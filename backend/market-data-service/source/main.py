@@ -49,7 +49,8 @@ async def main():
         service = MarketDataService(
             generator=generator,
             db_manager=db_manager,
-            update_interval=config.UPDATE_INTERVAL
+            update_interval=config.UPDATE_INTERVAL,
+            replay_buffer_size=config.REPLAY_BUFFER_SIZE
         )
                 
         health_service = HealthService(http_port=50061)
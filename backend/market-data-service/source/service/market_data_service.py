@@ -2,10 +2,15 @@
 import asyncio
 import logging
 import time
+import uuid
 import grpc
-from typing import Dict, List, Any
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Any, Optional, Set
 
-from source.api.grpc.market_exchange_interface_pb2 import SubscriptionRequest, MarketDataUpdate, SymbolData
+from source.api.grpc.market_exchange_interface_pb2 import (
+    BackfillResponse, MarketDataUpdate, SubscriptionUpdateResponse, SymbolData
+)
 from source.api.grpc.market_exchange_interface_pb2_grpc import MarketDataServiceServicer
 from source.generator.market_data_generator import MarketDataGenerator
 from source.db.database import DatabaseManager
@@ -15,22 +20,46 @@ logger = logging.getLogger(__name__)
 
 class MarketDataService(MarketDataServiceServicer):
     """
-    Simple gRPC service that broadcasts market data to subscribers.
+    gRPC service that broadcasts market data to subscribers.
+
+    Each update gets the next sequence number of this feed and is kept in a
+    bounded replay buffer. A subscriber is a cursor into that buffer, so a
+    client that reconnects with the last sequence it saw is sent exactly what
+    it missed, and BackfillMarketData re-sends any retained range on
+    request. The feed id is new on every start: sequences only resume within
+    the feed that issued them.
+
+    Subscribers that name symbols only receive those (every update is still
+    sent, possibly empty, so sequences stay contiguous), and can add or
+    remove symbols with UpdateSubscription while their stream stays open.
+    Symbols the generator does not cover yet are added to it on request.
     """
     
-    def __init__(self, generator: MarketDataGenerator, db_manager: DatabaseManager, update_interval: int = 60):
+    def __init__(
+            self,
+            generator: MarketDataGenerator,
+            db_manager: DatabaseManager,
+            update_interval: int = 60,
+            replay_buffer_size: int = 1440
+    ):
         self.generator = generator
         self.db_manager = db_manager
         self.update_interval = update_interval
-        self.subscribers = {}  # Maps client_id to subscription stream context
+        self.subscribers: Dict[str, asyncio.Event] = {}  # Maps client_id to its stream's wake-up event
+        # client_id -> symbols its stream carries; None for every symbol
+        self.subscriptions: Dict[str, Optional[Set[str]]] = {}
         self.running = False
         self.broadcast_task = None
+
+        self.feed_id = uuid.uuid4().hex[:12]
+        self.sequence = 0
+        self.replay_buffer: Deque[MarketDataUpdate] = deque(maxlen=replay_buffer_size)
         
         # Metrics
         self.updates_sent = 0
         self.subscribers_count = 0
         
-        logger.info(f"Market data service initialized with {update_interval}s interval")
+        logger.info(f"Market data service initialized with {update_interval}s interval, feed {self.feed_id}")
     
     async def start(self):
         """Start the market data broadcast service"""
@@ -53,6 +82,10 @@ class MarketDataService(MarketDataServiceServicer):
             
         logger.info("Stopping market data service")
         self.running = False
+
+        # Let subscriber streams see that we are stopping
+        for wakeup in self.subscribers.values():
+            wakeup.set()
         
         if self.broadcast_task:
             self.broadcast_task.cancel()
@@ -78,10 +111,8 @@ class MarketDataService(MarketDataServiceServicer):
                     # Save to database
                     await self.db_manager.save_market_data(market_data)
                     
-                    # Broadcast to all subscribers (if any)
-                    if self.subscribers:
-                        await self._broadcast_market_data(market_data)
-                        self.updates_sent += 1
+                    # Sequence and retain it even with no subscribers, so a reconnecting one can catch up
+                    self._publish(market_data)
                     
                 # Sleep until next update
                 await asyncio.sleep(self.update_interval)
@@ -94,16 +125,69 @@ class MarketDataService(MarketDataServiceServicer):
                 await asyncio.sleep(5)
                 self.broadcast_task = asyncio.create_task(self._broadcast_loop())
     
-    async def _broadcast_market_data(self, market_data):
-        """Broadcast market data to all subscribers"""
-        logger.info(f"Broadcasting market data for {len(market_data)} symbols to {len(self.subscribers)} subscribers")
-        
-        # Convert market data to gRPC format
-        timestamp = int(time.time() * 1000)
-        
-        symbol_data_list = []
-        for md in market_data:
-            symbol_data = SymbolData(
+    def _publish(self, market_data: List[Dict[str, Any]]):
+        """Give an update the next sequence number, retain it and wake the subscribers"""
+        self.sequence += 1
+        update = MarketDataUpdate(
+            timestamp=int(time.time() * 1000),
+            data=self._to_symbol_data(market_data),
+            sequence=self.sequence,
+            feed_id=self.feed_id
+        )
+        self.replay_buffer.append(update)
+
+        if self.subscribers:
+            logger.info(f"Broadcasting update {self.sequence} for {len(market_data)} symbols "
+                        f"to {len(self.subscribers)} subscribers")
+            for wakeup in self.subscribers.values():
+                wakeup.set()
+
+    def _since(self, cursor: int, limit: Optional[int] = None) -> List[MarketDataUpdate]:
+        """Retained updates with a sequence after cursor (up to limit)"""
+        buffer = self.replay_buffer
+        if not buffer or cursor >= buffer[-1].sequence:
+            return []
+        first = buffer[0].sequence
+        start = max(cursor - first + 1, 0)
+        stop = None if limit is None else max(limit - first + 1, start)
+        return list(islice(buffer, start, stop))
+
+    def _snapshot(self, symbols) -> MarketDataUpdate:
+        """Latest state of the feed for a new subscriber, carrying the sequence it is current as of"""
+        if self.replay_buffer:
+            data = self.replay_buffer[-1].data
+        else:
+            # Nothing published yet; sequence 0 marks the snapshot as unsequenced
+            data = self._to_symbol_data(self.generator.get_market_data())
+        if symbols:
+            data = [symbol_data for symbol_data in data if symbol_data.symbol in symbols]
+
+        return MarketDataUpdate(
+            timestamp=int(time.time() * 1000),
+            data=data,
+            sequence=self.sequence,
+            feed_id=self.feed_id
+        )
+
+    @staticmethod
+    def _filter(update: MarketDataUpdate, symbols: Optional[Set[str]]) -> MarketDataUpdate:
+        """The update restricted to a subscriber's symbols, keeping its sequence"""
+        if symbols is None:
+            return update
+        data = [symbol_data for symbol_data in update.data if symbol_data.symbol in symbols]
+        if len(data) == len(update.data):
+            return update
+        return MarketDataUpdate(
+            timestamp=update.timestamp,
+            data=data,
+            sequence=update.sequence,
+            feed_id=update.feed_id
+        )
+
+    @staticmethod
+    def _to_symbol_data(market_data: List[Dict[str, Any]]) -> List[SymbolData]:
+        return [
+            SymbolData(
                 symbol=md['symbol'],
                 open=md['open'],
                 high=md['high'],
@@ -113,91 +197,120 @@ class MarketDataService(MarketDataServiceServicer):
                 trade_count=md.get('trade_count', 0),
                 vwap=md.get('vwap', 0.0)
             )
-            symbol_data_list.append(symbol_data)
-        
-        update = MarketDataUpdate(
-            timestamp=timestamp,
-            data=symbol_data_list
-        )
-        
-        # Send to all subscribers
-        dead_subscribers = []
-        
-        for client_id, context in self.subscribers.items():
-            try:
-                # Send update to this subscriber
-                await context.write(update)
-                logger.debug(f"Sent update to {client_id}")
-            except Exception as e:
-                logger.warning(f"Failed to send to {client_id}: {e}")
-                dead_subscribers.append(client_id)
-        
-        # Remove dead subscribers
-        for client_id in dead_subscribers:
-            logger.info(f"Removing dead subscriber: {client_id}")
-            del self.subscribers[client_id]
-        
-        self.subscribers_count = len(self.subscribers)
-    
+            for md in market_data
+        ]
+
     async def SubscribeMarketData(self, request, context):
         """
         Handle subscription request from an exchange simulator.
         This is the gRPC method that subscribers call.
+
+        A request with from_sequence (and this feed's id) resumes right after
+        that sequence from the replay buffer. Anything else starts with a
+        snapshot of the current prices.
         """
         client_id = request.subscriber_id
-        symbols = request.symbols
-        
-        logger.info(f"New subscription from {client_id} for symbols: {symbols}")
-        
-        # Register this subscriber
-        self.subscribers[client_id] = context
-        self.subscribers_count = len(self.subscribers)
-        
-        # Generate initial market data for requested symbols
-        market_data = self.generator.get_market_data()
-        
-        # Filter for requested symbols if specified
+        symbols = set(request.symbols) or None
         if symbols:
-            market_data = [md for md in market_data if md['symbol'] in symbols]
-        
-        # Convert to gRPC format
-        timestamp = int(time.time() * 1000)
-        
-        symbol_data_list = []
-        for md in market_data:
-            symbol_data = SymbolData(
-                symbol=md['symbol'],
-                open=md['open'],
-                high=md['high'],
-                low=md['low'],
-                close=md['close'],
-                volume=md['volume'],
-                trade_count=md.get('trade_count', 0),
-                vwap=md.get('vwap', 0.0)
-            )
-            symbol_data_list.append(symbol_data)
-        
-        initial_update = MarketDataUpdate(
-            timestamp=timestamp,
-            data=symbol_data_list
-        )
-        
-        # Send initial update
-        await context.write(initial_update)
-        
-        # Keep the stream open until client disconnects or we shut down
+            self.generator.add_symbols(list(request.symbols))
+
+        # A reconnect under the same id replaces (and ends) the old stream
+        wakeup = asyncio.Event()
+        previous = self.subscribers.get(client_id)
+        self.subscribers[client_id] = wakeup
+        self.subscriptions[client_id] = symbols
+        self.subscribers_count = len(self.subscribers)
+        if previous:
+            previous.set()
+
         try:
-            while self.running and client_id in self.subscribers:
-                await asyncio.sleep(10)  # Just keep the stream alive
+            if request.from_sequence > 0 and request.feed_id == self.feed_id:
+                cursor = request.from_sequence
+                logger.info(f"Subscriber {client_id} resuming after sequence {cursor} "
+                            f"({self.sequence - cursor} updates behind)")
+            else:
+                logger.info(f"New subscription from {client_id} for symbols: {sorted(symbols or ())}")
+                cursor = self.sequence
+                await context.write(self._snapshot(symbols))
+
+            # Keep the stream open until client disconnects or we shut down
+            while self.running and self.subscribers.get(client_id) is wakeup:
+                wakeup.clear()
+                updates = self._since(cursor)
+                if not updates:
+                    await wakeup.wait()
+                    continue
+
+                if updates[0].sequence > cursor + 1:
+                    # Fell behind the replay buffer; the sequence jump tells the client
+                    logger.warning(f"Subscriber {client_id} missed updates {cursor + 1} to "
+                                   f"{updates[0].sequence - 1}, no longer retained")
+                for update in updates:
+                    # Read per update: UpdateSubscription may have changed the symbols
+                    await context.write(self._filter(update, self.subscriptions.get(client_id)))
+                    cursor = update.sequence
+                    self.updates_sent += 1
         except Exception as e:
             logger.warning(f"Subscriber {client_id} disconnected: {e}")
         finally:
             # Clean up when client disconnects
-            if client_id in self.subscribers:
+            if self.subscribers.get(client_id) is wakeup:
                 del self.subscribers[client_id]
+                self.subscriptions.pop(client_id, None)
                 self.subscribers_count = len(self.subscribers)
                 logger.info(f"Subscription ended for {client_id}")
-                
+
         # Return value is ignored for server streaming RPCs
         return None
-    
\ No newline at end of file
+
+    async def BackfillMarketData(self, request, context):
+        """Return the retained updates in (from_sequence, to_sequence] of this feed"""
+        response = BackfillResponse(
+            feed_id=self.feed_id,
+            first_sequence=self.replay_buffer[0].sequence if self.replay_buffer else self.sequence + 1
+        )
+        if request.feed_id and request.feed_id != self.feed_id:
+            # Sequences from another feed mean nothing here
+            return response
+
+        limit = request.to_sequence or None
+        symbols = self.subscriptions.get(request.subscriber_id)
+        response.updates.extend(self._filter(update, symbols) for update in self._since(request.from_sequence, limit))
+        logger.info(f"Backfilled {len(response.updates)} updates after sequence "
+                    f"{request.from_sequence} for {request.subscriber_id}")
+        return response
+
+    async def UpdateSubscription(self, request, context):
+        """
+        Add or remove symbols on an open subscription without restarting its stream.
+
+        The stream picks the change up from its next update. The response
+        carries the latest bar of each added symbol, so the subscriber does
+        not have to wait for the next update to price it.
+        """
+        client_id = request.subscriber_id
+        if client_id not in self.subscribers:
+            # The subscriber's next SubscribeMarketData names its symbols instead
+            return SubscriptionUpdateResponse(success=False, error_message=f"No open subscription for {client_id}")
+
+        symbols = self.subscriptions.get(client_id)
+        if symbols is None:
+            # Subscribed to everything; from now on only what the generator covers minus the removals
+            symbols = set(self.generator.symbols)
+        added = [symbol for symbol in request.add_symbols if symbol and symbol not in symbols]
+        self.generator.add_symbols(added)
+        symbols = (symbols | set(added)) - set(request.remove_symbols)
+        self.subscriptions[client_id] = symbols
+
+        response = SubscriptionUpdateResponse(success=True, symbols=sorted(symbols))
+        if added:
+            latest = {symbol_data.symbol: symbol_data for symbol_data in
+                      (self.replay_buffer[-1].data if self.replay_buffer else [])}
+            missing = [symbol for symbol in added if symbol not in latest]
+            response.data.extend(latest[symbol] for symbol in added if symbol in latest)
+            response.data.extend(self._to_symbol_data(self.generator.get_market_data(missing)))
+
+        logger.info(f"Subscriber {client_id} added {added}, removed {list(request.remove_symbols)}; "
+                    f"now {len(symbols)} symbols")
+        return response
+
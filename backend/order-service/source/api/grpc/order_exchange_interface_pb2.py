@@ -13,7 +13,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,main/services/order_exchange_interface.proto\x12\x0eorder_exchange\"\x9f\x02\n\x0cOrderRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x35\n\x04side\x18\x02 \x01(\x0e\x32!.order_exchange.OrderRequest.SideR\x04side\x12\x1a\n\x08quantity\x18\x03 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x04 \x01(\x01R\x05price\x12\x35\n\x04type\x18\x05 \x01(\x0e\x32!.order_exchange.OrderRequest.TypeR\x04type\x12\x1d\n\nrequest_id\x18\x06 \x01(\tR\trequestId\"\x19\n\x04Side\x12\x07\n\x03\x42UY\x10\x00\x12\x08\n\x04SELL\x10\x01\"\x1d\n\x04Type\x12\n\n\x06MARKET\x10\x00\x12\t\n\x05LIMIT\x10\x01\"I\n\x11\x42\x61tchOrderRequest\x12\x34\n\x06orders\x18\x01 \x03(\x0b\x32\x1c.order_exchange.OrderRequestR\x06orders\"i\n\rOrderResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x19\n\x08order_id\x18\x02 \x01(\tR\x07orderId\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"\x8c\x01\n\x12\x42\x61tchOrderResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x37\n\x07results\x18\x02 \x03(\x0b\x32\x1d.order_exchange.OrderResponseR\x07results\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"1\n\x12\x42\x61tchCancelRequest\x12\x1b\n\torder_ids\x18\x01 \x03(\tR\x08orderIds\"h\n\x0c\x43\x61ncelResult\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x18\n\x07success\x18\x02 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"\x8c\x01\n\x13\x42\x61tchCancelResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x36\n\x07results\x18\x02 \x03(\x0b\x32\x1c.order_exchange.CancelResultR\x07results\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage2\xc8\x01\n\x16OrderExchangeSimulator\x12U\n\x0cSubmitOrders\x12!.order_exchange.BatchOrderRequest\x1a\".order_exchange.BatchOrderResponse\x12W\n\x0c\x43\x61ncelOrders\x12\".order_exchange.BatchCancelRequest\x1a#.order_exchange.BatchCancelResponseB\x85\x01\n\x12\x63om.order_exchangeB\x1bOrderExchangeInterfaceProtoP\x01\xa2\x02\x03OXX\xaa\x02\rOrderExchange\xca\x02\rOrderExchange\xe2\x02\x19OrderExchange\\GPBMetadata\xea\x02\rOrderExchangeb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,main/services/order_exchange_interface.proto\x12\x0eorder_exchange\"\xb9\x04\n\x0cOrderRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x35\n\x04side\x18\x02 \x01(\x0e\x32!.order_exchange.OrderRequest.SideR\x04side\x12\x1a\n\x08quantity\x18\x03 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x04 \x01(\x01R\x05price\x12\x35\n\x04type\x18\x05 \x01(\x0e\x32!.order_exchange.OrderRequest.TypeR\x04type\x12\x1d\n\nrequest_id\x18\x06 \x01(\tR\trequestId\x12\x1d\n\nstop_price\x18\x07 \x01(\x01R\tstopPrice\x12!\n\x0ctrail_amount\x18\x08 \x01(\x01R\x0btrailAmount\x12L\n\rtime_in_force\x18\t \x01(\x0e\x32(.order_exchange.OrderRequest.TimeInForceR\x0btimeInForce\x12\x1f\n\x0b\x65xpire_time\x18\n \x01(\x03R\nexpireTime\"\x19\n\x04Side\x12\x07\n\x03\x42UY\x10\x00\x12\x08\n\x04SELL\x10\x01\"J\n\x04Type\x12\n\n\x06MARKET\x10\x00\x12\t\n\x05LIMIT\x10\x01\x12\x08\n\x04STOP\x10\x02\x12\x0e\n\nSTOP_LIMIT\x10\x03\x12\x11\n\rTRAILING_STOP\x10\x04\":\n\x0bTimeInForce\x12\x07\n\x03GTC\x10\x00\x12\x07\n\x03\x44\x41Y\x10\x01\x12\x07\n\x03IOC\x10\x02\x12\x07\n\x03\x46OK\x10\x03\x12\x07\n\x03GTD\x10\x04\"I\n\x11\x42\x61tchOrderRequest\x12\x34\n\x06orders\x18\x01 \x03(\x0b\x32\x1c.order_exchange.OrderRequestR\x06orders\"i\n\rOrderResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x19\n\x08order_id\x18\x02 \x01(\tR\x07orderId\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"\x8c\x01\n\x12\x42\x61tchOrderResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x37\n\x07results\x18\x02 \x03(\x0b\x32\x1d.order_exchange.OrderResponseR\x07results\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"1\n\x12\x42\x61tchCancelRequest\x12\x1b\n\torder_ids\x18\x01 \x03(\tR\x08orderIds\"h\n\x0c\x43\x61ncelResult\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x18\n\x07success\x18\x02 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"\x8c\x01\n\x13\x42\x61tchCancelResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x36\n\x07results\x18\x02 \x03(\x0b\x32\x1c.order_exchange.CancelResultR\x07results\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"z\n\x0c\x41mendRequest\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x1a\n\x08quantity\x18\x02 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x03 \x01(\x01R\x05price\x12\x1d\n\nstop_price\x18\x04 \x01(\x01R\tstopPrice\"I\n\x11\x42\x61tchAmendRequest\x12\x34\n\x06\x61mends\x18\x01 \x03(\x0b\x32\x1c.order_exchange.AmendRequestR\x06\x61mends\"g\n\x0b\x41mendResult\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x18\n\x07success\x18\x02 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"\x8a\x01\n\x12\x42\x61tchAmendResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x35\n\x07results\x18\x02 \x03(\x0b\x32\x1b.order_exchange.AmendResultR\x07results\x12#\n\rerror_message\x18\x03 \x01(\tR\x0c\x65rrorMessage\"r\n\x11\x46illStreamRequest\x12\x1b\n\tclient_id\x18\x01 \x01(\tR\x08\x63lientId\x12#\n\rfrom_sequence\x18\x02 \x01(\x03R\x0c\x66romSequence\x12\x1b\n\tstream_id\x18\x03 \x01(\tR\x08streamId\"\xad\x02\n\tFillEvent\x12\x1a\n\x08sequence\x18\x01 \x01(\x03R\x08sequence\x12\x19\n\x08order_id\x18\x02 \x01(\tR\x07orderId\x12\x16\n\x06symbol\x18\x03 \x01(\tR\x06symbol\x12\x35\n\x04side\x18\x04 \x01(\x0e\x32!.order_exchange.OrderRequest.SideR\x04side\x12\x1a\n\x08quantity\x18\x05 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x06 \x01(\x01R\x05price\x12-\n\x12remaining_quantity\x18\x07 \x01(\x01R\x11remainingQuantity\x12\x1c\n\ttimestamp\x18\x08 \x01(\x03R\ttimestamp\x12\x1b\n\tstream_id\x18\t \x01(\tR\x08streamId2\xed\x02\n\x16OrderExchangeSimulator\x12U\n\x0cSubmitOrders\x12!.order_exchange.BatchOrderRequest\x1a\".order_exchange.BatchOrderResponse\x12W\n\x0c\x43\x61ncelOrders\x12\".order_exchange.BatchCancelRequest\x1a#.order_exchange.BatchCancelResponse\x12T\n\x0b\x41mendOrders\x12!.order_exchange.BatchAmendRequest\x1a\".order_exchange.BatchAmendResponse\x12M\n\x0bStreamFills\x12!.order_exchange.FillStreamRequest\x1a\x19.order_exchange.FillEvent0\x01\x42\x85\x01\n\x12\x63om.order_exchangeB\x1bOrderExchangeInterfaceProtoP\x01\xa2\x02\x03OXX\xaa\x02\rOrderExchange\xca\x02\rOrderExchange\xe2\x02\x19OrderExchange\\GPBMetadata\xea\x02\rOrderExchangeb\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'main.services.order_exchange_interface_pb2', globals())
@@ -22,23 +22,37 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   DESCRIPTOR._serialized_options = b'\n\022com.order_exchangeB\033OrderExchangeInterfaceProtoP\001\242\002\003OXX\252\002\rOrderExchange\312\002\rOrderExchange\342\002\031OrderExchange\\GPBMetadata\352\002\rOrderExchange'
   _ORDERREQUEST._serialized_start=65
-  _ORDERREQUEST._serialized_end=352
-  _ORDERREQUEST_SIDE._serialized_start=296
-  _ORDERREQUEST_SIDE._serialized_end=321
-  _ORDERREQUEST_TYPE._serialized_start=323
-  _ORDERREQUEST_TYPE._serialized_end=352
-  _BATCHORDERREQUEST._serialized_start=354
-  _BATCHORDERREQUEST._serialized_end=427
-  _ORDERRESPONSE._serialized_start=429
-  _ORDERRESPONSE._serialized_end=534
-  _BATCHORDERRESPONSE._serialized_start=537
-  _BATCHORDERRESPONSE._serialized_end=677
-  _BATCHCANCELREQUEST._serialized_start=679
-  _BATCHCANCELREQUEST._serialized_end=728
-  _CANCELRESULT._serialized_start=730
-  _CANCELRESULT._serialized_end=834
-  _BATCHCANCELRESPONSE._serialized_start=837
-  _BATCHCANCELRESPONSE._serialized_end=977
-  _ORDEREXCHANGESIMULATOR._serialized_start=980
-  _ORDEREXCHANGESIMULATOR._serialized_end=1180
+  _ORDERREQUEST._serialized_end=634
+  _ORDERREQUEST_SIDE._serialized_start=473
+  _ORDERREQUEST_SIDE._serialized_end=498
+  _ORDERREQUEST_TYPE._serialized_start=500
+  _ORDERREQUEST_TYPE._serialized_end=574
+  _ORDERREQUEST_TIMEINFORCE._serialized_start=576
+  _ORDERREQUEST_TIMEINFORCE._serialized_end=634
+  _BATCHORDERREQUEST._serialized_start=636
+  _BATCHORDERREQUEST._serialized_end=709
+  _ORDERRESPONSE._serialized_start=711
+  _ORDERRESPONSE._serialized_end=816
+  _BATCHORDERRESPONSE._serialized_start=819
+  _BATCHORDERRESPONSE._serialized_end=959
+  _BATCHCANCELREQUEST._serialized_start=961
+  _BATCHCANCELREQUEST._serialized_end=1010
+  _CANCELRESULT._serialized_start=1012
+  _CANCELRESULT._serialized_end=1116
+  _BATCHCANCELRESPONSE._serialized_start=1119
+  _BATCHCANCELRESPONSE._serialized_end=1259
+  _AMENDREQUEST._serialized_start=1261
+  _AMENDREQUEST._serialized_end=1383
+  _BATCHAMENDREQUEST._serialized_start=1385
+  _BATCHAMENDREQUEST._serialized_end=1458
+  _AMENDRESULT._serialized_start=1460
+  _AMENDRESULT._serialized_end=1563
+  _BATCHAMENDRESPONSE._serialized_start=1566
+  _BATCHAMENDRESPONSE._serialized_end=1704
+  _FILLSTREAMREQUEST._serialized_start=1706
+  _FILLSTREAMREQUEST._serialized_end=1820
+  _FILLEVENT._serialized_start=1823
+  _FILLEVENT._serialized_end=2124
+  _ORDEREXCHANGESIMULATOR._serialized_start=2127
+  _ORDEREXCHANGESIMULATOR._serialized_end=2492
 # @@protoc_insertion_point(module_scope)
@@ -256,4 +256,103 @@ class OrderController:
         finally:
             # Always release the lock, even if there's an error
             await self.state_manager.release()
-            
\ No newline at end of file
+
+    async def amend_orders(self, request: web.Request) -> web.Response:
+        """
+        Handle order amendment endpoint - Only batch amendment is supported
+
+        Each entry names an orderId and any of quantity, price and stopPrice
+        to change; the order is amended in place on the exchange.
+        """
+        # Try to acquire the lock first
+        acquired = await self.state_manager.acquire()
+        if not acquired:
+            return web.json_response({
+                "success": False,
+                "error": "Service is currently busy. Please try again later."
+            }, status=503)  # Service Unavailable
+
+        try:
+            # Extract token and device ID
+            token, device_id, csrf_token = get_token(request)
+
+            if not token:
+                return web.json_response({
+                    "success": False,
+                    "error": "Authentication token is required"
+                }, status=401)
+
+            # Get user_id from token
+            user_id = await self._get_user_id_from_token(token, csrf_token)
+            if not user_id:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid authentication token"
+                }, status=401)
+
+            # Validate device ID
+            device_valid = await self.order_manager.validation_manager.validate_device_id(device_id)
+            if not device_valid:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid device ID for this session"
+                }, status=400)
+
+            # Parse request body
+            try:
+                data = await request.json()
+            except json.JSONDecodeError:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid JSON in request body"
+                }, status=400)
+
+            # Extract amends array
+            if not isinstance(data, dict) or 'amends' not in data or not isinstance(data['amends'], list):
+                return web.json_response({
+                    "success": False,
+                    "error": "Request must contain an 'amends' array"
+                }, status=400)
+
+            amends = data['amends']
+            if len(amends) == 0:
+                return web.json_response({
+                    "success": False,
+                    "error": "No amendments provided"
+                }, status=400)
+
+            if len(amends) > 100:  # Same limit as cancellations
+                return web.json_response({
+                    "success": False,
+                    "error": "Too many orders. Maximum of 100 amendments allowed per batch."
+                }, status=400)
+
+            validated = []
+            for amend in amends:
+                validation = await self.order_manager.validation_manager.validate_amend_parameters(
+                    amend if isinstance(amend, dict) else {})
+                if not validation.get('valid'):
+                    return web.json_response({
+                        "success": False,
+                        "error": validation.get('error', 'Invalid amendment parameters')
+                    }, status=400)
+                validated.append({
+                    "order_id": validation['order_id'],
+                    "quantity": validation['quantity'],
+                    "price": validation['price'],
+                    "stop_price": validation['stop_price']
+                })
+
+            # Process amendments
+            result = await self.order_manager.amend_orders(validated, user_id)
+            return web.json_response(result)
+
+        except Exception as e:
+            logger.error(f"Error handling order amendment: {e}")
+            return web.json_response({
+                "success": False,
+                "error": "Server error processing amendment"
+            }, status=500)
+        finally:
+            # Always release the lock, even if there's an error
+            await self.state_manager.release()
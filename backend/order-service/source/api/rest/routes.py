@@ -58,6 +58,7 @@ async def setup_app(order_manager: OrderManager, state_manager: StateManager) ->
     # Add order routes
     app.router.add_post('/api/orders/submit', order_controller.submit_orders)
     app.router.add_post('/api/orders/cancel', order_controller.cancel_orders)
+    app.router.add_post('/api/orders/amend', order_controller.amend_orders)
     
     # Add book routes
     app.router.add_get('/api/books', book_controller.get_books)
@@ -6,7 +6,7 @@ from typing import Dict, Any, Optional
 
 from source.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from source.api.grpc.order_exchange_interface_pb2 import (
-    BatchOrderRequest, BatchCancelRequest, OrderRequest
+    BatchOrderRequest, BatchCancelRequest, BatchAmendRequest, AmendRequest, OrderRequest
 )
 from source.api.grpc.order_exchange_interface_pb2_grpc import OrderExchangeSimulatorStub
 from source.utils.metrics import track_exchange_request, set_circuit_state, track_circuit_failure
@@ -60,6 +60,12 @@ class ExchangeClient:
                 logger.error(f"Failed to create gRPC channel to {endpoint}: {e}")
                 raise
 
+    @staticmethod
+    def _call_metadata(batch_request: Dict[str, Any]):
+        """Route the call to the user's exchange when the simulator hosts several"""
+        user_id = batch_request.get("user_id")
+        return (("x-user-id", user_id),) if user_id else None
+
     async def close(self):
         """Close all gRPC channels"""
         for endpoint, channel in list(self.channels.items()):
@@ -76,7 +82,7 @@ class ExchangeClient:
         Submit a batch of orders to the exchange simulator
         
         Args:
-            batch_request: orders array
+            batch_request: orders array, and the owning user_id
             endpoint: Exchange endpoint
             
         Returns:
@@ -139,7 +145,8 @@ class ExchangeClient:
             )
 
             # Call gRPC service with timeout
-            response = await stub.SubmitOrders(grpc_request, timeout=10)
+            response = await stub.SubmitOrders(
+                grpc_request, timeout=10, metadata=self._call_metadata(batch_request))
 
             # Convert to dictionary format
             result = {
@@ -175,7 +182,7 @@ class ExchangeClient:
         Cancel a batch of orders on the exchange simulator
         
         Args:
-            batch_request: order_ids array
+            batch_request: order_ids array, and the owning user_id
             endpoint: Exchange endpoint
             
         Returns:
@@ -220,7 +227,8 @@ class ExchangeClient:
             )
 
             # Call gRPC service with timeout
-            response = await stub.CancelOrders(grpc_request, timeout=10)
+            response = await stub.CancelOrders(
+                grpc_request, timeout=10, metadata=self._call_metadata(batch_request))
 
             # Convert to dictionary format
             result = {
@@ -251,6 +259,96 @@ class ExchangeClient:
                 "results": []
             }
 
+    async def amend_orders(self, batch_request: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
+        """
+        Amend a batch of open orders on the exchange simulator
+        
+        Args:
+            batch_request: amends array, and the owning user_id
+            endpoint: Exchange endpoint
+            
+        Returns:
+            Dictionary with success flag and results
+        """
+        try:
+            # Use circuit breaker for gRPC call
+            set_circuit_state("exchange_service", self.breaker.state.name)
+
+            # Execute with circuit breaker
+            start_time = time.time()
+            result = await self.breaker.execute(
+                self._amend_orders_request,
+                batch_request,
+                endpoint
+            )
+            duration = time.time() - start_time
+
+            # Record metrics
+            success = result.get('success', False)
+            track_exchange_request("amend_orders_batch", success, duration)
+
+            return result
+        except CircuitOpenError:
+            track_circuit_failure("exchange_service")
+            logger.warning("Exchange service circuit breaker open")
+            return {
+                "success": False,
+                "errorMessage": "Exchange service unavailable due to repeated failures",
+                "results": []
+            }
+
+    async def _amend_orders_request(self, batch_request: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
+        """Make the actual batch amend request to gRPC service"""
+        try:
+            # Get gRPC connection
+            _, stub = await self.get_channel(endpoint)
+
+            # Unset fields go as 0, which the exchange reads as unchanged
+            grpc_request = BatchAmendRequest(
+                amends=[
+                    AmendRequest(
+                        order_id=amend["order_id"],
+                        quantity=float(amend.get("quantity") or 0),
+                        price=float(amend.get("price") or 0),
+                        stop_price=float(amend.get("stop_price") or 0)
+                    )
+                    for amend in batch_request["amends"]
+                ]
+            )
+
+            # Call gRPC service with timeout
+            response = await stub.AmendOrders(
+                grpc_request, timeout=10, metadata=self._call_metadata(batch_request))
+
+            # Convert to dictionary format
+            result = {
+                "success": response.success,
+                "errorMessage": response.error_message,
+                "results": []
+            }
+
+            # Process individual amend results
+            for amend_result in response.results:
+                result["results"].append({
+                    "success": amend_result.success,
+                    "orderId": amend_result.order_id,
+                    "errorMessage": amend_result.error_message
+                })
+
+            return result
+
+        except grpc.aio.AioRpcError as e:
+            # Handle gRPC errors
+            return self._handle_grpc_error(e, "amend_orders")
+
+        except Exception as e:
+            logger.error(f"Unexpected error in amend_orders: {e}")
+            return {
+                "success": False,
+                "errorMessage": f"Exchange communication error: {str(e)}",
+                "results": []
+            }
+
     def _handle_grpc_error(self, error: grpc.aio.AioRpcError, operation: str) -> Dict[str, Any]:
         """Handle gRPC errors for all operations"""
         status_code = error.code()
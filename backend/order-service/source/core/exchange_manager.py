@@ -33,6 +33,7 @@ class ExchangeManager:
 
             # Create batch request
             batch_request = {
+                "user_id": orders[0].user_id if orders else None,
                 "orders": []
             }
 
@@ -89,6 +90,7 @@ class ExchangeManager:
 
             # Create batch request
             batch_request = {
+                "user_id": orders[0].user_id if orders else None,
                 "order_ids": [order.order_id for order in orders]
             }
 
@@ -110,3 +112,43 @@ class ExchangeManager:
                 "errorMessage": f"Exchange communication error: {str(e)}",
                 "results": []
             }
+
+    async def amend_orders_on_exchange(self, amends: List[Dict[str, Any]], user_id: str,
+                                       endpoint: str) -> Dict[str, Any]:
+        """
+        Amend orders on the exchange in batch
+        
+        Args:
+            amends: Dicts with order_id and the new quantity, price and stop_price (None is unchanged)
+            user_id: User owning the orders
+            endpoint: Exchange endpoint
+                
+        Returns:
+            Result from exchange
+        """
+        try:
+            logger.info(f"Amending {len(amends)} orders on exchange at {endpoint}")
+
+            batch_request = {
+                "user_id": user_id,
+                "amends": amends
+            }
+
+            # Call exchange client
+            exchange_result = await self.exchange_client.amend_orders(batch_request, endpoint)
+
+            if not exchange_result.get('success'):
+                logger.warning(
+                    f"Batch of {len(amends)} amendments rejected by exchange: {exchange_result.get('errorMessage')}")
+                return exchange_result
+
+            logger.info(f"Successfully sent amendments for {len(amends)} orders to exchange")
+            return exchange_result
+
+        except Exception as e:
+            logger.error(f"Error amending {len(amends)} orders on exchange: {e}")
+            return {
+                "success": False,
+                "errorMessage": f"Exchange communication error: {str(e)}",
+                "results": []
+            }
@@ -370,3 +370,128 @@ class OperationManager:
                 for r in sorted_results
             ]
         }
+
+    async def amend_orders(self, amends: List[Dict[str, Any]], user_id: str) -> Dict[str, Any]:
+        """
+        Amend orders in batch
+        
+        The exchange changes each order in place, and every order it amends
+        gets one new row, written for the whole batch in a single statement.
+        
+        Args:
+            amends: Validated amends, each with order_id and the new quantity, price and stop_price
+                (None leaves a field unchanged)
+            user_id: User ID
+            
+        Returns:
+            Batch amendment result
+        """
+        start_time = time.time()
+        
+        # 1. Get simulator information for the user
+        simulator = await self.validation_manager.order_repository.get_session_simulator(user_id)
+        simulator_endpoint = simulator.get('endpoint') if simulator else None
+        
+        # 2. Get all order information in a single query
+        order_info_list = await self.validation_manager.order_repository.get_orders_info(
+            [amend['order_id'] for amend in amends]
+        )
+        order_info_map = {str(info['order_id']): info for info in order_info_list}
+        
+        # 3. Check the orders exist and belong to the user
+        results = []
+        valid_amends = []
+        
+        for i, amend in enumerate(amends):
+            order_id = amend['order_id']
+            info = order_info_map.get(order_id)
+            if info is None:
+                results.append({
+                    "orderId": order_id,
+                    "success": False,
+                    "errorMessage": "Order not found",
+                    "index": i
+                })
+                continue
+                
+            if info['user_id'] != user_id:
+                results.append({
+                    "orderId": order_id,
+                    "success": False,
+                    "errorMessage": "Order does not belong to this user",
+                    "index": i
+                })
+                continue
+                
+            valid_amends.append((amend, i))
+        
+        # 4. Amend on the exchange if we have a simulator
+        amended = []
+        if simulator_endpoint and valid_amends:
+            exchange_result = await self.exchange_manager.amend_orders_on_exchange(
+                [amend for amend, _ in valid_amends], user_id, simulator_endpoint
+            )
+            
+            if exchange_result.get('success'):
+                exchange_results = exchange_result.get('results', [])
+                
+                for (amend, idx), ex_result in zip(valid_amends, exchange_results):
+                    if ex_result.get('success'):
+                        amended.append((amend, idx))
+                    else:
+                        results.append({
+                            "orderId": amend['order_id'],
+                            "success": False,
+                            "errorMessage": ex_result.get('errorMessage') or 'Failed to amend on exchange',
+                            "index": idx
+                        })
+            else:
+                # Batch amendment failed on exchange
+                error_msg = exchange_result.get('errorMessage', 'Batch amendment failed')
+                
+                for amend, idx in valid_amends:
+                    results.append({
+                        "orderId": amend['order_id'],
+                        "success": False,
+                        "errorMessage": error_msg,
+                        "index": idx
+                    })
+        else:
+            # No simulator - just record the amendments
+            amended = valid_amends
+        
+        # 5. Record the amended orders
+        if amended:
+            saved = set(await self.validation_manager.order_repository.save_order_amendments(
+                [amend for amend, _ in amended]
+            ))
+            # A stop-price-only amendment has no row to write (trading.orders has no stop price)
+            saved.update(amend['order_id'] for amend, _ in amended
+                         if amend.get('quantity') is None and amend.get('price') is None)
+            
+            for amend, idx in amended:
+                results.append({
+                    "orderId": amend['order_id'],
+                    "success": amend['order_id'] in saved,
+                    "errorMessage": None if amend['order_id'] in saved else "Failed to save amendment to database",
+                    "index": idx
+                })
+        
+        # 6. Record metrics
+        duration = time.time() - start_time
+        success_count = sum(1 for r in results if r.get('success', False))
+        track_order_submission_latency("batch_amend", success_count > 0, duration)
+        
+        # 7. Return final results sorted by original index
+        sorted_results = sorted(results, key=lambda x: x.get('index', 0))
+        return {
+            "success": True,  # Overall request processed
+            "results": [
+                {
+                    "success": r.get('success', False),
+                    "orderId": r.get('orderId'),
+                    "errorMessage": r.get('errorMessage')
+                }
+                for r in sorted_results
+            ]
+        }
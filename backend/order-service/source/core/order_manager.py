@@ -35,4 +35,8 @@ class OrderManager:
     async def cancel_orders(self, order_ids, user_id):
         """Cancel orders in batch"""
         return await self.operation_manager.cancel_orders(order_ids, user_id)
+
+    async def amend_orders(self, amends, user_id):
+        """Amend orders in batch"""
+        return await self.operation_manager.amend_orders(amends, user_id)
     
\ No newline at end of file
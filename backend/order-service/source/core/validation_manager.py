@@ -132,6 +132,53 @@ class ValidationManager:
                 "error": "Invalid order parameters: quantity and price must be numeric"
             }
         
+    async def validate_amend_parameters(self, amend_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the parameters of one order amendment
+        
+        Args:
+            amend_data: Amendment with orderId and any of quantity, price and stopPrice
+            
+        Returns:
+            Validation result with extracted parameters if valid
+        """
+        try:
+            order_id = amend_data.get('orderId')
+            values = {
+                field: float(amend_data[key]) if amend_data.get(key) is not None else None
+                for field, key in (('quantity', 'quantity'), ('price', 'price'), ('stop_price', 'stopPrice'))
+            }
+
+            if not order_id:
+                return {
+                    "valid": False,
+                    "error": "Amendment requires an orderId"
+                }
+
+            if all(value is None for value in values.values()):
+                return {
+                    "valid": False,
+                    "error": "Amendment must change quantity, price or stopPrice"
+                }
+
+            if any(value is not None and value <= 0 for value in values.values()):
+                return {
+                    "valid": False,
+                    "error": "Amended quantity and prices must be greater than zero"
+                }
+
+            return {
+                "valid": True,
+                "order_id": order_id,
+                **values
+            }
+
+        except (TypeError, ValueError):
+            return {
+                "valid": False,
+                "error": "Invalid amendment parameters: quantity and prices must be numeric"
+            }
+
     async def validate_device_id(self, device_id: str) -> bool:
         """
         Validate the device ID
@@ -428,6 +428,62 @@ class OrderRepository:
             logger.error(f"Error in batch status update: {e}")
             return {"successful": successful, "failed": failed}
     
+    async def save_order_amendments(self, amendments: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create one new row per amended order, in a single statement
+
+        Each row copies the order's latest row with the new quantity and
+        price (None keeps the current value). trading.orders has no stop
+        price column, so an amendment that only moves the stop price is not
+        persisted and writes no row.
+
+        Args:
+            amendments: Dicts with order_id, quantity and price
+
+        Returns:
+            IDs of the orders a row was written for
+        """
+        amendments = [amendment for amendment in amendments
+                      if amendment.get('quantity') is not None or amendment.get('price') is not None]
+        if not amendments:
+            return []
+
+        query = """
+        INSERT INTO trading.orders (
+            order_id, status, user_id, symbol, side, quantity, price,
+            order_type, filled_quantity, avg_price, created_at, updated_at,
+            request_id, error_message
+        )
+        SELECT DISTINCT ON (o.order_id)
+            o.order_id, o.status, o.user_id, o.symbol, o.side,
+            COALESCE(a.quantity, o.quantity), COALESCE(a.price, o.price),
+            o.order_type, o.filled_quantity, o.avg_price, to_timestamp($4), to_timestamp($4),
+            o.request_id, o.error_message
+        FROM trading.orders o
+        JOIN unnest($1::uuid[], $2::numeric[], $3::numeric[]) AS a(order_id, quantity, price)
+            ON a.order_id = o.order_id
+        ORDER BY o.order_id, o.created_at DESC
+        RETURNING order_id
+        """
+
+        start_time = time.time()
+        try:
+            pool = await self.db_pool.get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    query,
+                    [amendment['order_id'] for amendment in amendments],
+                    [amendment.get('quantity') for amendment in amendments],
+                    [amendment.get('price') for amendment in amendments],
+                    time.time()
+                )
+            track_db_operation("save_order_amendments", True, time.time() - start_time)
+            return [str(row['order_id']) for row in rows]
+        except Exception as e:
+            track_db_operation("save_order_amendments", False, time.time() - start_time)
+            logger.error(f"Error saving order amendments: {e}")
+            return []
+
     async def get_orders_info(self, order_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Get information about multiple orders in a single query
@@ -13,7 +13,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.main/services/session_exchange_interface.proto\x12\x10session_exchange\",\n\rStreamRequest\x12\x1b\n\tclient_id\x18\x01 \x01(\tR\x08\x63lientId\"\xf0\x01\n\x12\x45xchangeDataUpdate\x12\x1c\n\ttimestamp\x18\x01 \x01(\x03R\ttimestamp\x12=\n\x0bmarket_data\x18\x02 \x03(\x0b\x32\x1c.session_exchange.MarketDataR\nmarketData\x12<\n\x0borders_data\x18\x03 \x03(\x0b\x32\x1b.session_exchange.OrderDataR\nordersData\x12?\n\tportfolio\x18\x04 \x01(\x0b\x32!.session_exchange.PortfolioStatusR\tportfolio\"\xc1\x01\n\nMarketData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x05R\x06volume\x12\x1f\n\x0btrade_count\x18\x07 \x01(\x05R\ntradeCount\x12\x12\n\x04vwap\x18\x08 \x01(\x01R\x04vwap\"\xa4\x01\n\tOrderData\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x16\n\x06status\x18\x03 \x01(\tR\x06status\x12\'\n\x0f\x66illed_quantity\x18\x04 \x01(\x05R\x0e\x66illedQuantity\x12#\n\raverage_price\x18\x05 \x01(\x01R\x0c\x61veragePrice\"\x8f\x01\n\x0fPortfolioStatus\x12\x38\n\tpositions\x18\x01 \x03(\x0b\x32\x1a.session_exchange.PositionR\tpositions\x12!\n\x0c\x63\x61sh_balance\x18\x02 \x01(\x01R\x0b\x63\x61shBalance\x12\x1f\n\x0btotal_value\x18\x03 \x01(\x01R\ntotalValue\"\x84\x01\n\x08Position\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08quantity\x18\x02 \x01(\x05R\x08quantity\x12!\n\x0c\x61verage_cost\x18\x03 \x01(\x01R\x0b\x61verageCost\x12!\n\x0cmarket_value\x18\x04 \x01(\x01R\x0bmarketValue\"=\n\x10HeartbeatRequest\x12)\n\x10\x63lient_timestamp\x18\x03 \x01(\x03R\x0f\x63lientTimestamp\"X\n\x11HeartbeatResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12)\n\x10server_timestamp\x18\x02 \x01(\x03R\x0fserverTimestamp2\xcf\x01\n\x18SessionExchangeSimulator\x12]\n\x12StreamExchangeData\x12\x1f.session_exchange.StreamRequest\x1a$.session_exchange.ExchangeDataUpdate0\x01\x12T\n\tHeartbeat\x12\".session_exchange.HeartbeatRequest\x1a#.session_exchange.HeartbeatResponseB\x91\x01\n\x14\x63om.session_exchangeB\x1dSessionExchangeInterfaceProtoP\x01\xa2\x02\x03SXX\xaa\x02\x0fSessionExchange\xca\x02\x0fSessionExchange\xe2\x02\x1bSessionExchange\\GPBMetadata\xea\x02\x0fSessionExchangeb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.main/services/session_exchange_interface.proto\x12\x10session_exchange\"B\n\rStreamRequest\x12\x1b\n\tclient_id\x18\x01 \x01(\tR\x08\x63lientId\x12\x14\n\x05\x64\x65lta\x18\x02 \x01(\x08R\x05\x64\x65lta\"\xcf\x03\n\x12\x45xchangeDataUpdate\x12\x1c\n\ttimestamp\x18\x01 \x01(\x03R\ttimestamp\x12=\n\x0bmarket_data\x18\x02 \x03(\x0b\x32\x1c.session_exchange.MarketDataR\nmarketData\x12<\n\x0borders_data\x18\x03 \x03(\x0b\x32\x1b.session_exchange.OrderDataR\nordersData\x12?\n\tportfolio\x18\x04 \x01(\x0b\x32!.session_exchange.PortfolioStatusR\tportfolio\x12\x18\n\x07version\x18\x05 \x01(\x03R\x07version\x12\x1f\n\x0bis_snapshot\x18\x06 \x01(\x08R\nisSnapshot\x12!\n\x0c\x62\x61se_version\x18\x07 \x01(\x03R\x0b\x62\x61seVersion\x12+\n\x11removed_positions\x18\x08 \x03(\tR\x10removedPositions\x12)\n\x10origin_timestamp\x18\t \x01(\x03R\x0foriginTimestamp\x12\'\n\x0fremoved_symbols\x18\n \x03(\tR\x0eremovedSymbols\"\xc1\x01\n\nMarketData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x05R\x06volume\x12\x1f\n\x0btrade_count\x18\x07 \x01(\x05R\ntradeCount\x12\x12\n\x04vwap\x18\x08 \x01(\x01R\x04vwap\"\xa4\x01\n\tOrderData\x12\x19\n\x08order_id\x18\x01 \x01(\tR\x07orderId\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x16\n\x06status\x18\x03 \x01(\tR\x06status\x12\'\n\x0f\x66illed_quantity\x18\x04 \x01(\x05R\x0e\x66illedQuantity\x12#\n\raverage_price\x18\x05 \x01(\x01R\x0c\x61veragePrice\"\x8f\x01\n\x0fPortfolioStatus\x12\x38\n\tpositions\x18\x01 \x03(\x0b\x32\x1a.session_exchange.PositionR\tpositions\x12!\n\x0c\x63\x61sh_balance\x18\x02 \x01(\x01R\x0b\x63\x61shBalance\x12\x1f\n\x0btotal_value\x18\x03 \x01(\x01R\ntotalValue\"\x84\x01\n\x08Position\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08quantity\x18\x02 \x01(\x05R\x08quantity\x12!\n\x0c\x61verage_cost\x18\x03 \x01(\x01R\x0b\x61verageCost\x12!\n\x0cmarket_value\x18\x04 \x01(\x01R\x0bmarketValue\"^\n\x14UpdateSymbolsRequest\x12\x1f\n\x0b\x61\x64\x64_symbols\x18\x01 \x03(\tR\naddSymbols\x12%\n\x0eremove_symbols\x18\x02 \x03(\tR\rremoveSymbols\"p\n\x15UpdateSymbolsResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x02 \x01(\tR\x0c\x65rrorMessage\x12\x18\n\x07symbols\x18\x03 \x03(\tR\x07symbols\"\x15\n\x13GetPortfolioRequest\"\xce\x01\n\x14GetPortfolioResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x02 \x01(\tR\x0c\x65rrorMessage\x12\x18\n\x07version\x18\x03 \x01(\x03R\x07version\x12\x1c\n\ttimestamp\x18\x04 \x01(\x03R\ttimestamp\x12?\n\tportfolio\x18\x05 \x01(\x0b\x32!.session_exchange.PortfolioStatusR\tportfolio\"\x84\x01\n\x10GetOrdersRequest\x12\x1a\n\x08statuses\x18\x01 \x03(\tR\x08statuses\x12\x18\n\x07symbols\x18\x02 \x03(\tR\x07symbols\x12\x1b\n\tpage_size\x18\x03 \x01(\x05R\x08pageSize\x12\x1d\n\npage_token\x18\x04 \x01(\tR\tpageToken\"\xf0\x01\n\x11GetOrdersResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x02 \x01(\tR\x0c\x65rrorMessage\x12\x18\n\x07version\x18\x03 \x01(\x03R\x07version\x12\x1c\n\ttimestamp\x18\x04 \x01(\x03R\ttimestamp\x12<\n\x0borders_data\x18\x05 \x03(\x0b\x32\x1b.session_exchange.OrderDataR\nordersData\x12&\n\x0fnext_page_token\x18\x06 \x01(\tR\rnextPageToken\",\n\x10GetQuotesRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\"\xc9\x01\n\x11GetQuotesResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rerror_message\x18\x02 \x01(\tR\x0c\x65rrorMessage\x12\x18\n\x07version\x18\x03 \x01(\x03R\x07version\x12\x1c\n\ttimestamp\x18\x04 \x01(\x03R\ttimestamp\x12=\n\x0bmarket_data\x18\x05 \x03(\x0b\x32\x1c.session_exchange.MarketDataR\nmarketData\"=\n\x10HeartbeatRequest\x12)\n\x10\x63lient_timestamp\x18\x03 \x01(\x03R\x0f\x63lientTimestamp\"X\n\x11HeartbeatResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12)\n\x10server_timestamp\x18\x02 \x01(\x03R\x0fserverTimestamp2\xbc\x04\n\x18SessionExchangeSimulator\x12]\n\x12StreamExchangeData\x12\x1f.session_exchange.StreamRequest\x1a$.session_exchange.ExchangeDataUpdate0\x01\x12T\n\tHeartbeat\x12\".session_exchange.HeartbeatRequest\x1a#.session_exchange.HeartbeatResponse\x12`\n\rUpdateSymbols\x12&.session_exchange.UpdateSymbolsRequest\x1a\'.session_exchange.UpdateSymbolsResponse\x12]\n\x0cGetPortfolio\x12%.session_exchange.GetPortfolioRequest\x1a&.session_exchange.GetPortfolioResponse\x12T\n\tGetOrders\x12\".session_exchange.GetOrdersRequest\x1a#.session_exchange.GetOrdersResponse\x12T\n\tGetQuotes\x12\".session_exchange.GetQuotesRequest\x1a#.session_exchange.GetQuotesResponseB\x91\x01\n\x14\x63om.session_exchangeB\x1dSessionExchangeInterfaceProtoP\x01\xa2\x02\x03SXX\xaa\x02\x0fSessionExchange\xca\x02\x0fSessionExchange\xe2\x02\x1bSessionExchange\\GPBMetadata\xea\x02\x0fSessionExchangeb\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'main.services.session_exchange_interface_pb2', globals())
@@ -22,21 +22,37 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   DESCRIPTOR._serialized_options = b'\n\024com.session_exchangeB\035SessionExchangeInterfaceProtoP\001\242\002\003SXX\252\002\017SessionExchange\312\002\017SessionExchange\342\002\033SessionExchange\\GPBMetadata\352\002\017SessionExchange'
   _STREAMREQUEST._serialized_start=68
-  _STREAMREQUEST._serialized_end=112
-  _EXCHANGEDATAUPDATE._serialized_start=115
-  _EXCHANGEDATAUPDATE._serialized_end=355
-  _MARKETDATA._serialized_start=358
-  _MARKETDATA._serialized_end=551
-  _ORDERDATA._serialized_start=554
-  _ORDERDATA._serialized_end=718
-  _PORTFOLIOSTATUS._serialized_start=721
-  _PORTFOLIOSTATUS._serialized_end=864
-  _POSITION._serialized_start=867
-  _POSITION._serialized_end=999
-  _HEARTBEATREQUEST._serialized_start=1001
-  _HEARTBEATREQUEST._serialized_end=1062
-  _HEARTBEATRESPONSE._serialized_start=1064
-  _HEARTBEATRESPONSE._serialized_end=1152
-  _SESSIONEXCHANGESIMULATOR._serialized_start=1155
-  _SESSIONEXCHANGESIMULATOR._serialized_end=1362
+  _STREAMREQUEST._serialized_end=134
+  _EXCHANGEDATAUPDATE._serialized_start=137
+  _EXCHANGEDATAUPDATE._serialized_end=600
+  _MARKETDATA._serialized_start=603
+  _MARKETDATA._serialized_end=796
+  _ORDERDATA._serialized_start=799
+  _ORDERDATA._serialized_end=963
+  _PORTFOLIOSTATUS._serialized_start=966
+  _PORTFOLIOSTATUS._serialized_end=1109
+  _POSITION._serialized_start=1112
+  _POSITION._serialized_end=1244
+  _UPDATESYMBOLSREQUEST._serialized_start=1246
+  _UPDATESYMBOLSREQUEST._serialized_end=1340
+  _UPDATESYMBOLSRESPONSE._serialized_start=1342
+  _UPDATESYMBOLSRESPONSE._serialized_end=1454
+  _GETPORTFOLIOREQUEST._serialized_start=1456
+  _GETPORTFOLIOREQUEST._serialized_end=1477
+  _GETPORTFOLIORESPONSE._serialized_start=1480
+  _GETPORTFOLIORESPONSE._serialized_end=1686
+  _GETORDERSREQUEST._serialized_start=1689
+  _GETORDERSREQUEST._serialized_end=1821
+  _GETORDERSRESPONSE._serialized_start=1824
+  _GETORDERSRESPONSE._serialized_end=2064
+  _GETQUOTESREQUEST._serialized_start=2066
+  _GETQUOTESREQUEST._serialized_end=2110
+  _GETQUOTESRESPONSE._serialized_start=2113
+  _GETQUOTESRESPONSE._serialized_end=2314
+  _HEARTBEATREQUEST._serialized_start=2316
+  _HEARTBEATREQUEST._serialized_end=2377
+  _HEARTBEATRESPONSE._serialized_start=2379
+  _HEARTBEATRESPONSE._serialized_end=2467
+  _SESSIONEXCHANGESIMULATOR._serialized_start=2470
+  _SESSIONEXCHANGESIMULATOR._serialized_end=3042
 # @@protoc_insertion_point(module_scope)
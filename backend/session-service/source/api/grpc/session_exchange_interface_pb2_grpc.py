@@ -24,6 +24,26 @@ class SessionExchangeSimulatorStub(object):
                 request_serializer=main_dot_services_dot_session__exchange__interface__pb2.HeartbeatRequest.SerializeToString,
                 response_deserializer=main_dot_services_dot_session__exchange__interface__pb2.HeartbeatResponse.FromString,
                 )
+        self.UpdateSymbols = channel.unary_unary(
+                '/session_exchange.SessionExchangeSimulator/UpdateSymbols',
+                request_serializer=main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsResponse.FromString,
+                )
+        self.GetPortfolio = channel.unary_unary(
+                '/session_exchange.SessionExchangeSimulator/GetPortfolio',
+                request_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioResponse.FromString,
+                )
+        self.GetOrders = channel.unary_unary(
+                '/session_exchange.SessionExchangeSimulator/GetOrders',
+                request_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetOrdersRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetOrdersResponse.FromString,
+                )
+        self.GetQuotes = channel.unary_unary(
+                '/session_exchange.SessionExchangeSimulator/GetQuotes',
+                request_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetQuotesRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetQuotesResponse.FromString,
+                )
 
 
 class SessionExchangeSimulatorServicer(object):
@@ -43,6 +63,32 @@ class SessionExchangeSimulatorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UpdateSymbols(self, request, context):
+        """Add or remove symbols the simulator trades and receives market data for
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPortfolio(self, request, context):
+        """Point-in-time reads of the in-memory state, without opening a stream
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOrders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetQuotes(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SessionExchangeSimulatorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -56,6 +102,26 @@ def add_SessionExchangeSimulatorServicer_to_server(servicer, server):
                     request_deserializer=main_dot_services_dot_session__exchange__interface__pb2.HeartbeatRequest.FromString,
                     response_serializer=main_dot_services_dot_session__exchange__interface__pb2.HeartbeatResponse.SerializeToString,
             ),
+            'UpdateSymbols': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateSymbols,
+                    request_deserializer=main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsRequest.FromString,
+                    response_serializer=main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsResponse.SerializeToString,
+            ),
+            'GetPortfolio': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPortfolio,
+                    request_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioRequest.FromString,
+                    response_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioResponse.SerializeToString,
+            ),
+            'GetOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOrders,
+                    request_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetOrdersRequest.FromString,
+                    response_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetOrdersResponse.SerializeToString,
+            ),
+            'GetQuotes': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetQuotes,
+                    request_deserializer=main_dot_services_dot_session__exchange__interface__pb2.GetQuotesRequest.FromString,
+                    response_serializer=main_dot_services_dot_session__exchange__interface__pb2.GetQuotesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'session_exchange.SessionExchangeSimulator', rpc_method_handlers)
@@ -99,3 +165,71 @@ class SessionExchangeSimulator(object):
             main_dot_services_dot_session__exchange__interface__pb2.HeartbeatResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UpdateSymbols(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/session_exchange.SessionExchangeSimulator/UpdateSymbols',
+            main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsRequest.SerializeToString,
+            main_dot_services_dot_session__exchange__interface__pb2.UpdateSymbolsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetPortfolio(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/session_exchange.SessionExchangeSimulator/GetPortfolio',
+            main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioRequest.SerializeToString,
+            main_dot_services_dot_session__exchange__interface__pb2.GetPortfolioResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/session_exchange.SessionExchangeSimulator/GetOrders',
+            main_dot_services_dot_session__exchange__interface__pb2.GetOrdersRequest.SerializeToString,
+            main_dot_services_dot_session__exchange__interface__pb2.GetOrdersResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetQuotes(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/session_exchange.SessionExchangeSimulator/GetQuotes',
+            main_dot_services_dot_session__exchange__interface__pb2.GetQuotesRequest.SerializeToString,
+            main_dot_services_dot_session__exchange__interface__pb2.GetQuotesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
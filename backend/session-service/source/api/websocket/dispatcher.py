@@ -48,6 +48,7 @@ class WebSocketDispatcher:
             # Simulator handlers
             'start_simulator': simulator_handler.handle_start_simulator,
             'stop_simulator': simulator_handler.handle_stop_simulator,
+            'update_symbols': simulator_handler.handle_update_symbols,
         }
         logger.info(f"WebSocketDispatcher initialized with handlers for: {list(self.message_handlers.keys())}")
 
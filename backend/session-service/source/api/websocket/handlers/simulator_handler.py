@@ -150,4 +150,82 @@ async def handle_stop_simulator(
         except Exception as e:
             logger.error(f"Failed to send simulator_stopped for client {client_id}: {e}")
             span.record_exception(e)
-            
\ No newline at end of file
+
+
+async def handle_update_symbols(
+        *,
+        ws: web.WebSocketResponse,
+        user_id: str,
+        client_id: str,
+        device_id: str,
+        message: Dict[str, Any],
+        session_manager: SessionManager,
+        tracer: trace.Tracer,
+        **kwargs
+):
+    """
+    Process a request to add or remove symbols on the running simulator.
+    
+    Args:
+        ws: The WebSocket connection.
+        user_id: User ID.
+        client_id: Client ID.
+        device_id: Device ID.
+        message: The parsed message dictionary, with addSymbols and/or removeSymbols lists.
+        session_manager: Direct access to SessionManager.
+        tracer: OpenTelemetry Tracer instance.
+    """
+    with optional_trace_span(tracer, "handle_update_symbols_message") as span:
+        span.set_attribute("client_id", client_id)
+
+        request_id = message.get('requestId', f'update-symbols-{time.time_ns()}')
+        span.set_attribute("request_id", request_id)
+
+        add_symbols = message.get('addSymbols') or []
+        remove_symbols = message.get('removeSymbols') or []
+        if not isinstance(add_symbols, list) or not isinstance(remove_symbols, list):
+            await error_emitter.send_error(
+                ws=ws,
+                error_code="INVALID_SYMBOLS",
+                message="addSymbols and removeSymbols must be lists",
+                request_id=request_id,
+                span=span
+            )
+            return
+
+        result = await session_manager.update_simulator_symbols(
+            [str(symbol) for symbol in add_symbols],
+            [str(symbol) for symbol in remove_symbols]
+        )
+
+        span.set_attribute("update_success", result.get('success', False))
+
+        if not result.get('success'):
+            error = result.get('error') or "Failed to update symbols"
+            span.set_attribute("error", error)
+            await error_emitter.send_error(
+                ws=ws,
+                error_code="SYMBOL_UPDATE_FAILED",
+                message=error,
+                request_id=request_id,
+                span=span
+            )
+            track_simulator_operation("update_symbols", "error_validation")
+            return
+
+        # Send success response
+        response = {
+            'type': 'symbols_updated',
+            'requestId': request_id,
+            'success': True,
+            'symbols': result.get('symbols', [])
+        }
+
+        try:
+            if not ws.closed:
+                await ws.send_json(response)
+                track_websocket_message("sent", "symbols_updated")
+                track_simulator_operation("update_symbols", "success")
+        except Exception as e:
+            logger.error(f"Failed to send symbols_updated for client {client_id}: {e}")
+            span.record_exception(e)
@@ -8,7 +8,7 @@ import asyncio
 import time
 import json
 import grpc
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from source.utils.circuit_breaker import CircuitOpenError
 from source.utils.metrics import track_circuit_breaker_failure
@@ -17,11 +17,13 @@ from source.clients.base import BaseClient
 
 from source.models.exchange_data import ExchangeType, ExchangeDataUpdate
 from source.core.exchange.factory import ExchangeAdapterFactory
+from source.core.exchange.state import ExchangeStateAssembler
 
 from source.api.grpc.session_exchange_interface_pb2 import (
     StreamRequest,
     ExchangeDataUpdate,
     HeartbeatRequest,
+    UpdateSymbolsRequest,
 )
 from source.api.grpc.session_exchange_interface_pb2_grpc import SessionExchangeSimulatorStub
 
@@ -162,12 +164,53 @@ class ExchangeClient(BaseClient):
                 span.set_attribute("error.message", str(e))
                 return {'success': False, 'error': str(e)}
 
+    async def update_symbols(
+            self,
+            endpoint: str,
+            add_symbols: List[str],
+            remove_symbols: List[str],
+            user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Change the symbols the simulator trades while it runs.
+
+        Args:
+            endpoint: The endpoint of the simulator
+            add_symbols: Symbols to start trading
+            remove_symbols: Symbols to stop trading
+            user_id: Selects the user's exchange on a multi-tenant simulator
+
+        Returns:
+            Dict with success, the symbols now traded and any error
+        """
+        with optional_trace_span(self.tracer, "update_symbols_rpc") as span:
+            span.set_attribute("rpc.service", "ExchangeSimulator")
+            span.set_attribute("rpc.method", "UpdateSymbols")
+            span.set_attribute("net.peer.name", endpoint)
+            try:
+                response = await self.execute_with_cb(
+                    self._update_symbols_request, endpoint, add_symbols, remove_symbols, user_id
+                )
+                span.set_attribute("app.success", response.get('success', False))
+                return response
+            except CircuitOpenError:
+                logger.debug(f"Circuit open for exchange service (update symbols)")
+                span.set_attribute("error.message", "Exchange service unavailable (Circuit Open)")
+                span.set_attribute("app.circuit_open", True)
+                return {'success': False, 'error': 'Exchange service unavailable'}
+            except Exception as e:
+                logger.warning(f"Error updating symbols via gRPC: {e}")
+                span.record_exception(e)
+                span.set_attribute("error.message", str(e))
+                return {'success': False, 'error': str(e)}
+
     async def stream_exchange_data(
             self,
             endpoint: str,
             session_id: str,
             client_id: str,
             exchange_type: ExchangeType = None,
+            user_id: Optional[str] = None,
     ) -> AsyncGenerator[ExchangeDataUpdate, None]:
         """
         Stream exchange data (market, portfolio, orders) with adapter conversion
@@ -177,6 +220,7 @@ class ExchangeClient(BaseClient):
             session_id: The session ID
             client_id: The client ID
             exchange_type: Type of exchange to use adapter for
+            user_id: Selects the user's exchange on a multi-tenant simulator
             
         Yields:
             Standardized ExchangeDataUpdate objects
@@ -193,6 +237,9 @@ class ExchangeClient(BaseClient):
             # Get the appropriate adapter
             adapter = ExchangeAdapterFactory.get_adapter(exchange_type)
 
+            # The simulator sends a snapshot followed by deltas; keep the full state here
+            state = ExchangeStateAssembler()
+
             try:
                 # Get channel and stub
                 channel, stub = await self.get_channel(endpoint)
@@ -200,11 +247,13 @@ class ExchangeClient(BaseClient):
                 # Create stream request
                 request = StreamRequest(
                     client_id=client_id,
+                    delta=True,
                 )
 
                 # Initiate streaming RPC
                 try:
-                    stream = stub.StreamExchangeData(request, wait_for_ready=True)
+                    metadata = (('x-user-id', user_id),) if user_id else None
+                    stream = stub.StreamExchangeData(request, wait_for_ready=True, metadata=metadata)
                     logger.info("Initiated StreamExchangeData RPC")
                 except Exception as rpc_init_error:
                     logger.error(f"Failed to initiate streaming RPC: {rpc_init_error}")
@@ -214,10 +263,14 @@ class ExchangeClient(BaseClient):
                 # Stream processing with direct adapter conversion
                 try:
                     async for data in stream:
-                        logger.debug(f"Received raw exchange data update")
-                        
+                        logger.debug(f"Received raw exchange data update v{data.version} "
+                                     f"({'snapshot' if data.is_snapshot else 'delta'})")
+
+                        # Merge into the full state, raising on a version gap
+                        full_data = state.apply(data)
+
                         # Direct conversion in one step
-                        standardized_data = await adapter.convert_from_protobuf(data)
+                        standardized_data = await adapter.convert_from_protobuf(full_data)
                         
                         # Set exchange type explicitly if needed
                         standardized_data.exchange_type = exchange_type
@@ -254,6 +307,35 @@ class ExchangeClient(BaseClient):
             del self.channels[endpoint]
             del self.stubs[endpoint]
 
+    async def _update_symbols_request(
+            self,
+            endpoint: str,
+            add_symbols: List[str],
+            remove_symbols: List[str],
+            user_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Make the actual update symbols request."""
+        _, stub = await self.get_channel(endpoint)
+
+        request = UpdateSymbolsRequest(add_symbols=add_symbols, remove_symbols=remove_symbols)
+
+        try:
+            metadata = (('x-user-id', user_id),) if user_id else None
+            response = await stub.UpdateSymbols(request, timeout=10, metadata=metadata)
+
+            logger.info(f"Symbol update on simulator at {endpoint}: success={response.success}, "
+                        f"symbols={list(response.symbols)}")
+
+            return {
+                'success': response.success,
+                'symbols': list(response.symbols),
+                'error': response.error_message
+            }
+        except grpc.aio.AioRpcError as e:
+            logger.warning(f"gRPC error updating symbols ({e.code()}): {e.details()}")
+            track_circuit_breaker_failure("exchange_service")
+            raise
+
     async def _heartbeat_request(self, endpoint: str, session_id: str, client_id: str) -> Dict[str, Any]:
         """
         Make the actual heartbeat request.
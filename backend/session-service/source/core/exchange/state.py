@@ -0,0 +1,98 @@
+# source/core/exchange/state.py
+import logging
+from itertools import chain
+from typing import Dict, Optional
+
+from source.api.grpc.session_exchange_interface_pb2 import (
+    ExchangeDataUpdate as GrpcExchangeDataUpdate,
+    MarketData,
+    OrderData,
+    Position,
+)
+from source.models.exchange_data import OrderStatus
+
+logger = logging.getLogger('exchange_state')
+
+TERMINAL_STATUSES = frozenset(
+    status.value for status in (OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.REJECTED, OrderStatus.EXPIRED)
+)
+
+
+class ExchangeStreamGapError(ConnectionError):
+    """A delta update did not apply on top of the last version received"""
+    pass
+
+
+class ExchangeStateAssembler:
+    """
+    Rebuilds the full exchange state from a snapshot followed by deltas.
+
+    Each delta names the version it applies on top of; if that is not the
+    version we hold, updates were lost and the stream has to be restarted to
+    get a fresh snapshot.
+
+    Only open orders are held. An order that reaches a terminal status is
+    passed on once, in the update it closes in, and then dropped, so the
+    held state stays as small as the exchange's open orders.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self.market_data: Dict[str, MarketData] = {}
+        self.orders: Dict[str, OrderData] = {}
+        self.positions: Dict[str, Position] = {}
+        self.cash_balance = 0.0
+        self.total_value = 0.0
+
+    def apply(self, update: GrpcExchangeDataUpdate) -> GrpcExchangeDataUpdate:
+        """
+        Merge an update into the held state.
+
+        Returns:
+            A full-state update at update.version: every open order, plus the
+            orders closed by this update
+
+        Raises:
+            ExchangeStreamGapError: If a delta does not follow the held version
+        """
+        if update.is_snapshot:
+            self.market_data.clear()
+            self.orders.clear()
+            self.positions.clear()
+        elif self.version is None or update.base_version != self.version:
+            raise ExchangeStreamGapError(
+                f"Exchange stream gap: delta v{update.base_version}->v{update.version} "
+                f"received while holding v{self.version}"
+            )
+
+        for item in update.market_data:
+            self.market_data[item.symbol] = item
+        closed = []
+        for item in update.orders_data:
+            if item.status in TERMINAL_STATUSES:
+                self.orders.pop(item.order_id, None)
+                closed.append(item)
+            else:
+                self.orders[item.order_id] = item
+        for item in update.portfolio.positions:
+            self.positions[item.symbol] = item
+        for symbol in update.removed_positions:
+            self.positions.pop(symbol, None)
+        for symbol in update.removed_symbols:
+            self.market_data.pop(symbol, None)
+
+        self.cash_balance = update.portfolio.cash_balance
+        self.total_value = update.portfolio.total_value
+        self.version = update.version
+
+        full_update = GrpcExchangeDataUpdate(
+            timestamp=update.timestamp,
+            version=update.version,
+            is_snapshot=True,
+            market_data=self.market_data.values(),
+            orders_data=chain(self.orders.values(), closed)
+        )
+        full_update.portfolio.cash_balance = self.cash_balance
+        full_update.portfolio.total_value = self.total_value
+        full_update.portfolio.positions.extend(self.positions.values())
+        return full_update
@@ -351,6 +351,13 @@ class SessionManager:
         # Call registered callbacks with this payload
         await self._handle_exchange_data(update_payload)
 
+    async def update_simulator_symbols(self, add_symbols, remove_symbols):
+        """Change the symbols the running simulator trades"""
+        result = await self.simulator_manager.update_symbols(add_symbols, remove_symbols)
+        if result.get('success'):
+            await self.update_session_activity()
+        return result
+
     async def stop_simulator(self, simulator_id: str, force=False):
         """Stop the current simulator"""
         # Stop via the simulator manager
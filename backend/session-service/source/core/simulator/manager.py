@@ -5,7 +5,7 @@ Simplified for single-user mode with one simulator per session.
 import logging
 import asyncio
 import time
-from typing import Optional, Tuple, Dict, Any, AsyncGenerator, Callable
+from typing import Optional, Tuple, Dict, Any, AsyncGenerator, Callable, List
 
 from opentelemetry import trace
 
@@ -44,6 +44,7 @@ class SimulatorManager:
         # Track the current simulator
         self.current_simulator_id = None
         self.current_endpoint = None
+        self.current_user_id = None
 
         # Data callback for streaming data
         self.data_callback = None
@@ -90,6 +91,7 @@ class SimulatorManager:
                 # Update our current simulator tracking
                 self.current_simulator_id = existing_simulator.simulator_id
                 self.current_endpoint = existing_simulator.endpoint
+                self.current_user_id = user_id
 
                 # Update simulator session reference if it's from another session
                 if existing_simulator.session_id != session_id:
@@ -197,6 +199,7 @@ class SimulatorManager:
 
                 # Update our current simulator tracking
                 self.current_simulator_id = simulator.simulator_id
+                self.current_user_id = user_id
                 span.set_attribute("simulator_id", simulator.simulator_id)
 
                 logger.info(f"Creating simulator {simulator.simulator_id} for session {session_id}")
@@ -288,7 +291,7 @@ class SimulatorManager:
         async def _stream_data():
             # Pass the exchange type to the exchange client
             async for standardized_data in self.exchange_client.stream_exchange_data(
-                    endpoint, session_id, client_id, exchange_type
+                    endpoint, session_id, client_id, exchange_type, user_id=self.current_user_id
             ):
                 # Generate a data ID safely without using .get()
                 if hasattr(standardized_data, 'timestamp') and hasattr(standardized_data, 'update_id'):
@@ -335,6 +338,26 @@ class SimulatorManager:
                     pass  # Ignore errors when trying to update status during an error
             raise  # Re-raise to let caller handle
 
+    async def update_symbols(self, add_symbols: List[str], remove_symbols: List[str]) -> Dict[str, Any]:
+        """
+        Change the symbols the current simulator trades
+
+        Args:
+            add_symbols: Symbols to start trading
+            remove_symbols: Symbols to stop trading
+
+        Returns:
+            Dict with success, the symbols now traded and any error
+        """
+        if not self.current_endpoint:
+            return {'success': False, 'error': 'No simulator running'}
+        if not self.exchange_client:
+            return {'success': False, 'error': 'Exchange client not available'}
+
+        return await self.exchange_client.update_symbols(
+            self.current_endpoint, add_symbols, remove_symbols, user_id=self.current_user_id
+        )
+
     async def stop_simulator(self, simulator_id: str = None, force: bool = False) -> Tuple[bool, Optional[str]]:
         """
         Stop the current simulator
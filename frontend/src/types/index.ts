@@ -24,7 +24,7 @@ export interface Order {
   symbol: string;
   side: 'BUY' | 'SELL';
   type: 'MARKET' | 'LIMIT';
-  status: 'NEW' | 'PARTIALLY_FILLED' | 'FILLED' | 'CANCELED' | 'REJECTED'; // Align with your backend statuses
+  status: 'NEW' | 'PARTIALLY_FILLED' | 'FILLED' | 'CANCELED' | 'REJECTED' | 'EXPIRED'; // Align with your backend statuses
   quantity: number;
   filledQuantity: number;
   remainingQuantity: number;
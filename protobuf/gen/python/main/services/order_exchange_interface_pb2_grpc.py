@@ -24,6 +24,16 @@ class OrderExchangeSimulatorStub(object):
                 request_serializer=main_dot_services_dot_order__exchange__interface__pb2.BatchCancelRequest.SerializeToString,
                 response_deserializer=main_dot_services_dot_order__exchange__interface__pb2.BatchCancelResponse.FromString,
                 )
+        self.AmendOrders = channel.unary_unary(
+                '/order_exchange.OrderExchangeSimulator/AmendOrders',
+                request_serializer=main_dot_services_dot_order__exchange__interface__pb2.BatchAmendRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_order__exchange__interface__pb2.BatchAmendResponse.FromString,
+                )
+        self.StreamFills = channel.unary_stream(
+                '/order_exchange.OrderExchangeSimulator/StreamFills',
+                request_serializer=main_dot_services_dot_order__exchange__interface__pb2.FillStreamRequest.SerializeToString,
+                response_deserializer=main_dot_services_dot_order__exchange__interface__pb2.FillEvent.FromString,
+                )
 
 
 class OrderExchangeSimulatorServicer(object):
@@ -43,6 +53,20 @@ class OrderExchangeSimulatorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AmendOrders(self, request, context):
+        """Amend open orders in place
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamFills(self, request, context):
+        """Stream individual executions as they happen
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OrderExchangeSimulatorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -56,6 +80,16 @@ def add_OrderExchangeSimulatorServicer_to_server(servicer, server):
                     request_deserializer=main_dot_services_dot_order__exchange__interface__pb2.BatchCancelRequest.FromString,
                     response_serializer=main_dot_services_dot_order__exchange__interface__pb2.BatchCancelResponse.SerializeToString,
             ),
+            'AmendOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.AmendOrders,
+                    request_deserializer=main_dot_services_dot_order__exchange__interface__pb2.BatchAmendRequest.FromString,
+                    response_serializer=main_dot_services_dot_order__exchange__interface__pb2.BatchAmendResponse.SerializeToString,
+            ),
+            'StreamFills': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamFills,
+                    request_deserializer=main_dot_services_dot_order__exchange__interface__pb2.FillStreamRequest.FromString,
+                    response_serializer=main_dot_services_dot_order__exchange__interface__pb2.FillEvent.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'order_exchange.OrderExchangeSimulator', rpc_method_handlers)
@@ -99,3 +133,37 @@ class OrderExchangeSimulator(object):
             main_dot_services_dot_order__exchange__interface__pb2.BatchCancelResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AmendOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_exchange.OrderExchangeSimulator/AmendOrders',
+            main_dot_services_dot_order__exchange__interface__pb2.BatchAmendRequest.SerializeToString,
+            main_dot_services_dot_order__exchange__interface__pb2.BatchAmendResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamFills(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/order_exchange.OrderExchangeSimulator/StreamFills',
+            main_dot_services_dot_order__exchange__interface__pb2.FillStreamRequest.SerializeToString,
+            main_dot_services_dot_order__exchange__interface__pb2.FillEvent.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -12,7 +12,7 @@ import type { Message } from "@bufbuild/protobuf";
  * Describes the file main/services/market_exchange_interface.proto.
  */
 export const file_main_services_market_exchange_interface: GenFile = /*@__PURE__*/
-  fileDesc("Ci1tYWluL3NlcnZpY2VzL21hcmtldF9leGNoYW5nZV9pbnRlcmZhY2UucHJvdG8SC21hcmtldF9kYXRhIj0KE1N1YnNjcmlwdGlvblJlcXVlc3QSFQoNc3Vic2NyaWJlcl9pZBgBIAEoCRIPCgdzeW1ib2xzGAIgAygJIkwKEE1hcmtldERhdGFVcGRhdGUSEQoJdGltZXN0YW1wGAEgASgDEiUKBGRhdGEYAiADKAsyFy5tYXJrZXRfZGF0YS5TeW1ib2xEYXRhIocBCgpTeW1ib2xEYXRhEg4KBnN5bWJvbBgBIAEoCRIMCgRvcGVuGAIgASgBEgwKBGhpZ2gYAyABKAESCwoDbG93GAQgASgBEg0KBWNsb3NlGAUgASgBEg4KBnZvbHVtZRgGIAEoBRITCgt0cmFkZV9jb3VudBgHIAEoBRIMCgR2d2FwGAggASgBMm0KEU1hcmtldERhdGFTZXJ2aWNlElgKE1N1YnNjcmliZU1hcmtldERhdGESIC5tYXJrZXRfZGF0YS5TdWJzY3JpcHRpb25SZXF1ZXN0Gh0ubWFya2V0X2RhdGEuTWFya2V0RGF0YVVwZGF0ZTABQncKD2NvbS5tYXJrZXRfZGF0YUIcTWFya2V0RXhjaGFuZ2VJbnRlcmZhY2VQcm90b1ABogIDTVhYqgIKTWFya2V0RGF0YcoCCk1hcmtldERhdGHiAhZNYXJrZXREYXRhXEdQQk1ldGFkYXRh6gIKTWFya2V0RGF0YWIGcHJvdG8z");
+  fileDesc("Ci1tYWluL3NlcnZpY2VzL21hcmtldF9leGNoYW5nZV9pbnRlcmZhY2UucHJvdG8SC21hcmtldF9kYXRhImUKE1N1YnNjcmlwdGlvblJlcXVlc3QSFQoNc3Vic2NyaWJlcl9pZBgBIAEoCRIPCgdzeW1ib2xzGAIgAygJEhUKDWZyb21fc2VxdWVuY2UYAyABKAMSDwoHZmVlZF9pZBgEIAEoCSJYChJTdWJzY3JpcHRpb25VcGRhdGUSFQoNc3Vic2NyaWJlcl9pZBgBIAEoCRITCgthZGRfc3ltYm9scxgCIAMoCRIWCg5yZW1vdmVfc3ltYm9scxgDIAMoCSJ8ChpTdWJzY3JpcHRpb25VcGRhdGVSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhUKDWVycm9yX21lc3NhZ2UYAiABKAkSDwoHc3ltYm9scxgDIAMoCRIlCgRkYXRhGAQgAygLMhcubWFya2V0X2RhdGEuU3ltYm9sRGF0YSJlCg9CYWNrZmlsbFJlcXVlc3QSFQoNc3Vic2NyaWJlcl9pZBgBIAEoCRIPCgdmZWVkX2lkGAIgASgJEhUKDWZyb21fc2VxdWVuY2UYAyABKAMSEwoLdG9fc2VxdWVuY2UYBCABKAMiawoQQmFja2ZpbGxSZXNwb25zZRIPCgdmZWVkX2lkGAEgASgJEhYKDmZpcnN0X3NlcXVlbmNlGAIgASgDEi4KB3VwZGF0ZXMYAyADKAsyHS5tYXJrZXRfZGF0YS5NYXJrZXREYXRhVXBkYXRlIm8KEE1hcmtldERhdGFVcGRhdGUSEQoJdGltZXN0YW1wGAEgASgDEiUKBGRhdGEYAiADKAsyFy5tYXJrZXRfZGF0YS5TeW1ib2xEYXRhEhAKCHNlcXVlbmNlGAMgASgDEg8KB2ZlZWRfaWQYBCABKAkihwEKClN5bWJvbERhdGESDgoGc3ltYm9sGAEgASgJEgwKBG9wZW4YAiABKAESDAoEaGlnaBgDIAEoARILCgNsb3cYBCABKAESDQoFY2xvc2UYBSABKAESDgoGdm9sdW1lGAYgASgFEhMKC3RyYWRlX2NvdW50GAcgASgFEgwKBHZ3YXAYCCABKAEyoAIKEU1hcmtldERhdGFTZXJ2aWNlElgKE1N1YnNjcmliZU1hcmtldERhdGESIC5tYXJrZXRfZGF0YS5TdWJzY3JpcHRpb25SZXF1ZXN0Gh0ubWFya2V0X2RhdGEuTWFya2V0RGF0YVVwZGF0ZTABElEKEkJhY2tmaWxsTWFya2V0RGF0YRIcLm1hcmtldF9kYXRhLkJhY2tmaWxsUmVxdWVzdBodLm1hcmtldF9kYXRhLkJhY2tmaWxsUmVzcG9uc2USXgoSVXBkYXRlU3Vic2NyaXB0aW9uEh8ubWFya2V0X2RhdGEuU3Vic2NyaXB0aW9uVXBkYXRlGicubWFya2V0X2RhdGEuU3Vic2NyaXB0aW9uVXBkYXRlUmVzcG9uc2VCdwoPY29tLm1hcmtldF9kYXRhQhxNYXJrZXRFeGNoYW5nZUludGVyZmFjZVByb3RvUAGiAgNNWFiqAgpNYXJrZXREYXRhygIKTWFya2V0RGF0YeICFk1hcmtldERhdGFcR1BCTWV0YWRhdGHqAgpNYXJrZXREYXRhYgZwcm90bzM");
 
 /**
  * Request to subscribe to market data
@@ -29,6 +29,20 @@ export type SubscriptionRequest = Message<"market_data.SubscriptionRequest"> & {
    * @generated from field: repeated string symbols = 2;
    */
   symbols: string[];
+
+  /**
+   * Resume after this sequence instead of starting from a snapshot (0 = snapshot)
+   *
+   * @generated from field: int64 from_sequence = 3;
+   */
+  fromSequence: bigint;
+
+  /**
+   * Feed the sequence belongs to; a different feed means the service restarted
+   *
+   * @generated from field: string feed_id = 4;
+   */
+  feedId: string;
 };
 
 /**
@@ -38,6 +52,134 @@ export type SubscriptionRequest = Message<"market_data.SubscriptionRequest"> & {
 export const SubscriptionRequestSchema: GenMessage<SubscriptionRequest> = /*@__PURE__*/
   messageDesc(file_main_services_market_exchange_interface, 0);
 
+/**
+ * Change to the symbols an open subscription receives
+ *
+ * @generated from message market_data.SubscriptionUpdate
+ */
+export type SubscriptionUpdate = Message<"market_data.SubscriptionUpdate"> & {
+  /**
+   * @generated from field: string subscriber_id = 1;
+   */
+  subscriberId: string;
+
+  /**
+   * @generated from field: repeated string add_symbols = 2;
+   */
+  addSymbols: string[];
+
+  /**
+   * @generated from field: repeated string remove_symbols = 3;
+   */
+  removeSymbols: string[];
+};
+
+/**
+ * Describes the message market_data.SubscriptionUpdate.
+ * Use `create(SubscriptionUpdateSchema)` to create a new message.
+ */
+export const SubscriptionUpdateSchema: GenMessage<SubscriptionUpdate> = /*@__PURE__*/
+  messageDesc(file_main_services_market_exchange_interface, 1);
+
+/**
+ * @generated from message market_data.SubscriptionUpdateResponse
+ */
+export type SubscriptionUpdateResponse = Message<"market_data.SubscriptionUpdateResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 2;
+   */
+  errorMessage: string;
+
+  /**
+   * Symbols the subscription now receives
+   *
+   * @generated from field: repeated string symbols = 3;
+   */
+  symbols: string[];
+
+  /**
+   * Latest bar of each added symbol, so the subscriber has prices before the next update
+   *
+   * @generated from field: repeated market_data.SymbolData data = 4;
+   */
+  data: SymbolData[];
+};
+
+/**
+ * Describes the message market_data.SubscriptionUpdateResponse.
+ * Use `create(SubscriptionUpdateResponseSchema)` to create a new message.
+ */
+export const SubscriptionUpdateResponseSchema: GenMessage<SubscriptionUpdateResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_market_exchange_interface, 2);
+
+/**
+ * Request for the updates in (from_sequence, to_sequence]
+ *
+ * @generated from message market_data.BackfillRequest
+ */
+export type BackfillRequest = Message<"market_data.BackfillRequest"> & {
+  /**
+   * @generated from field: string subscriber_id = 1;
+   */
+  subscriberId: string;
+
+  /**
+   * @generated from field: string feed_id = 2;
+   */
+  feedId: string;
+
+  /**
+   * @generated from field: int64 from_sequence = 3;
+   */
+  fromSequence: bigint;
+
+  /**
+   * @generated from field: int64 to_sequence = 4;
+   */
+  toSequence: bigint;
+};
+
+/**
+ * Describes the message market_data.BackfillRequest.
+ * Use `create(BackfillRequestSchema)` to create a new message.
+ */
+export const BackfillRequestSchema: GenMessage<BackfillRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_market_exchange_interface, 3);
+
+/**
+ * @generated from message market_data.BackfillResponse
+ */
+export type BackfillResponse = Message<"market_data.BackfillResponse"> & {
+  /**
+   * @generated from field: string feed_id = 1;
+   */
+  feedId: string;
+
+  /**
+   * Oldest sequence still retained by the service
+   *
+   * @generated from field: int64 first_sequence = 2;
+   */
+  firstSequence: bigint;
+
+  /**
+   * @generated from field: repeated market_data.MarketDataUpdate updates = 3;
+   */
+  updates: MarketDataUpdate[];
+};
+
+/**
+ * Describes the message market_data.BackfillResponse.
+ * Use `create(BackfillResponseSchema)` to create a new message.
+ */
+export const BackfillResponseSchema: GenMessage<BackfillResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_market_exchange_interface, 4);
+
 /**
  * Market data update message
  *
@@ -53,6 +195,18 @@ export type MarketDataUpdate = Message<"market_data.MarketDataUpdate"> & {
    * @generated from field: repeated market_data.SymbolData data = 2;
    */
   data: SymbolData[];
+
+  /**
+   * Monotonic per feed, starting at 1; 0 on an unsequenced snapshot
+   *
+   * @generated from field: int64 sequence = 3;
+   */
+  sequence: bigint;
+
+  /**
+   * @generated from field: string feed_id = 4;
+   */
+  feedId: string;
 };
 
 /**
@@ -60,7 +214,7 @@ export type MarketDataUpdate = Message<"market_data.MarketDataUpdate"> & {
  * Use `create(MarketDataUpdateSchema)` to create a new message.
  */
 export const MarketDataUpdateSchema: GenMessage<MarketDataUpdate> = /*@__PURE__*/
-  messageDesc(file_main_services_market_exchange_interface, 1);
+  messageDesc(file_main_services_market_exchange_interface, 5);
 
 /**
  * Data for a single symbol - minute bars
@@ -114,7 +268,7 @@ export type SymbolData = Message<"market_data.SymbolData"> & {
  * Use `create(SymbolDataSchema)` to create a new message.
  */
 export const SymbolDataSchema: GenMessage<SymbolData> = /*@__PURE__*/
-  messageDesc(file_main_services_market_exchange_interface, 2);
+  messageDesc(file_main_services_market_exchange_interface, 6);
 
 /**
  * Market data service definition
@@ -132,6 +286,26 @@ export const MarketDataService: GenService<{
     input: typeof SubscriptionRequestSchema;
     output: typeof MarketDataUpdateSchema;
   },
+  /**
+   * Re-send retained updates a subscriber missed
+   *
+   * @generated from rpc market_data.MarketDataService.BackfillMarketData
+   */
+  backfillMarketData: {
+    methodKind: "unary";
+    input: typeof BackfillRequestSchema;
+    output: typeof BackfillResponseSchema;
+  },
+  /**
+   * Add or remove symbols on a subscriber's open stream
+   *
+   * @generated from rpc market_data.MarketDataService.UpdateSubscription
+   */
+  updateSubscription: {
+    methodKind: "unary";
+    input: typeof SubscriptionUpdateSchema;
+    output: typeof SubscriptionUpdateResponseSchema;
+  },
 }> = /*@__PURE__*/
   serviceDesc(file_main_services_market_exchange_interface, 0);
 
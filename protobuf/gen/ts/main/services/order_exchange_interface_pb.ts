@@ -10,7 +10,7 @@ import type { Message } from "@bufbuild/protobuf";
  * Describes the file main/services/order_exchange_interface.proto.
  */
 export const file_main_services_order_exchange_interface: GenFile = /*@__PURE__*/
-  fileDesc("CixtYWluL3NlcnZpY2VzL29yZGVyX2V4Y2hhbmdlX2ludGVyZmFjZS5wcm90bxIOb3JkZXJfZXhjaGFuZ2Ui7wEKDE9yZGVyUmVxdWVzdBIOCgZzeW1ib2wYASABKAkSLwoEc2lkZRgCIAEoDjIhLm9yZGVyX2V4Y2hhbmdlLk9yZGVyUmVxdWVzdC5TaWRlEhAKCHF1YW50aXR5GAMgASgBEg0KBXByaWNlGAQgASgBEi8KBHR5cGUYBSABKA4yIS5vcmRlcl9leGNoYW5nZS5PcmRlclJlcXVlc3QuVHlwZRISCgpyZXF1ZXN0X2lkGAYgASgJIhkKBFNpZGUSBwoDQlVZEAASCAoEU0VMTBABIh0KBFR5cGUSCgoGTUFSS0VUEAASCQoFTElNSVQQASJBChFCYXRjaE9yZGVyUmVxdWVzdBIsCgZvcmRlcnMYASADKAsyHC5vcmRlcl9leGNoYW5nZS5PcmRlclJlcXVlc3QiSQoNT3JkZXJSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhAKCG9yZGVyX2lkGAIgASgJEhUKDWVycm9yX21lc3NhZ2UYAyABKAkibAoSQmF0Y2hPcmRlclJlc3BvbnNlEg8KB3N1Y2Nlc3MYASABKAgSLgoHcmVzdWx0cxgCIAMoCzIdLm9yZGVyX2V4Y2hhbmdlLk9yZGVyUmVzcG9uc2USFQoNZXJyb3JfbWVzc2FnZRgDIAEoCSInChJCYXRjaENhbmNlbFJlcXVlc3QSEQoJb3JkZXJfaWRzGAEgAygJIkgKDENhbmNlbFJlc3VsdBIQCghvcmRlcl9pZBgBIAEoCRIPCgdzdWNjZXNzGAIgASgIEhUKDWVycm9yX21lc3NhZ2UYAyABKAkibAoTQmF0Y2hDYW5jZWxSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEi0KB3Jlc3VsdHMYAiADKAsyHC5vcmRlcl9leGNoYW5nZS5DYW5jZWxSZXN1bHQSFQoNZXJyb3JfbWVzc2FnZRgDIAEoCTLIAQoWT3JkZXJFeGNoYW5nZVNpbXVsYXRvchJVCgxTdWJtaXRPcmRlcnMSIS5vcmRlcl9leGNoYW5nZS5CYXRjaE9yZGVyUmVxdWVzdBoiLm9yZGVyX2V4Y2hhbmdlLkJhdGNoT3JkZXJSZXNwb25zZRJXCgxDYW5jZWxPcmRlcnMSIi5vcmRlcl9leGNoYW5nZS5CYXRjaENhbmNlbFJlcXVlc3QaIy5vcmRlcl9leGNoYW5nZS5CYXRjaENhbmNlbFJlc3BvbnNlQoUBChJjb20ub3JkZXJfZXhjaGFuZ2VCG09yZGVyRXhjaGFuZ2VJbnRlcmZhY2VQcm90b1ABogIDT1hYqgINT3JkZXJFeGNoYW5nZcoCDU9yZGVyRXhjaGFuZ2XiAhlPcmRlckV4Y2hhbmdlXEdQQk1ldGFkYXRh6gINT3JkZXJFeGNoYW5nZWIGcHJvdG8z");
+  fileDesc("CixtYWluL3NlcnZpY2VzL29yZGVyX2V4Y2hhbmdlX2ludGVyZmFjZS5wcm90bxIOb3JkZXJfZXhjaGFuZ2Ui2AMKDE9yZGVyUmVxdWVzdBIOCgZzeW1ib2wYASABKAkSLwoEc2lkZRgCIAEoDjIhLm9yZGVyX2V4Y2hhbmdlLk9yZGVyUmVxdWVzdC5TaWRlEhAKCHF1YW50aXR5GAMgASgBEg0KBXByaWNlGAQgASgBEi8KBHR5cGUYBSABKA4yIS5vcmRlcl9leGNoYW5nZS5PcmRlclJlcXVlc3QuVHlwZRISCgpyZXF1ZXN0X2lkGAYgASgJEhIKCnN0b3BfcHJpY2UYByABKAESFAoMdHJhaWxfYW1vdW50GAggASgBEj8KDXRpbWVfaW5fZm9yY2UYCSABKA4yKC5vcmRlcl9leGNoYW5nZS5PcmRlclJlcXVlc3QuVGltZUluRm9yY2USEwoLZXhwaXJlX3RpbWUYCiABKAMiGQoEU2lkZRIHCgNCVVkQABIICgRTRUxMEAEiSgoEVHlwZRIKCgZNQVJLRVQQABIJCgVMSU1JVBABEggKBFNUT1AQAhIOCgpTVE9QX0xJTUlUEAMSEQoNVFJBSUxJTkdfU1RPUBAEIjoKC1RpbWVJbkZvcmNlEgcKA0dUQxAAEgcKA0RBWRABEgcKA0lPQxACEgcKA0ZPSxADEgcKA0dURBAEIkEKEUJhdGNoT3JkZXJSZXF1ZXN0EiwKBm9yZGVycxgBIAMoCzIcLm9yZGVyX2V4Y2hhbmdlLk9yZGVyUmVxdWVzdCJJCg1PcmRlclJlc3BvbnNlEg8KB3N1Y2Nlc3MYASABKAgSEAoIb3JkZXJfaWQYAiABKAkSFQoNZXJyb3JfbWVzc2FnZRgDIAEoCSJsChJCYXRjaE9yZGVyUmVzcG9uc2USDwoHc3VjY2VzcxgBIAEoCBIuCgdyZXN1bHRzGAIgAygLMh0ub3JkZXJfZXhjaGFuZ2UuT3JkZXJSZXNwb25zZRIVCg1lcnJvcl9tZXNzYWdlGAMgASgJIicKEkJhdGNoQ2FuY2VsUmVxdWVzdBIRCglvcmRlcl9pZHMYASADKAkiSAoMQ2FuY2VsUmVzdWx0EhAKCG9yZGVyX2lkGAEgASgJEg8KB3N1Y2Nlc3MYAiABKAgSFQoNZXJyb3JfbWVzc2FnZRgDIAEoCSJsChNCYXRjaENhbmNlbFJlc3BvbnNlEg8KB3N1Y2Nlc3MYASABKAgSLQoHcmVzdWx0cxgCIAMoCzIcLm9yZGVyX2V4Y2hhbmdlLkNhbmNlbFJlc3VsdBIVCg1lcnJvcl9tZXNzYWdlGAMgASgJIlUKDEFtZW5kUmVxdWVzdBIQCghvcmRlcl9pZBgBIAEoCRIQCghxdWFudGl0eRgCIAEoARINCgVwcmljZRgDIAEoARISCgpzdG9wX3ByaWNlGAQgASgBIkEKEUJhdGNoQW1lbmRSZXF1ZXN0EiwKBmFtZW5kcxgBIAMoCzIcLm9yZGVyX2V4Y2hhbmdlLkFtZW5kUmVxdWVzdCJHCgtBbWVuZFJlc3VsdBIQCghvcmRlcl9pZBgBIAEoCRIPCgdzdWNjZXNzGAIgASgIEhUKDWVycm9yX21lc3NhZ2UYAyABKAkiagoSQmF0Y2hBbWVuZFJlc3BvbnNlEg8KB3N1Y2Nlc3MYASABKAgSLAoHcmVzdWx0cxgCIAMoCzIbLm9yZGVyX2V4Y2hhbmdlLkFtZW5kUmVzdWx0EhUKDWVycm9yX21lc3NhZ2UYAyABKAkiUAoRRmlsbFN0cmVhbVJlcXVlc3QSEQoJY2xpZW50X2lkGAEgASgJEhUKDWZyb21fc2VxdWVuY2UYAiABKAMSEQoJc3RyZWFtX2lkGAMgASgJItMBCglGaWxsRXZlbnQSEAoIc2VxdWVuY2UYASABKAMSEAoIb3JkZXJfaWQYAiABKAkSDgoGc3ltYm9sGAMgASgJEi8KBHNpZGUYBCABKA4yIS5vcmRlcl9leGNoYW5nZS5PcmRlclJlcXVlc3QuU2lkZRIQCghxdWFudGl0eRgFIAEoARINCgVwcmljZRgGIAEoARIaChJyZW1haW5pbmdfcXVhbnRpdHkYByABKAESEQoJdGltZXN0YW1wGAggASgDEhEKCXN0cmVhbV9pZBgJIAEoCTLtAgoWT3JkZXJFeGNoYW5nZVNpbXVsYXRvchJVCgxTdWJtaXRPcmRlcnMSIS5vcmRlcl9leGNoYW5nZS5CYXRjaE9yZGVyUmVxdWVzdBoiLm9yZGVyX2V4Y2hhbmdlLkJhdGNoT3JkZXJSZXNwb25zZRJXCgxDYW5jZWxPcmRlcnMSIi5vcmRlcl9leGNoYW5nZS5CYXRjaENhbmNlbFJlcXVlc3QaIy5vcmRlcl9leGNoYW5nZS5CYXRjaENhbmNlbFJlc3BvbnNlElQKC0FtZW5kT3JkZXJzEiEub3JkZXJfZXhjaGFuZ2UuQmF0Y2hBbWVuZFJlcXVlc3QaIi5vcmRlcl9leGNoYW5nZS5CYXRjaEFtZW5kUmVzcG9uc2USTQoLU3RyZWFtRmlsbHMSIS5vcmRlcl9leGNoYW5nZS5GaWxsU3RyZWFtUmVxdWVzdBoZLm9yZGVyX2V4Y2hhbmdlLkZpbGxFdmVudDABQoUBChJjb20ub3JkZXJfZXhjaGFuZ2VCG09yZGVyRXhjaGFuZ2VJbnRlcmZhY2VQcm90b1ABogIDT1hYqgINT3JkZXJFeGNoYW5nZcoCDU9yZGVyRXhjaGFuZ2XiAhlPcmRlckV4Y2hhbmdlXEdQQk1ldGFkYXRh6gINT3JkZXJFeGNoYW5nZWIGcHJvdG8z");
 
 /**
  * @generated from message order_exchange.OrderRequest
@@ -45,6 +45,28 @@ export type OrderRequest = Message<"order_exchange.OrderRequest"> & {
    * @generated from field: string request_id = 6;
    */
   requestId: string;
+
+  /**
+   * @generated from field: double stop_price = 7;
+   */
+  stopPrice: number;
+
+  /**
+   * @generated from field: double trail_amount = 8;
+   */
+  trailAmount: number;
+
+  /**
+   * @generated from field: order_exchange.OrderRequest.TimeInForce time_in_force = 9;
+   */
+  timeInForce: OrderRequest_TimeInForce;
+
+  /**
+   * Expiry of a GTD order (epoch ms)
+   *
+   * @generated from field: int64 expire_time = 10;
+   */
+  expireTime: bigint;
 };
 
 /**
@@ -88,6 +110,27 @@ export enum OrderRequest_Type {
    * @generated from enum value: LIMIT = 1;
    */
   LIMIT = 1,
+
+  /**
+   * Becomes a market order once the price reaches stop_price
+   *
+   * @generated from enum value: STOP = 2;
+   */
+  STOP = 2,
+
+  /**
+   * Becomes a limit order at price once the price reaches stop_price
+   *
+   * @generated from enum value: STOP_LIMIT = 3;
+   */
+  STOP_LIMIT = 3,
+
+  /**
+   * A stop that follows the best price since entry at a distance of trail_amount
+   *
+   * @generated from enum value: TRAILING_STOP = 4;
+   */
+  TRAILING_STOP = 4,
 }
 
 /**
@@ -96,6 +139,52 @@ export enum OrderRequest_Type {
 export const OrderRequest_TypeSchema: GenEnum<OrderRequest_Type> = /*@__PURE__*/
   enumDesc(file_main_services_order_exchange_interface, 0, 1);
 
+/**
+ * @generated from enum order_exchange.OrderRequest.TimeInForce
+ */
+export enum OrderRequest_TimeInForce {
+  /**
+   * Works until filled or canceled
+   *
+   * @generated from enum value: GTC = 0;
+   */
+  GTC = 0,
+
+  /**
+   * Expires at the end of the trading day
+   *
+   * @generated from enum value: DAY = 1;
+   */
+  DAY = 1,
+
+  /**
+   * Fills what it can immediately; the rest expires
+   *
+   * @generated from enum value: IOC = 2;
+   */
+  IOC = 2,
+
+  /**
+   * Fills in full immediately or expires without filling
+   *
+   * @generated from enum value: FOK = 3;
+   */
+  FOK = 3,
+
+  /**
+   * Expires at expire_time
+   *
+   * @generated from enum value: GTD = 4;
+   */
+  GTD = 4,
+}
+
+/**
+ * Describes the enum order_exchange.OrderRequest.TimeInForce.
+ */
+export const OrderRequest_TimeInForceSchema: GenEnum<OrderRequest_TimeInForce> = /*@__PURE__*/
+  enumDesc(file_main_services_order_exchange_interface, 0, 2);
+
 /**
  * @generated from message order_exchange.BatchOrderRequest
  */
@@ -238,6 +327,210 @@ export type BatchCancelResponse = Message<"order_exchange.BatchCancelResponse">
 export const BatchCancelResponseSchema: GenMessage<BatchCancelResponse> = /*@__PURE__*/
   messageDesc(file_main_services_order_exchange_interface, 6);
 
+/**
+ * @generated from message order_exchange.AmendRequest
+ */
+export type AmendRequest = Message<"order_exchange.AmendRequest"> & {
+  /**
+   * @generated from field: string order_id = 1;
+   */
+  orderId: string;
+
+  /**
+   * New total quantity, including what has already filled; 0 leaves it unchanged
+   *
+   * @generated from field: double quantity = 2;
+   */
+  quantity: number;
+
+  /**
+   * New limit price; 0 leaves it unchanged
+   *
+   * @generated from field: double price = 3;
+   */
+  price: number;
+
+  /**
+   * New stop price of a stop or stop-limit order that has not triggered; 0 leaves it unchanged
+   *
+   * @generated from field: double stop_price = 4;
+   */
+  stopPrice: number;
+};
+
+/**
+ * Describes the message order_exchange.AmendRequest.
+ * Use `create(AmendRequestSchema)` to create a new message.
+ */
+export const AmendRequestSchema: GenMessage<AmendRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 7);
+
+/**
+ * @generated from message order_exchange.BatchAmendRequest
+ */
+export type BatchAmendRequest = Message<"order_exchange.BatchAmendRequest"> & {
+  /**
+   * @generated from field: repeated order_exchange.AmendRequest amends = 1;
+   */
+  amends: AmendRequest[];
+};
+
+/**
+ * Describes the message order_exchange.BatchAmendRequest.
+ * Use `create(BatchAmendRequestSchema)` to create a new message.
+ */
+export const BatchAmendRequestSchema: GenMessage<BatchAmendRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 8);
+
+/**
+ * @generated from message order_exchange.AmendResult
+ */
+export type AmendResult = Message<"order_exchange.AmendResult"> & {
+  /**
+   * @generated from field: string order_id = 1;
+   */
+  orderId: string;
+
+  /**
+   * @generated from field: bool success = 2;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 3;
+   */
+  errorMessage: string;
+};
+
+/**
+ * Describes the message order_exchange.AmendResult.
+ * Use `create(AmendResultSchema)` to create a new message.
+ */
+export const AmendResultSchema: GenMessage<AmendResult> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 9);
+
+/**
+ * @generated from message order_exchange.BatchAmendResponse
+ */
+export type BatchAmendResponse = Message<"order_exchange.BatchAmendResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: repeated order_exchange.AmendResult results = 2;
+   */
+  results: AmendResult[];
+
+  /**
+   * @generated from field: string error_message = 3;
+   */
+  errorMessage: string;
+};
+
+/**
+ * Describes the message order_exchange.BatchAmendResponse.
+ * Use `create(BatchAmendResponseSchema)` to create a new message.
+ */
+export const BatchAmendResponseSchema: GenMessage<BatchAmendResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 10);
+
+/**
+ * @generated from message order_exchange.FillStreamRequest
+ */
+export type FillStreamRequest = Message<"order_exchange.FillStreamRequest"> & {
+  /**
+   * @generated from field: string client_id = 1;
+   */
+  clientId: string;
+
+  /**
+   * Resume after this sequence number, replaying recent fills; 0 streams new fills only
+   *
+   * @generated from field: int64 from_sequence = 2;
+   */
+  fromSequence: bigint;
+
+  /**
+   * Stream the sequence belongs to; a different one means the exchange restarted,
+   * and every fill it has retained since is replayed
+   *
+   * @generated from field: string stream_id = 3;
+   */
+  streamId: string;
+};
+
+/**
+ * Describes the message order_exchange.FillStreamRequest.
+ * Use `create(FillStreamRequestSchema)` to create a new message.
+ */
+export const FillStreamRequestSchema: GenMessage<FillStreamRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 11);
+
+/**
+ * @generated from message order_exchange.FillEvent
+ */
+export type FillEvent = Message<"order_exchange.FillEvent"> & {
+  /**
+   * Per-exchange execution sequence number, increasing by one per fill
+   *
+   * @generated from field: int64 sequence = 1;
+   */
+  sequence: bigint;
+
+  /**
+   * @generated from field: string order_id = 2;
+   */
+  orderId: string;
+
+  /**
+   * @generated from field: string symbol = 3;
+   */
+  symbol: string;
+
+  /**
+   * @generated from field: order_exchange.OrderRequest.Side side = 4;
+   */
+  side: OrderRequest_Side;
+
+  /**
+   * @generated from field: double quantity = 5;
+   */
+  quantity: number;
+
+  /**
+   * @generated from field: double price = 6;
+   */
+  price: number;
+
+  /**
+   * Quantity still open on the order after this fill
+   *
+   * @generated from field: double remaining_quantity = 7;
+   */
+  remainingQuantity: number;
+
+  /**
+   * @generated from field: int64 timestamp = 8;
+   */
+  timestamp: bigint;
+
+  /**
+   * Sequence numbers restart with each stream id
+   *
+   * @generated from field: string stream_id = 9;
+   */
+  streamId: string;
+};
+
+/**
+ * Describes the message order_exchange.FillEvent.
+ * Use `create(FillEventSchema)` to create a new message.
+ */
+export const FillEventSchema: GenMessage<FillEvent> = /*@__PURE__*/
+  messageDesc(file_main_services_order_exchange_interface, 12);
+
 /**
  * @generated from service order_exchange.OrderExchangeSimulator
  */
@@ -262,6 +555,26 @@ export const OrderExchangeSimulator: GenService<{
     input: typeof BatchCancelRequestSchema;
     output: typeof BatchCancelResponseSchema;
   },
+  /**
+   * Amend open orders in place
+   *
+   * @generated from rpc order_exchange.OrderExchangeSimulator.AmendOrders
+   */
+  amendOrders: {
+    methodKind: "unary";
+    input: typeof BatchAmendRequestSchema;
+    output: typeof BatchAmendResponseSchema;
+  },
+  /**
+   * Stream individual executions as they happen
+   *
+   * @generated from rpc order_exchange.OrderExchangeSimulator.StreamFills
+   */
+  streamFills: {
+    methodKind: "server_streaming";
+    input: typeof FillStreamRequestSchema;
+    output: typeof FillEventSchema;
+  },
 }> = /*@__PURE__*/
   serviceDesc(file_main_services_order_exchange_interface, 0);
 
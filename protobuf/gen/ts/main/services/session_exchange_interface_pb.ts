@@ -10,7 +10,7 @@ import type { Message } from "@bufbuild/protobuf";
  * Describes the file main/services/session_exchange_interface.proto.
  */
 export const file_main_services_session_exchange_interface: GenFile = /*@__PURE__*/
-  fileDesc("Ci5tYWluL3NlcnZpY2VzL3Nlc3Npb25fZXhjaGFuZ2VfaW50ZXJmYWNlLnByb3RvEhBzZXNzaW9uX2V4Y2hhbmdlIiIKDVN0cmVhbVJlcXVlc3QSEQoJY2xpZW50X2lkGAEgASgJIsIBChJFeGNoYW5nZURhdGFVcGRhdGUSEQoJdGltZXN0YW1wGAEgASgDEjEKC21hcmtldF9kYXRhGAIgAygLMhwuc2Vzc2lvbl9leGNoYW5nZS5NYXJrZXREYXRhEjAKC29yZGVyc19kYXRhGAMgAygLMhsuc2Vzc2lvbl9leGNoYW5nZS5PcmRlckRhdGESNAoJcG9ydGZvbGlvGAQgASgLMiEuc2Vzc2lvbl9leGNoYW5nZS5Qb3J0Zm9saW9TdGF0dXMihwEKCk1hcmtldERhdGESDgoGc3ltYm9sGAEgASgJEgwKBG9wZW4YAiABKAESDAoEaGlnaBgDIAEoARILCgNsb3cYBCABKAESDQoFY2xvc2UYBSABKAESDgoGdm9sdW1lGAYgASgFEhMKC3RyYWRlX2NvdW50GAcgASgFEgwKBHZ3YXAYCCABKAEibQoJT3JkZXJEYXRhEhAKCG9yZGVyX2lkGAEgASgJEg4KBnN5bWJvbBgCIAEoCRIOCgZzdGF0dXMYAyABKAkSFwoPZmlsbGVkX3F1YW50aXR5GAQgASgFEhUKDWF2ZXJhZ2VfcHJpY2UYBSABKAEiawoPUG9ydGZvbGlvU3RhdHVzEi0KCXBvc2l0aW9ucxgBIAMoCzIaLnNlc3Npb25fZXhjaGFuZ2UuUG9zaXRpb24SFAoMY2FzaF9iYWxhbmNlGAIgASgBEhMKC3RvdGFsX3ZhbHVlGAMgASgBIlgKCFBvc2l0aW9uEg4KBnN5bWJvbBgBIAEoCRIQCghxdWFudGl0eRgCIAEoBRIUCgxhdmVyYWdlX2Nvc3QYAyABKAESFAoMbWFya2V0X3ZhbHVlGAQgASgBIiwKEEhlYXJ0YmVhdFJlcXVlc3QSGAoQY2xpZW50X3RpbWVzdGFtcBgDIAEoAyI+ChFIZWFydGJlYXRSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhgKEHNlcnZlcl90aW1lc3RhbXAYAiABKAMyzwEKGFNlc3Npb25FeGNoYW5nZVNpbXVsYXRvchJdChJTdHJlYW1FeGNoYW5nZURhdGESHy5zZXNzaW9uX2V4Y2hhbmdlLlN0cmVhbVJlcXVlc3QaJC5zZXNzaW9uX2V4Y2hhbmdlLkV4Y2hhbmdlRGF0YVVwZGF0ZTABElQKCUhlYXJ0YmVhdBIiLnNlc3Npb25fZXhjaGFuZ2UuSGVhcnRiZWF0UmVxdWVzdBojLnNlc3Npb25fZXhjaGFuZ2UuSGVhcnRiZWF0UmVzcG9uc2VCkQEKFGNvbS5zZXNzaW9uX2V4Y2hhbmdlQh1TZXNzaW9uRXhjaGFuZ2VJbnRlcmZhY2VQcm90b1ABogIDU1hYqgIPU2Vzc2lvbkV4Y2hhbmdlygIPU2Vzc2lvbkV4Y2hhbmdl4gIbU2Vzc2lvbkV4Y2hhbmdlXEdQQk1ldGFkYXRh6gIPU2Vzc2lvbkV4Y2hhbmdlYgZwcm90bzM");
+  fileDesc("Ci5tYWluL3NlcnZpY2VzL3Nlc3Npb25fZXhjaGFuZ2VfaW50ZXJmYWNlLnByb3RvEhBzZXNzaW9uX2V4Y2hhbmdlIjEKDVN0cmVhbVJlcXVlc3QSEQoJY2xpZW50X2lkGAEgASgJEg0KBWRlbHRhGAIgASgIIswCChJFeGNoYW5nZURhdGFVcGRhdGUSEQoJdGltZXN0YW1wGAEgASgDEjEKC21hcmtldF9kYXRhGAIgAygLMhwuc2Vzc2lvbl9leGNoYW5nZS5NYXJrZXREYXRhEjAKC29yZGVyc19kYXRhGAMgAygLMhsuc2Vzc2lvbl9leGNoYW5nZS5PcmRlckRhdGESNAoJcG9ydGZvbGlvGAQgASgLMiEuc2Vzc2lvbl9leGNoYW5nZS5Qb3J0Zm9saW9TdGF0dXMSDwoHdmVyc2lvbhgFIAEoAxITCgtpc19zbmFwc2hvdBgGIAEoCBIUCgxiYXNlX3ZlcnNpb24YByABKAMSGQoRcmVtb3ZlZF9wb3NpdGlvbnMYCCADKAkSGAoQb3JpZ2luX3RpbWVzdGFtcBgJIAEoAxIXCg9yZW1vdmVkX3N5bWJvbHMYCiADKAkihwEKCk1hcmtldERhdGESDgoGc3ltYm9sGAEgASgJEgwKBG9wZW4YAiABKAESDAoEaGlnaBgDIAEoARILCgNsb3cYBCABKAESDQoFY2xvc2UYBSABKAESDgoGdm9sdW1lGAYgASgFEhMKC3RyYWRlX2NvdW50GAcgASgFEgwKBHZ3YXAYCCABKAEibQoJT3JkZXJEYXRhEhAKCG9yZGVyX2lkGAEgASgJEg4KBnN5bWJvbBgCIAEoCRIOCgZzdGF0dXMYAyABKAkSFwoPZmlsbGVkX3F1YW50aXR5GAQgASgFEhUKDWF2ZXJhZ2VfcHJpY2UYBSABKAEiawoPUG9ydGZvbGlvU3RhdHVzEi0KCXBvc2l0aW9ucxgBIAMoCzIaLnNlc3Npb25fZXhjaGFuZ2UuUG9zaXRpb24SFAoMY2FzaF9iYWxhbmNlGAIgASgBEhMKC3RvdGFsX3ZhbHVlGAMgASgBIlgKCFBvc2l0aW9uEg4KBnN5bWJvbBgBIAEoCRIQCghxdWFudGl0eRgCIAEoBRIUCgxhdmVyYWdlX2Nvc3QYAyABKAESFAoMbWFya2V0X3ZhbHVlGAQgASgBIkMKFFVwZGF0ZVN5bWJvbHNSZXF1ZXN0EhMKC2FkZF9zeW1ib2xzGAEgAygJEhYKDnJlbW92ZV9zeW1ib2xzGAIgAygJIlAKFVVwZGF0ZVN5bWJvbHNSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhUKDWVycm9yX21lc3NhZ2UYAiABKAkSDwoHc3ltYm9scxgDIAMoCSIVChNHZXRQb3J0Zm9saW9SZXF1ZXN0IpgBChRHZXRQb3J0Zm9saW9SZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhUKDWVycm9yX21lc3NhZ2UYAiABKAkSDwoHdmVyc2lvbhgDIAEoAxIRCgl0aW1lc3RhbXAYBCABKAMSNAoJcG9ydGZvbGlvGAUgASgLMiEuc2Vzc2lvbl9leGNoYW5nZS5Qb3J0Zm9saW9TdGF0dXMiXAoQR2V0T3JkZXJzUmVxdWVzdBIQCghzdGF0dXNlcxgBIAMoCRIPCgdzeW1ib2xzGAIgAygJEhEKCXBhZ2Vfc2l6ZRgDIAEoBRISCgpwYWdlX3Rva2VuGAQgASgJIqoBChFHZXRPcmRlcnNSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhUKDWVycm9yX21lc3NhZ2UYAiABKAkSDwoHdmVyc2lvbhgDIAEoAxIRCgl0aW1lc3RhbXAYBCABKAMSMAoLb3JkZXJzX2RhdGEYBSADKAsyGy5zZXNzaW9uX2V4Y2hhbmdlLk9yZGVyRGF0YRIXCg9uZXh0X3BhZ2VfdG9rZW4YBiABKAkiIwoQR2V0UXVvdGVzUmVxdWVzdBIPCgdzeW1ib2xzGAEgAygJIpIBChFHZXRRdW90ZXNSZXNwb25zZRIPCgdzdWNjZXNzGAEgASgIEhUKDWVycm9yX21lc3NhZ2UYAiABKAkSDwoHdmVyc2lvbhgDIAEoAxIRCgl0aW1lc3RhbXAYBCABKAMSMQoLbWFya2V0X2RhdGEYBSADKAsyHC5zZXNzaW9uX2V4Y2hhbmdlLk1hcmtldERhdGEiLAoQSGVhcnRiZWF0UmVxdWVzdBIYChBjbGllbnRfdGltZXN0YW1wGAMgASgDIj4KEUhlYXJ0YmVhdFJlc3BvbnNlEg8KB3N1Y2Nlc3MYASABKAgSGAoQc2VydmVyX3RpbWVzdGFtcBgCIAEoAzK8BAoYU2Vzc2lvbkV4Y2hhbmdlU2ltdWxhdG9yEl0KElN0cmVhbUV4Y2hhbmdlRGF0YRIfLnNlc3Npb25fZXhjaGFuZ2UuU3RyZWFtUmVxdWVzdBokLnNlc3Npb25fZXhjaGFuZ2UuRXhjaGFuZ2VEYXRhVXBkYXRlMAESVAoJSGVhcnRiZWF0EiIuc2Vzc2lvbl9leGNoYW5nZS5IZWFydGJlYXRSZXF1ZXN0GiMuc2Vzc2lvbl9leGNoYW5nZS5IZWFydGJlYXRSZXNwb25zZRJgCg1VcGRhdGVTeW1ib2xzEiYuc2Vzc2lvbl9leGNoYW5nZS5VcGRhdGVTeW1ib2xzUmVxdWVzdBonLnNlc3Npb25fZXhjaGFuZ2UuVXBkYXRlU3ltYm9sc1Jlc3BvbnNlEl0KDEdldFBvcnRmb2xpbxIlLnNlc3Npb25fZXhjaGFuZ2UuR2V0UG9ydGZvbGlvUmVxdWVzdBomLnNlc3Npb25fZXhjaGFuZ2UuR2V0UG9ydGZvbGlvUmVzcG9uc2USVAoJR2V0T3JkZXJzEiIuc2Vzc2lvbl9leGNoYW5nZS5HZXRPcmRlcnNSZXF1ZXN0GiMuc2Vzc2lvbl9leGNoYW5nZS5HZXRPcmRlcnNSZXNwb25zZRJUCglHZXRRdW90ZXMSIi5zZXNzaW9uX2V4Y2hhbmdlLkdldFF1b3Rlc1JlcXVlc3QaIy5zZXNzaW9uX2V4Y2hhbmdlLkdldFF1b3Rlc1Jlc3BvbnNlQpEBChRjb20uc2Vzc2lvbl9leGNoYW5nZUIdU2Vzc2lvbkV4Y2hhbmdlSW50ZXJmYWNlUHJvdG9QAaICA1NYWKoCD1Nlc3Npb25FeGNoYW5nZcoCD1Nlc3Npb25FeGNoYW5nZeICG1Nlc3Npb25FeGNoYW5nZVxHUEJNZXRhZGF0YeoCD1Nlc3Npb25FeGNoYW5nZWIGcHJvdG8z");
 
 /**
  * @generated from message session_exchange.StreamRequest
@@ -20,6 +20,13 @@ export type StreamRequest = Message<"session_exchange.StreamRequest"> & {
    * @generated from field: string client_id = 1;
    */
   clientId: string;
+
+  /**
+   * Send only changed entities after the initial snapshot
+   *
+   * @generated from field: bool delta = 2;
+   */
+  delta: boolean;
 };
 
 /**
@@ -52,6 +59,48 @@ export type ExchangeDataUpdate = Message<"session_exchange.ExchangeDataUpdate">
    * @generated from field: session_exchange.PortfolioStatus portfolio = 4;
    */
   portfolio?: PortfolioStatus;
+
+  /**
+   * State version this update brings the consumer to
+   *
+   * @generated from field: int64 version = 5;
+   */
+  version: bigint;
+
+  /**
+   * True when the update carries the full state rather than changes
+   *
+   * @generated from field: bool is_snapshot = 6;
+   */
+  isSnapshot: boolean;
+
+  /**
+   * Version a delta applies on top of; a mismatch means updates were missed
+   *
+   * @generated from field: int64 base_version = 7;
+   */
+  baseVersion: bigint;
+
+  /**
+   * Symbols whose positions were closed since base_version
+   *
+   * @generated from field: repeated string removed_positions = 8;
+   */
+  removedPositions: string[];
+
+  /**
+   * When the market data service published the latest bar in this state (epoch ms, 0 if none)
+   *
+   * @generated from field: int64 origin_timestamp = 9;
+   */
+  originTimestamp: bigint;
+
+  /**
+   * Symbols dropped from the simulator since base_version; forget their market data
+   *
+   * @generated from field: repeated string removed_symbols = 10;
+   */
+  removedSymbols: string[];
 };
 
 /**
@@ -209,6 +258,253 @@ export type Position = Message<"session_exchange.Position"> & {
 export const PositionSchema: GenMessage<Position> = /*@__PURE__*/
   messageDesc(file_main_services_session_exchange_interface, 5);
 
+/**
+ * @generated from message session_exchange.UpdateSymbolsRequest
+ */
+export type UpdateSymbolsRequest = Message<"session_exchange.UpdateSymbolsRequest"> & {
+  /**
+   * @generated from field: repeated string add_symbols = 1;
+   */
+  addSymbols: string[];
+
+  /**
+   * @generated from field: repeated string remove_symbols = 2;
+   */
+  removeSymbols: string[];
+};
+
+/**
+ * Describes the message session_exchange.UpdateSymbolsRequest.
+ * Use `create(UpdateSymbolsRequestSchema)` to create a new message.
+ */
+export const UpdateSymbolsRequestSchema: GenMessage<UpdateSymbolsRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 6);
+
+/**
+ * @generated from message session_exchange.UpdateSymbolsResponse
+ */
+export type UpdateSymbolsResponse = Message<"session_exchange.UpdateSymbolsResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 2;
+   */
+  errorMessage: string;
+
+  /**
+   * Symbols the simulator trades after the update
+   *
+   * @generated from field: repeated string symbols = 3;
+   */
+  symbols: string[];
+};
+
+/**
+ * Describes the message session_exchange.UpdateSymbolsResponse.
+ * Use `create(UpdateSymbolsResponseSchema)` to create a new message.
+ */
+export const UpdateSymbolsResponseSchema: GenMessage<UpdateSymbolsResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 7);
+
+/**
+ * @generated from message session_exchange.GetPortfolioRequest
+ */
+export type GetPortfolioRequest = Message<"session_exchange.GetPortfolioRequest"> & {
+};
+
+/**
+ * Describes the message session_exchange.GetPortfolioRequest.
+ * Use `create(GetPortfolioRequestSchema)` to create a new message.
+ */
+export const GetPortfolioRequestSchema: GenMessage<GetPortfolioRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 8);
+
+/**
+ * @generated from message session_exchange.GetPortfolioResponse
+ */
+export type GetPortfolioResponse = Message<"session_exchange.GetPortfolioResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 2;
+   */
+  errorMessage: string;
+
+  /**
+   * State version the response was read at, as in ExchangeDataUpdate
+   *
+   * @generated from field: int64 version = 3;
+   */
+  version: bigint;
+
+  /**
+   * @generated from field: int64 timestamp = 4;
+   */
+  timestamp: bigint;
+
+  /**
+   * @generated from field: session_exchange.PortfolioStatus portfolio = 5;
+   */
+  portfolio?: PortfolioStatus;
+};
+
+/**
+ * Describes the message session_exchange.GetPortfolioResponse.
+ * Use `create(GetPortfolioResponseSchema)` to create a new message.
+ */
+export const GetPortfolioResponseSchema: GenMessage<GetPortfolioResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 9);
+
+/**
+ * @generated from message session_exchange.GetOrdersRequest
+ */
+export type GetOrdersRequest = Message<"session_exchange.GetOrdersRequest"> & {
+  /**
+   * Only orders in these statuses (NEW, PARTIALLY_FILLED, FILLED, ...); all when empty
+   *
+   * @generated from field: repeated string statuses = 1;
+   */
+  statuses: string[];
+
+  /**
+   * Only orders for these symbols; all when empty
+   *
+   * @generated from field: repeated string symbols = 2;
+   */
+  symbols: string[];
+
+  /**
+   * Maximum orders per page; 100 when unset, at most 1000
+   *
+   * @generated from field: int32 page_size = 3;
+   */
+  pageSize: number;
+
+  /**
+   * next_page_token of the previous page; empty for the first page
+   *
+   * @generated from field: string page_token = 4;
+   */
+  pageToken: string;
+};
+
+/**
+ * Describes the message session_exchange.GetOrdersRequest.
+ * Use `create(GetOrdersRequestSchema)` to create a new message.
+ */
+export const GetOrdersRequestSchema: GenMessage<GetOrdersRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 10);
+
+/**
+ * @generated from message session_exchange.GetOrdersResponse
+ */
+export type GetOrdersResponse = Message<"session_exchange.GetOrdersResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 2;
+   */
+  errorMessage: string;
+
+  /**
+   * @generated from field: int64 version = 3;
+   */
+  version: bigint;
+
+  /**
+   * @generated from field: int64 timestamp = 4;
+   */
+  timestamp: bigint;
+
+  /**
+   * Open orders and the recently closed ones the simulator still holds, oldest first
+   *
+   * @generated from field: repeated session_exchange.OrderData orders_data = 5;
+   */
+  ordersData: OrderData[];
+
+  /**
+   * Opaque; pass back for the next page. Empty on the last page
+   *
+   * @generated from field: string next_page_token = 6;
+   */
+  nextPageToken: string;
+};
+
+/**
+ * Describes the message session_exchange.GetOrdersResponse.
+ * Use `create(GetOrdersResponseSchema)` to create a new message.
+ */
+export const GetOrdersResponseSchema: GenMessage<GetOrdersResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 11);
+
+/**
+ * @generated from message session_exchange.GetQuotesRequest
+ */
+export type GetQuotesRequest = Message<"session_exchange.GetQuotesRequest"> & {
+  /**
+   * Symbols to quote; every symbol with market data when empty
+   *
+   * @generated from field: repeated string symbols = 1;
+   */
+  symbols: string[];
+};
+
+/**
+ * Describes the message session_exchange.GetQuotesRequest.
+ * Use `create(GetQuotesRequestSchema)` to create a new message.
+ */
+export const GetQuotesRequestSchema: GenMessage<GetQuotesRequest> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 12);
+
+/**
+ * @generated from message session_exchange.GetQuotesResponse
+ */
+export type GetQuotesResponse = Message<"session_exchange.GetQuotesResponse"> & {
+  /**
+   * @generated from field: bool success = 1;
+   */
+  success: boolean;
+
+  /**
+   * @generated from field: string error_message = 2;
+   */
+  errorMessage: string;
+
+  /**
+   * @generated from field: int64 version = 3;
+   */
+  version: bigint;
+
+  /**
+   * @generated from field: int64 timestamp = 4;
+   */
+  timestamp: bigint;
+
+  /**
+   * Latest bar per symbol; symbols without one are left out
+   *
+   * @generated from field: repeated session_exchange.MarketData market_data = 5;
+   */
+  marketData: MarketData[];
+};
+
+/**
+ * Describes the message session_exchange.GetQuotesResponse.
+ * Use `create(GetQuotesResponseSchema)` to create a new message.
+ */
+export const GetQuotesResponseSchema: GenMessage<GetQuotesResponse> = /*@__PURE__*/
+  messageDesc(file_main_services_session_exchange_interface, 13);
+
 /**
  * @generated from message session_exchange.HeartbeatRequest
  */
@@ -224,7 +520,7 @@ export type HeartbeatRequest = Message<"session_exchange.HeartbeatRequest"> & {
  * Use `create(HeartbeatRequestSchema)` to create a new message.
  */
 export const HeartbeatRequestSchema: GenMessage<HeartbeatRequest> = /*@__PURE__*/
-  messageDesc(file_main_services_session_exchange_interface, 6);
+  messageDesc(file_main_services_session_exchange_interface, 14);
 
 /**
  * @generated from message session_exchange.HeartbeatResponse
@@ -246,7 +542,7 @@ export type HeartbeatResponse = Message<"session_exchange.HeartbeatResponse"> &
  * Use `create(HeartbeatResponseSchema)` to create a new message.
  */
 export const HeartbeatResponseSchema: GenMessage<HeartbeatResponse> = /*@__PURE__*/
-  messageDesc(file_main_services_session_exchange_interface, 7);
+  messageDesc(file_main_services_session_exchange_interface, 15);
 
 /**
  * @generated from service session_exchange.SessionExchangeSimulator
@@ -272,6 +568,42 @@ export const SessionExchangeSimulator: GenService<{
     input: typeof HeartbeatRequestSchema;
     output: typeof HeartbeatResponseSchema;
   },
+  /**
+   * Add or remove symbols the simulator trades and receives market data for
+   *
+   * @generated from rpc session_exchange.SessionExchangeSimulator.UpdateSymbols
+   */
+  updateSymbols: {
+    methodKind: "unary";
+    input: typeof UpdateSymbolsRequestSchema;
+    output: typeof UpdateSymbolsResponseSchema;
+  },
+  /**
+   * Point-in-time reads of the in-memory state, without opening a stream
+   *
+   * @generated from rpc session_exchange.SessionExchangeSimulator.GetPortfolio
+   */
+  getPortfolio: {
+    methodKind: "unary";
+    input: typeof GetPortfolioRequestSchema;
+    output: typeof GetPortfolioResponseSchema;
+  },
+  /**
+   * @generated from rpc session_exchange.SessionExchangeSimulator.GetOrders
+   */
+  getOrders: {
+    methodKind: "unary";
+    input: typeof GetOrdersRequestSchema;
+    output: typeof GetOrdersResponseSchema;
+  },
+  /**
+   * @generated from rpc session_exchange.SessionExchangeSimulator.GetQuotes
+   */
+  getQuotes: {
+    methodKind: "unary";
+    input: typeof GetQuotesRequestSchema;
+    output: typeof GetQuotesResponseSchema;
+  },
 }> = /*@__PURE__*/
   serviceDesc(file_main_services_session_exchange_interface, 0);
 
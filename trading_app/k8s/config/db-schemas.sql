@@ -143,6 +143,38 @@ CREATE INDEX IF NOT EXISTS idx_simulator_session_id ON simulator.instances(sessi
 CREATE INDEX IF NOT EXISTS idx_simulator_user_id ON simulator.instances(user_id);
 CREATE INDEX IF NOT EXISTS idx_simulator_status ON simulator.instances(status);
 
+-- Latest checkpoint of each exchange simulator's state (one row per user/desk)
+CREATE TABLE IF NOT EXISTS simulator.exchange_state (
+    user_id TEXT NOT NULL,
+    desk_id TEXT NOT NULL,
+    version BIGINT NOT NULL,
+    cash_balance NUMERIC(18, 8) NOT NULL,
+    positions JSONB NOT NULL DEFAULT '{}'::jsonb,
+    open_orders JSONB NOT NULL DEFAULT '[]'::jsonb,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, desk_id)
+);
+
+-- Orders the exchange simulators have closed (filled, canceled, expired or rejected), appended in batches
+CREATE TABLE IF NOT EXISTS simulator.closed_orders (
+    user_id TEXT NOT NULL,
+    desk_id TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    order_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    quantity NUMERIC(18, 8) NOT NULL,
+    price NUMERIC(18, 8),
+    filled_quantity NUMERIC(18, 8) NOT NULL,
+    average_price NUMERIC(18, 8) NOT NULL,
+    error_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    closed_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_closed_orders_user_desk ON simulator.closed_orders(user_id, desk_id, closed_at);
+
 -- Trading Schema
 CREATE SCHEMA IF NOT EXISTS trading;
 